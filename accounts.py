@@ -0,0 +1,194 @@
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
+
+from database import SessionLocal
+from models import SocialAccount
+from social_platforms import ADAPTERS
+
+# Comma-separated Fernet keys: the first encrypts, all of them decrypt (key rotation)
+ACCOUNT_ENCRYPTION_KEY = os.getenv("ACCOUNT_ENCRYPTION_KEY", "")
+# Other processes' account changes are picked up after this long
+ACCOUNT_CACHE_SECONDS = float(os.getenv("ACCOUNT_CACHE_SECONDS", "300"))
+
+logger = logging.getLogger("accounts")
+
+class CredentialCipher:
+    """Fernet encryption of account credentials
+
+    Without ACCOUNT_ENCRYPTION_KEY the key is derived from SECRET_KEY, so
+    changing SECRET_KEY then makes stored credentials unreadable.
+    """
+
+    def __init__(self, keys: str = ACCOUNT_ENCRYPTION_KEY):
+        self.keys = keys
+        self._fernet = None
+
+    def fernet(self):
+        if self._fernet is None:
+            keys = [key.strip() for key in self.keys.split(",") if key.strip()]
+            if not keys:
+                logger.warning("ACCOUNT_ENCRYPTION_KEY is not set; deriving the credential key from SECRET_KEY")
+                secret = os.getenv("SECRET_KEY", "your-secret-key-change-this")
+                keys = [base64.urlsafe_b64encode(hashlib.sha256(secret.encode()).digest())]
+            self._fernet = MultiFernet([Fernet(key) for key in keys])
+        return self._fernet
+
+    def encrypt(self, credentials: Dict[str, str]) -> str:
+        return self.fernet().encrypt(json.dumps(credentials).encode()).decode()
+
+    def decrypt(self, token: str) -> Dict[str, str]:
+        return json.loads(self.fernet().decrypt(token.encode()))
+
+@dataclass(frozen=True)
+class Account:
+    """A decrypted, enabled account; `version` changes whenever the account is edited"""
+    id: int
+    platform: str
+    name: str
+    version: datetime
+    credentials: Dict[str, str] = field(repr=False, compare=False, hash=False)
+
+def validate_account(platform: str, name: str, credentials: Dict[str, str]) -> Dict[str, str]:
+    """Check an account's fields, returning the credentials without empty values
+
+    Raises ValueError with a user-facing message when the account is invalid.
+    """
+    adapter_class = ADAPTERS.get(platform)
+    if adapter_class is None:
+        raise ValueError(f"Unknown platform: {platform}")
+    if not name or not name.strip():
+        raise ValueError("Account name is required")
+    if not isinstance(credentials, dict):
+        raise ValueError("Credentials must be a JSON object")
+    unknown = set(credentials) - set(adapter_class.credentials)
+    if unknown:
+        raise ValueError(f"Unknown {platform} credentials: {', '.join(sorted(unknown))} "
+                         f"(expected: {', '.join(adapter_class.credentials)})")
+    credentials = {key: str(value) for key, value in credentials.items() if value}
+    missing = [key for key in adapter_class.required if key not in credentials]
+    if missing:
+        raise ValueError(f"Missing {platform} credentials: {', '.join(missing)}")
+    adapter_class.validate_credentials(credentials)
+    return credentials
+
+def describe(account: SocialAccount) -> dict:
+    """An account as returned by the API, without its credentials"""
+    return {
+        "id": account.id,
+        "platform": account.platform,
+        "name": account.name,
+        "enabled": account.enabled,
+        "created_at": account.created_at.isoformat() if account.created_at else None,
+        "updated_at": account.updated_at.isoformat() if account.updated_at else None
+    }
+
+class AccountStore:
+    """Per-user accounts, decrypted once and cached in memory
+
+    Publishing reads the cache; changes made through the store invalidate
+    the user's entry at once, other processes' changes after
+    ACCOUNT_CACHE_SECONDS.
+    """
+
+    def __init__(self, cipher: CredentialCipher, ttl: float = ACCOUNT_CACHE_SECONDS):
+        self.cipher = cipher
+        self.ttl = ttl
+        self._cache: Dict[int, Tuple[float, Dict[str, List[Account]]]] = {}
+        self._lock = threading.Lock()
+
+    def _load(self, user_id: int) -> Dict[str, List[Account]]:
+        db = SessionLocal()
+        try:
+            rows = db.query(SocialAccount).filter(
+                SocialAccount.user_id == user_id, SocialAccount.enabled.is_(True)
+            ).order_by(SocialAccount.id).all()
+        finally:
+            db.close()
+
+        accounts: Dict[str, List[Account]] = {}
+        for row in rows:
+            try:
+                credentials = self.cipher.decrypt(row.credentials)
+            except InvalidToken:
+                logger.error("Credentials of account %s (%s) cannot be decrypted: wrong key", row.id, row.platform)
+                continue
+            accounts.setdefault(row.platform, []).append(Account(row.id, row.platform, row.name, row.updated_at, credentials))
+        return accounts
+
+    def _cached(self, user_id: int) -> Optional[Dict[str, List[Account]]]:
+        with self._lock:
+            entry = self._cache.get(user_id)
+        if entry and time.monotonic() - entry[0] < self.ttl:
+            return entry[1]
+        return None
+
+    def accounts(self, user_id: int) -> Dict[str, List[Account]]:
+        """The user's enabled accounts by platform"""
+        accounts = self._cached(user_id)
+        if accounts is None:
+            accounts = self._load(user_id)
+            with self._lock:
+                self._cache[user_id] = (time.monotonic(), accounts)
+        return accounts
+
+    async def accounts_async(self, user_id: int) -> Dict[str, List[Account]]:
+        """`accounts` that only leaves the event loop to query and decrypt on a cache miss"""
+        accounts = self._cached(user_id)
+        if accounts is None:
+            accounts = await asyncio.to_thread(self.accounts, user_id)
+        return accounts
+
+    def invalidate(self, user_id: int):
+        with self._lock:
+            self._cache.pop(user_id, None)
+
+    def create(self, db, user_id: int, platform: str, name: str, credentials: Dict[str, str]) -> SocialAccount:
+        credentials = validate_account(platform, name, credentials)
+        account = SocialAccount(user_id=user_id, platform=platform, name=name.strip(), credentials=self.cipher.encrypt(credentials))
+        db.add(account)
+        db.commit()
+        db.refresh(account)
+        self.invalidate(user_id)
+        return account
+
+    def update(self, db, account: SocialAccount, name: Optional[str] = None,
+               credentials: Optional[Dict[str, str]] = None, enabled: Optional[bool] = None) -> SocialAccount:
+        """Change an account; credentials given here replace the stored ones entirely"""
+        if name is not None or credentials is not None:
+            if credentials is not None:
+                current = credentials
+            else:
+                try:
+                    current = self.cipher.decrypt(account.credentials)
+                except InvalidToken:
+                    raise ValueError("The stored credentials can no longer be decrypted "
+                                     "(the encryption key changed); enter them again")
+            current = validate_account(account.platform, name if name is not None else account.name, current)
+            account.credentials = self.cipher.encrypt(current)
+            if name is not None:
+                account.name = name.strip()
+        if enabled is not None:
+            account.enabled = enabled
+        account.updated_at = datetime.utcnow()
+        db.commit()
+        db.refresh(account)
+        self.invalidate(account.user_id)
+        return account
+
+    def delete(self, db, account: SocialAccount):
+        db.delete(account)
+        db.commit()
+        self.invalidate(account.user_id)
+
+account_store = AccountStore(CredentialCipher())
@@ -0,0 +1,236 @@
+import asyncio
+import logging
+import os
+import random
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Dict, Optional
+
+from sqlalchemy import and_, or_, update
+
+from database import SessionLocal
+from models import PostLog
+from hashtag_index import hashtag_index
+from best_time import best_time_index
+from analytics_snapshots import record_snapshots
+
+METRIC_FIELDS = ['views', 'likes', 'shares', 'comments', 'clicks', 'reach', 'impressions']
+
+ANALYTICS_BATCH_SIZE = int(os.getenv("ANALYTICS_BATCH_SIZE", "200"))
+ANALYTICS_CONCURRENCY = int(os.getenv("ANALYTICS_CONCURRENCY", "20"))
+ANALYTICS_POLL_SECONDS = float(os.getenv("ANALYTICS_POLL_SECONDS", "60"))
+
+logger = logging.getLogger("analytics")
+
+# (maximum post age, refresh interval): fresh posts are polled often, old ones rarely
+REFRESH_TIERS = [
+    (timedelta(days=1), timedelta(minutes=15)),
+    (timedelta(days=7), timedelta(hours=1)),
+    (timedelta(days=30), timedelta(hours=6)),
+    (None, timedelta(days=1))
+]
+
+def simulate_analytics_data(post_id: int) -> dict:
+    """Simulate analytics data for demonstration"""
+    # In a real application, this would fetch data from social media APIs
+    base_engagement = random.randint(10, 1000)
+
+    return {
+        'views': base_engagement * random.randint(5, 20),
+        'likes': base_engagement + random.randint(0, base_engagement // 2),
+        'shares': random.randint(0, base_engagement // 4),
+        'comments': random.randint(0, base_engagement // 6),
+        'clicks': random.randint(0, base_engagement // 3),
+        'reach': base_engagement * random.randint(2, 8),
+        'impressions': base_engagement * random.randint(8, 25)
+    }
+
+def compute_engagement_rate(metrics: dict) -> float:
+    """Engagements as a percentage of reach"""
+    reach = metrics.get('reach') or 0
+    if not reach:
+        return 0
+    engagements = sum(metrics.get(field) or 0 for field in ('likes', 'shares', 'comments', 'clicks'))
+    return (engagements / max(reach, 1)) * 100
+
+class AnalyticsAdapter:
+    """Fetches the current metrics of a post on one platform"""
+
+    platform = "general"
+
+    async def fetch(self, post) -> Optional[dict]:
+        raise NotImplementedError
+
+class SimulatedAnalyticsAdapter(AnalyticsAdapter):
+    """Local stand-in until the platform analytics APIs are wired up"""
+
+    def __init__(self, platform: str):
+        self.platform = platform
+
+    async def fetch(self, post) -> Optional[dict]:
+        return simulate_analytics_data(post.id)
+
+# Platform name -> adapter; platforms without a real adapter use the simulation
+analytics_adapters: Dict[str, AnalyticsAdapter] = {}
+
+def get_analytics_adapter(platform: str) -> AnalyticsAdapter:
+    adapter = analytics_adapters.get(platform)
+    if adapter is None:
+        adapter = analytics_adapters[platform] = SimulatedAnalyticsAdapter(platform)
+    return adapter
+
+def due_filter(now: datetime):
+    """SQL condition selecting posts whose refresh interval (by age) has elapsed"""
+    conditions = []
+    newer_than = None
+    for max_age, interval in REFRESH_TIERS:
+        tier = [PostLog.created_at < now - newer_than] if newer_than else []
+        if max_age:
+            tier.append(PostLog.created_at >= now - max_age)
+        tier.append(or_(PostLog.analytics_updated_at.is_(None), PostLog.analytics_updated_at < now - interval))
+        conditions.append(and_(*tier))
+        newer_than = max_age
+    return or_(*conditions)
+
+class AnalyticsCollector:
+    """Background refresh of post metrics for every completed post
+
+    Walks due posts in id order, fetches each platform's metrics concurrently
+    through the adapters and writes a whole batch back with one bulk UPDATE.
+    """
+
+    def __init__(self, batch_size: int = ANALYTICS_BATCH_SIZE, concurrency: int = ANALYTICS_CONCURRENCY, poll_seconds: float = ANALYTICS_POLL_SECONDS):
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.poll_seconds = poll_seconds
+        self._task = None
+        # Forced per-user refreshes requested from the dashboard, by user id
+        self._user_refreshes: Dict[int, asyncio.Task] = {}
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+            logger.info("Analytics collector started")
+
+    async def stop(self):
+        tasks = list(self._user_refreshes.values())
+        if self._task:
+            tasks.append(self._task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._user_refreshes.clear()
+
+    def refresh_user(self, user_id: int) -> bool:
+        """Start a forced refresh of the user's posts in the background
+
+        Returns False without starting another when one is already running
+        for the user.
+        """
+        if user_id in self._user_refreshes:
+            return False
+        task = asyncio.create_task(self.refresh(user_id=user_id, force=True))
+        self._user_refreshes[user_id] = task
+        task.add_done_callback(lambda task: self._refresh_done(user_id, task))
+        return True
+
+    def _refresh_done(self, user_id: int, task: asyncio.Task):
+        self._user_refreshes.pop(user_id, None)
+        if task.cancelled():
+            return
+        if task.exception():
+            logger.error("Analytics refresh for user %s failed", user_id, exc_info=task.exception())
+        else:
+            logger.info("Refreshed analytics for %d posts of user %s", task.result(), user_id)
+
+    async def _loop(self):
+        while True:
+            try:
+                refreshed = await self.refresh()
+                if refreshed:
+                    logger.info("Refreshed analytics for %d posts", refreshed)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Analytics collector error")
+            await asyncio.sleep(self.poll_seconds)
+
+    async def refresh(self, user_id: Optional[int] = None, force: bool = False) -> int:
+        """Refresh due posts (or all posts with force) and return how many were updated"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        started = datetime.utcnow()
+        last_id = 0
+        refreshed = 0
+
+        while True:
+            db = SessionLocal()
+            try:
+                query = db.query(
+                    PostLog.id, PostLog.user_id, PostLog.platforms, PostLog.content, PostLog.hashtags,
+                    PostLog.created_at, PostLog.completed_at
+                ).filter(PostLog.status == "completed", PostLog.id > last_id)
+                if user_id is not None:
+                    query = query.filter(PostLog.user_id == user_id)
+                if force:
+                    # Skip posts refreshed since this run started
+                    query = query.filter(or_(PostLog.analytics_updated_at.is_(None), PostLog.analytics_updated_at < started))
+                else:
+                    query = query.filter(due_filter(datetime.utcnow()))
+                posts = query.order_by(PostLog.id).limit(self.batch_size).all()
+            finally:
+                db.close()
+
+            if not posts:
+                return refreshed
+            last_id = posts[-1].id
+
+            # Don't hold a connection while waiting on the platforms
+            metrics = await asyncio.gather(*(self._fetch_post(post, semaphore) for post in posts))
+            now = datetime.utcnow()
+            rows = [
+                {"id": post.id, **values, "engagement_rate": compute_engagement_rate(values), "analytics_updated_at": now}
+                for post, values in zip(posts, metrics)
+                if values is not None
+            ]
+            if not rows:
+                continue
+
+            db = SessionLocal()
+            try:
+                db.execute(update(PostLog), rows)
+                record_snapshots(db, rows, now)
+                db.commit()
+            finally:
+                db.close()
+
+            self._update_indexes(posts, rows)
+            refreshed += len(rows)
+
+    async def _fetch_post(self, post, semaphore: asyncio.Semaphore) -> Optional[dict]:
+        """Sum the metrics reported by each of the post's platforms"""
+        platforms = [p.strip() for p in (post.platforms or "").split(",") if p.strip()]
+
+        async def fetch(platform):
+            async with semaphore:
+                try:
+                    return await get_analytics_adapter(platform).fetch(post)
+                except Exception as e:
+                    logger.warning("Analytics fetch error for post %s on %s: %s", post.id, platform, e)
+                    return None
+
+        results = [result for result in await asyncio.gather(*(fetch(p) for p in platforms)) if result]
+        if not results:
+            return None
+        return {field: sum(result.get(field) or 0 for result in results) for field in METRIC_FIELDS}
+
+    def _update_indexes(self, posts, rows):
+        by_id = {post.id: post for post in posts}
+        for row in rows:
+            post = by_id[row["id"]]
+            updated = SimpleNamespace(
+                user_id=post.user_id, content=post.content, hashtags=post.hashtags, platforms=post.platforms,
+                created_at=post.created_at, completed_at=post.completed_at, **row
+            )
+            hashtag_index.update(updated)
+            best_time_index.update(updated)
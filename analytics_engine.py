@@ -0,0 +1,160 @@
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+COUNTER_COLUMNS = ['views', 'likes', 'shares', 'comments', 'clicks', 'reach', 'impressions']
+SCORE_COLUMNS = ['engagement_rate', 'seo_score', 'readability_score']
+
+DEFAULT_PERCENTILES = (50, 75, 90, 99)
+ROLLING_WINDOW_DAYS = 7
+
+# NULL metrics (rows created before the analytics columns existed) load as zero
+METRICS_SQL = f"""
+    SELECT id, CAST(strftime('%s', created_at) AS INTEGER), COALESCE(platforms, ''),
+           {", ".join(f"COALESCE({c}, 0)" for c in COUNTER_COLUMNS + SCORE_COLUMNS)}
+    FROM post_logs
+"""
+
+ROW_DTYPE = np.dtype(
+    [('id', np.int64), ('created_at', np.int64), ('platforms', object)]
+    + [(name, np.int64) for name in COUNTER_COLUMNS]
+    + [(name, np.float64) for name in SCORE_COLUMNS]
+)
+
+class MetricFrame:
+    """Post metrics as NumPy column arrays, loaded with one projected query
+
+    Platform strings are dictionary-encoded: platform_codes[i] indexes
+    platform_values for post i.
+    """
+
+    def __init__(self, ids: np.ndarray, created_at: np.ndarray, platform_codes: np.ndarray, platform_values: List[str], columns: Dict[str, np.ndarray]):
+        self.ids = ids
+        self.created_at = created_at
+        self.platform_codes = platform_codes
+        self.platform_values = platform_values
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+def load_metrics(db, user_id: Optional[int] = None, date_from: Optional[datetime] = None, date_to: Optional[datetime] = None) -> MetricFrame:
+    """Load the metric columns of the matching posts into a MetricFrame"""
+    conditions = []
+    params = {}
+    if user_id is not None:
+        conditions.append("user_id = :user_id")
+        params["user_id"] = user_id
+    if date_from:
+        conditions.append("created_at >= :date_from")
+        params["date_from"] = date_from.strftime('%Y-%m-%d %H:%M:%S.%f')
+    if date_to:
+        conditions.append("created_at <= :date_to")
+        params["date_to"] = date_to.strftime('%Y-%m-%d %H:%M:%S.%f')
+    sql = METRICS_SQL + (" WHERE " + " AND ".join(conditions) if conditions else "")
+
+    # Rows go straight from the driver into one structured array, skipping
+    # ORM entities and a Python-level transpose; exec_driver_sql keeps the
+    # query visible to the engine's metrics and tracing hooks
+    result = db.connection().exec_driver_sql(sql, params)
+    rows = np.fromiter(map(tuple, result), dtype=ROW_DTYPE)
+
+    lookup = {}
+    platform_codes = np.fromiter(
+        (lookup.setdefault(value, len(lookup)) for value in rows['platforms']),
+        dtype=np.int64, count=len(rows)
+    )
+
+    return MetricFrame(
+        ids=np.ascontiguousarray(rows['id']),
+        created_at=rows['created_at'].astype("datetime64[s]"),
+        platform_codes=platform_codes,
+        platform_values=list(lookup),
+        columns={name: np.ascontiguousarray(rows[name]) for name in COUNTER_COLUMNS + SCORE_COLUMNS}
+    )
+
+def totals(frame: MetricFrame) -> Dict[str, int]:
+    return {name: int(frame[name].sum()) for name in COUNTER_COLUMNS}
+
+def percentiles(values: np.ndarray, q: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, float]:
+    if not len(values):
+        return {f"p{p}": 0.0 for p in q}
+    return {f"p{p}": float(v) for p, v in zip(q, np.percentile(values, q))}
+
+def daily_totals(frame: MetricFrame, metric: str):
+    """Sum of a metric per calendar day, returning (days, totals) including empty days"""
+    if not len(frame):
+        return np.array([], dtype="datetime64[D]"), np.array([], dtype=np.float64)
+    days = frame.created_at.astype("datetime64[D]")
+    first = days.min()
+    offsets = (days - first).astype(np.int64)
+    sums = np.bincount(offsets, weights=frame[metric])
+    return first + np.arange(len(sums)), sums
+
+def rolling_average(values: np.ndarray, window: int = ROLLING_WINDOW_DAYS) -> np.ndarray:
+    """Trailing mean over the last `window` values (fewer at the start)"""
+    if not len(values):
+        return np.array([], dtype=np.float64)
+    cumulative = np.cumsum(np.insert(values.astype(np.float64), 0, 0.0))
+    ends = np.arange(1, len(values) + 1)
+    starts = np.maximum(ends - window, 0)
+    return (cumulative[ends] - cumulative[starts]) / (ends - starts)
+
+def platform_breakdown(frame: MetricFrame, metrics: Sequence[str] = ('views', 'likes', 'shares')) -> Dict[str, dict]:
+    """Post counts and metric sums per platform; multi-platform posts count for each"""
+    if not len(frame):
+        return {}
+    # Aggregate per distinct platform string first, then split the few distinct values
+    combos = frame.platform_values
+    counts = np.bincount(frame.platform_codes, minlength=len(combos))
+    sums = {name: np.bincount(frame.platform_codes, weights=frame[name], minlength=len(combos)) for name in metrics}
+
+    stats = {}
+    for index, combo in enumerate(combos):
+        for platform in combo.split(','):
+            platform = platform.strip()
+            if not platform:
+                continue
+            entry = stats.setdefault(platform, {'posts': 0, **{name: 0 for name in metrics}})
+            entry['posts'] += int(counts[index])
+            for name in metrics:
+                entry[name] += int(sums[name][index])
+    return stats
+
+def top_post_ids(frame: MetricFrame, limit: int = 5) -> List[int]:
+    """Ids of the posts with the most views + likes + shares"""
+    if not len(frame):
+        return []
+    scores = frame['views'] + frame['likes'] + frame['shares']
+    limit = min(limit, len(scores))
+    candidates = np.argpartition(-scores, limit - 1)[:limit]
+    ordered = candidates[np.argsort(-scores[candidates], kind="stable")]
+    return [int(post_id) for post_id in frame.ids[ordered]]
+
+def summarize(frame: MetricFrame, top_limit: int = 5) -> dict:
+    """Everything the analytics page shows, plus distribution and trend data"""
+    # The stored per-post rates, as written by the analytics collector
+    rates = frame['engagement_rate']
+    days, daily_views = daily_totals(frame, 'views')
+    has_posts = len(frame) > 0
+
+    return {
+        'post_count': len(frame),
+        'totals': totals(frame),
+        'avg_engagement_rate': float(rates.mean()) if has_posts else 0.0,
+        'engagement_percentiles': percentiles(rates),
+        'views_percentiles': percentiles(frame['views']),
+        'avg_seo_score': float(frame['seo_score'].mean()) if has_posts else 0.0,
+        'avg_readability': float(frame['readability_score'].mean()) if has_posts else 0.0,
+        'platform_stats': platform_breakdown(frame),
+        'top_post_ids': top_post_ids(frame, top_limit),
+        'daily_views': {
+            'days': [str(day) for day in days],
+            'views': daily_views.tolist(),
+            'rolling_average': rolling_average(daily_views).tolist()
+        }
+    }
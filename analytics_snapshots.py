@@ -0,0 +1,172 @@
+import asyncio
+import os
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import insert, text
+
+from database import SessionLocal
+from models import PostLog, PostMetricSnapshot, PostMetricRollup
+
+COUNTER_FIELDS = ['views', 'likes', 'shares', 'comments', 'clicks', 'reach', 'impressions']
+
+# Raw points are dropped once rolled up into hours, hours once rolled up into days
+RAW_RETENTION = timedelta(hours=int(os.getenv("ANALYTICS_RAW_RETENTION_HOURS", "48")))
+HOURLY_RETENTION = timedelta(days=int(os.getenv("ANALYTICS_HOURLY_RETENTION_DAYS", "90")))
+ROLLUP_INTERVAL_SECONDS = float(os.getenv("ANALYTICS_ROLLUP_INTERVAL_SECONDS", "600"))
+
+# Longest span each granularity serves before the next coarser one is used
+RAW_MAX_SPAN = timedelta(days=1)
+HOURLY_MAX_SPAN = timedelta(days=14)
+
+def sql_timestamp(value: datetime) -> str:
+    """Format a datetime the way SQLAlchemy stores DateTime columns in SQLite"""
+    return value.strftime('%Y-%m-%d %H:%M:%S.%f')
+
+def record_snapshots(db, rows: List[dict], captured_at: Optional[datetime] = None):
+    """Append raw metric points; each row needs an "id" (post id) and the counter values"""
+    if not rows:
+        return
+    captured_at = captured_at or datetime.utcnow()
+    db.execute(insert(PostMetricSnapshot), [
+        {
+            "post_id": row["id"],
+            "captured_at": captured_at,
+            "engagement_rate": row.get("engagement_rate") or 0.0,
+            **{field: row.get(field) or 0 for field in COUNTER_FIELDS}
+        }
+        for row in rows
+    ])
+
+def _rollup_sql(source: str, time_column: str, bucket_format: str, granularity: str, samples: str, engagement: str) -> str:
+    counters = ", ".join(f"MAX({field})" for field in COUNTER_FIELDS)
+    columns = ", ".join(COUNTER_FIELDS)
+    # Counters only grow, so a bucket keeps the largest value seen in it
+    updates = ", ".join(f"{field} = MAX({field}, excluded.{field})" for field in COUNTER_FIELDS)
+    return f"""
+        INSERT INTO post_metric_rollups (post_id, granularity, bucket_start, {columns}, engagement_rate, samples)
+        SELECT post_id, '{granularity}', strftime('{bucket_format}', {time_column}), {counters}, {engagement}, {samples}
+        FROM {source}
+        WHERE {time_column} >= :start AND {time_column} < :end{" AND granularity = 'hour'" if source == "post_metric_rollups" else ""}
+        GROUP BY post_id, strftime('{bucket_format}', {time_column})
+        ON CONFLICT (post_id, granularity, bucket_start) DO UPDATE SET
+            {updates},
+            engagement_rate = excluded.engagement_rate,
+            samples = excluded.samples
+    """
+
+HOURLY_ROLLUP_SQL = _rollup_sql(
+    "post_metric_snapshots", "captured_at", "%Y-%m-%d %H:00:00.000000", "hour",
+    samples="COUNT(*)", engagement="AVG(engagement_rate)"
+)
+DAILY_ROLLUP_SQL = _rollup_sql(
+    "post_metric_rollups", "bucket_start", "%Y-%m-%d 00:00:00.000000", "day",
+    samples="SUM(samples)", engagement="SUM(engagement_rate * samples) / MAX(SUM(samples), 1)"
+)
+
+def _rollup_start(db, granularity: str) -> str:
+    """Start of the newest bucket already rolled up; everything before it is done"""
+    latest = db.execute(text(
+        "SELECT MAX(bucket_start) FROM post_metric_rollups WHERE granularity = :granularity"
+    ), {"granularity": granularity}).scalar()
+    return latest or ""
+
+def run_rollups(db, now: Optional[datetime] = None) -> dict:
+    """Roll raw points into hours and hours into days, then apply retention"""
+    now = now or datetime.utcnow()
+    current_hour = now.replace(minute=0, second=0, microsecond=0)
+    current_day = current_hour.replace(hour=0)
+
+    # Only closed buckets are rolled up, resuming from the newest one already written
+    hourly = db.execute(text(HOURLY_ROLLUP_SQL), {
+        "start": _rollup_start(db, "hour"),
+        "end": sql_timestamp(current_hour)
+    }).rowcount
+    daily = db.execute(text(DAILY_ROLLUP_SQL), {
+        "start": _rollup_start(db, "day"),
+        "end": sql_timestamp(current_day)
+    }).rowcount
+
+    raw_deleted = db.execute(text(
+        "DELETE FROM post_metric_snapshots WHERE captured_at < :cutoff"
+    ), {"cutoff": sql_timestamp(min(current_hour, now - RAW_RETENTION))}).rowcount
+    hourly_deleted = db.execute(text(
+        "DELETE FROM post_metric_rollups WHERE granularity = 'hour' AND bucket_start < :cutoff"
+    ), {"cutoff": sql_timestamp(min(current_day, now - HOURLY_RETENTION))}).rowcount
+
+    db.commit()
+    return {"hourly": hourly, "daily": daily, "raw_deleted": raw_deleted, "hourly_deleted": hourly_deleted}
+
+def choose_granularity(start: datetime, end: datetime, now: Optional[datetime] = None) -> str:
+    """Coarsest granularity that still resolves the requested range"""
+    now = now or datetime.utcnow()
+    span = end - start
+    if span <= RAW_MAX_SPAN and start >= now - RAW_RETENTION:
+        return "raw"
+    if span <= HOURLY_MAX_SPAN and start >= now - HOURLY_RETENTION:
+        return "hour"
+    return "day"
+
+def get_metric_series(db, post_id: int, start: datetime, end: datetime) -> dict:
+    """Metric history of a post between start and end"""
+    granularity = choose_granularity(start, end)
+    fields = COUNTER_FIELDS + ['engagement_rate']
+
+    if granularity == "raw":
+        time_column = PostMetricSnapshot.captured_at
+        query = db.query(time_column, *(getattr(PostMetricSnapshot, f) for f in fields)).filter(
+            PostMetricSnapshot.post_id == post_id
+        )
+    else:
+        time_column = PostMetricRollup.bucket_start
+        query = db.query(time_column, *(getattr(PostMetricRollup, f) for f in fields)).filter(
+            PostMetricRollup.post_id == post_id,
+            PostMetricRollup.granularity == granularity
+        )
+
+    rows = query.filter(time_column >= start, time_column <= end).order_by(time_column).all()
+    points = [
+        {"time": row[0].isoformat(), **{field: value for field, value in zip(fields, row[1:])}}
+        for row in rows
+    ]
+
+    # Buckets still open haven't been rolled up yet; end the series with the live counters
+    if end >= datetime.utcnow() - timedelta(minutes=1):
+        post = db.query(PostLog.analytics_updated_at, *(getattr(PostLog, f) for f in fields)).filter(
+            PostLog.id == post_id
+        ).first()
+        if post and post[0] and (not points or post[0].isoformat() > points[-1]["time"]):
+            points.append({"time": post[0].isoformat(), **{field: value for field, value in zip(fields, post[1:])}})
+
+    return {"post_id": post_id, "granularity": granularity, "points": points}
+
+class RollupJob:
+    """Periodically runs the rollups and retention in the background"""
+
+    def __init__(self, interval_seconds: float = ROLLUP_INTERVAL_SECONDS):
+        self.interval_seconds = interval_seconds
+        self._task = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _loop(self):
+        while True:
+            db = SessionLocal()
+            try:
+                result = run_rollups(db)
+                if any(result.values()):
+                    print(f"🗂️ Analytics rollup: {result}")
+            except Exception as e:
+                print(f"Analytics rollup error: {e}")
+                db.rollback()
+            finally:
+                db.close()
+            await asyncio.sleep(self.interval_seconds)
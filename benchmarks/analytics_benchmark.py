@@ -0,0 +1,117 @@
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from models import PostLog, User
+from analytics_engine import load_metrics, summarize
+
+PLATFORM_CHOICES = ['telegram', 'instagram', 'twitter', 'facebook', 'linkedin', 'telegram,twitter', 'instagram,facebook,tiktok']
+
+def populate(path: str, count: int):
+    """Fill a fresh database with `count` posts owned by user 1"""
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    engine.dispose()
+
+    conn = sqlite3.connect(path)
+    conn.execute("INSERT INTO users (id, username, hashed_password, is_active) VALUES (1, 'bench', 'x', 1)")
+    start = datetime(2025, 1, 1)
+    rng = random.Random(42)
+
+    def rows():
+        for i in range(count):
+            reach = rng.randint(0, 5000)
+            yield (
+                f"Benchmark post {i} #marketing", rng.choice(PLATFORM_CHOICES), "completed",
+                (start + timedelta(minutes=i)).strftime('%Y-%m-%d %H:%M:%S.%f'), 1,
+                rng.randint(0, 20000), rng.randint(0, 2000), rng.randint(0, 500), rng.randint(0, 300),
+                rng.randint(0, 800), reach, reach * 3, rng.random() * 20, rng.random() * 100, rng.random() * 100
+            )
+
+    conn.executemany(
+        "INSERT INTO post_logs (content, platforms, status, created_at, user_id, views, likes, shares, comments, "
+        "clicks, reach, impressions, engagement_rate, seo_score, readability_score) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        rows()
+    )
+    conn.commit()
+    conn.close()
+
+def legacy_summary(db, user_id: int) -> dict:
+    """The per-object loop analytics_page used before analytics_engine"""
+    posts = db.query(PostLog).filter(PostLog.user_id == user_id).order_by(PostLog.created_at.desc()).all()
+    total_views = sum(getattr(post, 'views', 0) or 0 for post in posts)
+    total_likes = sum(getattr(post, 'likes', 0) or 0 for post in posts)
+    total_shares = sum(getattr(post, 'shares', 0) or 0 for post in posts)
+    avg_engagement_rate = sum(getattr(post, 'engagement_rate', 0) or 0 for post in posts) / len(posts) if posts else 0
+    top_posts = sorted(posts, key=lambda x: (getattr(x, 'views', 0) or 0) + (getattr(x, 'likes', 0) or 0) + (getattr(x, 'shares', 0) or 0), reverse=True)[:5]
+    platform_stats = {}
+    for post in posts:
+        for platform in (post.platforms.split(',') if post.platforms else []):
+            platform = platform.strip()
+            if platform not in platform_stats:
+                platform_stats[platform] = {'posts': 0, 'views': 0, 'likes': 0, 'shares': 0}
+            platform_stats[platform]['posts'] += 1
+            platform_stats[platform]['views'] += getattr(post, 'views', 0) or 0
+            platform_stats[platform]['likes'] += getattr(post, 'likes', 0) or 0
+            platform_stats[platform]['shares'] += getattr(post, 'shares', 0) or 0
+    return {
+        'total_views': total_views, 'total_likes': total_likes, 'total_shares': total_shares,
+        'avg_engagement_rate': avg_engagement_rate, 'top_post_ids': [post.id for post in top_posts],
+        'platform_stats': platform_stats
+    }
+
+def timed(function, *args):
+    started = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the vectorized analytics with the per-post loop")
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="Comma-separated post counts")
+    parser.add_argument("--skip-legacy-above", type=int, default=0, help="Don't time the loop above this many posts")
+    args = parser.parse_args()
+
+    results = []
+    for count in (int(size) for size in args.sizes.split(",")):
+        with tempfile.TemporaryDirectory() as workdir:
+            path = os.path.join(workdir, "bench.db")
+            populate(path, count)
+            engine = create_engine(f"sqlite:///{path}")
+            Session = sessionmaker(bind=engine)
+
+            db = Session()
+            summary, vectorized_seconds = timed(lambda: summarize(load_metrics(db, 1)))
+            db.close()
+            result = {"posts": count, "vectorized_seconds": round(vectorized_seconds, 3)}
+
+            if not args.skip_legacy_above or count <= args.skip_legacy_above:
+                db = Session()
+                legacy, legacy_seconds = timed(legacy_summary, db, 1)
+                db.close()
+                assert legacy['total_views'] == summary['totals']['views']
+                assert abs(legacy['avg_engagement_rate'] - summary['avg_engagement_rate']) < 1e-9
+                assert {p: s['views'] for p, s in legacy['platform_stats'].items()} == {p: s['views'] for p, s in summary['platform_stats'].items()}
+                result["legacy_seconds"] = round(legacy_seconds, 3)
+                result["speedup"] = round(legacy_seconds / vectorized_seconds, 1)
+
+            engine.dispose()
+            print(json.dumps(result), flush=True)
+            results.append(result)
+
+    return results
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+import argparse
+import json
+import os
+import secrets
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+
+from database import Base
+from models import PostLog, User
+from auth import get_password_hash
+
+# Weighted platform combinations, roughly what campaigns actually target
+PLATFORM_MIXES = [
+    ("telegram", 18), ("instagram", 14), ("twitter", 12), ("facebook", 9), ("linkedin", 7),
+    ("tiktok", 6), ("youtube", 3), ("reddit", 2), ("threads", 2), ("pinterest", 2),
+    ("telegram,twitter", 6), ("instagram,facebook", 6), ("instagram,tiktok", 4),
+    ("twitter,linkedin", 3), ("instagram,facebook,tiktok", 3), ("telegram,twitter,facebook,linkedin", 2),
+    ("discord,reddit", 1),
+]
+# Typical views per post on each platform (median of a log-normal)
+PLATFORM_REACH = {
+    "telegram": 900, "instagram": 2500, "twitter": 1200, "facebook": 1500, "linkedin": 700,
+    "tiktok": 6000, "youtube": 4000, "reddit": 1800, "threads": 600, "pinterest": 800, "discord": 300,
+}
+# Share of posts published at each UTC hour
+HOUR_WEIGHTS = np.array([1, 1, 1, 1, 1, 2, 3, 5, 7, 8, 8, 7, 8, 8, 7, 7, 8, 9, 9, 8, 6, 4, 3, 2], dtype=float)
+
+TOPICS = ["forex", "crypto", "trading", "marketing", "startup", "fitness", "travel", "food", "tech", "design", "ai", "finance"]
+OPENERS = [
+    "New post about", "Quick tip on", "Our thoughts on", "Weekly update:", "Big news in",
+    "Five lessons from", "Behind the scenes of", "Don't miss our take on", "Thread:", "Case study:",
+]
+BODIES = [
+    "what changed this week and why it matters for you.",
+    "the mistakes we see most often and how to avoid them.",
+    "a practical checklist you can use today.",
+    "numbers from our latest campaign, with charts.",
+    "the tools we rely on every single day.",
+    "answers to the questions you sent us.",
+]
+STATUSES = np.array(["completed", "failed", "queued"])
+STATUS_WEIGHTS = np.array([0.9, 0.07, 0.03])
+# Queued rows are due (scheduled in the past), so never generate them into the app's own database
+APP_DATABASE = os.path.abspath("dashboard.db")
+FAILURE_MESSAGES = ["Rate limit exceeded", "Invalid access token", "Media upload timed out", "HTTP 500 - upstream error"]
+
+INSERT_SQL = """
+    INSERT INTO post_logs (
+        content, platforms, file_path, file_type, scheduled_for, status, results, created_at, completed_at, user_id,
+        views, likes, shares, comments, clicks, engagement_rate, reach, impressions, analytics_updated_at,
+        seo_keywords, hashtags, seo_score, readability_score
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+def sql_time(value: datetime) -> str:
+    return value.strftime('%Y-%m-%d %H:%M:%S.%f')
+
+def ensure_users(conn: sqlite3.Connection, count: int, prefix: str) -> list:
+    """Ids of `count` synthetic users, creating the missing ones
+
+    Their password is a discarded random secret: nobody can log in as them.
+    """
+    password = get_password_hash(secrets.token_urlsafe(32))
+    conn.executemany(
+        "INSERT OR IGNORE INTO users (username, hashed_password, is_active, created_at) VALUES (?, ?, 1, ?)",
+        ((f"{prefix}_{i}", password, sql_time(datetime.utcnow())) for i in range(count))
+    )
+    names = [f"{prefix}_{i}" for i in range(count)]
+    rows = conn.execute(
+        f"SELECT id, username FROM users WHERE username IN ({','.join('?' * count)})", names
+    ).fetchall()
+    ids = dict((username, user_id) for user_id, username in rows)
+    return [ids[name] for name in names]
+
+def check_scratch(db_path: str, prefix: str):
+    """Raise ValueError unless `db_path` is new or only holds synthetic users"""
+    if os.path.abspath(db_path) == APP_DATABASE:
+        raise ValueError(f"{db_path} is the app database; generate into a scratch file")
+    if not os.path.exists(db_path):
+        return
+    conn = sqlite3.connect(db_path)
+    try:
+        has_users = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'users'").fetchone()
+        real = conn.execute(
+            "SELECT username FROM users WHERE username NOT LIKE ? ESCAPE '\\' LIMIT 1",
+            (prefix.replace("_", "\\_") + "\\_%",)
+        ).fetchone() if has_users else None
+    finally:
+        conn.close()
+    if real:
+        raise ValueError(f"{db_path} has non-synthetic users (e.g. {real[0]}); generate into a scratch file")
+
+def generate_batch(rng: np.random.Generator, size: int, user_ids: list, user_weights: np.ndarray, start: datetime, days: int,
+                   status_weights: np.ndarray = STATUS_WEIGHTS) -> list:
+    """`size` post rows; numeric columns are drawn as arrays, strings per row"""
+    mixes = [mix for mix, _ in PLATFORM_MIXES]
+    mix_weights = np.array([weight for _, weight in PLATFORM_MIXES], dtype=float)
+    mix_index = rng.choice(len(mixes), size, p=mix_weights / mix_weights.sum())
+    users = np.asarray(user_ids)[rng.choice(len(user_ids), size, p=user_weights)]
+
+    day_offsets = rng.integers(0, days, size)
+    hours = rng.choice(24, size, p=HOUR_WEIGHTS / HOUR_WEIGHTS.sum())
+    seconds = day_offsets * 86400 + hours * 3600 + rng.integers(0, 3600, size)
+    statuses = STATUSES[rng.choice(len(STATUSES), size, p=status_weights / status_weights.sum())]
+    media = rng.choice(3, size, p=[0.45, 0.4, 0.15])  # none, image, video
+
+    # Heavy-tailed views; a few posts go viral
+    base_reach = np.array([np.mean([PLATFORM_REACH.get(p, 500) for p in mix.split(",")]) for mix in mixes])[mix_index]
+    views = (rng.lognormal(0.0, 1.1, size) * base_reach * np.where(media == 2, 1.8, 1.0)).astype(np.int64)
+    reach = (views * rng.uniform(0.6, 0.95, size)).astype(np.int64)
+    impressions = (views * rng.uniform(1.1, 2.5, size)).astype(np.int64)
+    likes = rng.binomial(reach, rng.beta(2, 40, size))
+    comments = rng.binomial(reach, rng.beta(1, 250, size))
+    shares = rng.binomial(reach, rng.beta(1, 300, size))
+    clicks = rng.binomial(reach, rng.beta(1, 120, size))
+    engagement = np.zeros(size)
+    np.divide((likes + comments + shares + clicks) * 100.0, reach, out=engagement, where=reach > 0)
+    seo_scores = np.clip(rng.normal(62, 15, size), 0, 100)
+    readability = np.clip(rng.normal(70, 12, size), 0, 100)
+    topics = rng.integers(0, len(TOPICS), (size, 3))
+    openers = rng.integers(0, len(OPENERS), size)
+    bodies = rng.integers(0, len(BODIES), size)
+    hashtag_counts = rng.integers(1, 6, size)
+
+    rows = []
+    for i in range(size):
+        created = start + timedelta(seconds=int(seconds[i]))
+        status = statuses[i]
+        platforms = mixes[mix_index[i]]
+        topic = TOPICS[topics[i, 0]]
+        tags = [f"#{TOPICS[t]}" for t in dict.fromkeys(topics[i, : min(3, hashtag_counts[i])])]
+        tags += ["#growth", "#tips", "#news"][: max(0, hashtag_counts[i] - len(tags))]
+        content = f"{OPENERS[openers[i]]} {topic}: {BODIES[bodies[i]]} {' '.join(tags)}"
+        file_type = (None, "image", "video")[media[i]]
+        file_path = f"uploads/synthetic-{i}.{'jpg' if media[i] == 1 else 'mp4'}" if file_type else None
+
+        if status == "queued":
+            rows.append((
+                content, platforms, file_path, file_type, sql_time(created), status, None,
+                sql_time(created), None, int(users[i]), 0, 0, 0, 0, 0, 0.0, 0, 0, None,
+                topic, ", ".join(tags), float(seo_scores[i]), float(readability[i])
+            ))
+            continue
+
+        completed = created + timedelta(seconds=float(rng.uniform(0.5, 20)))
+        if status == "completed":
+            results = {p: {"success": True, "message": f"✅ Posted to {p}"} for p in platforms.split(",")}
+        else:
+            failed = platforms.split(",")[-1]
+            results = {p: {"success": p != failed, "message": FAILURE_MESSAGES[i % len(FAILURE_MESSAGES)] if p == failed else f"✅ Posted to {p}"} for p in platforms.split(",")}
+        has_metrics = status == "completed"
+        rows.append((
+            content, platforms, file_path, file_type, None, status, json.dumps(results),
+            sql_time(created), sql_time(completed), int(users[i]),
+            int(views[i]) if has_metrics else 0, int(likes[i]) if has_metrics else 0,
+            int(shares[i]) if has_metrics else 0, int(comments[i]) if has_metrics else 0,
+            int(clicks[i]) if has_metrics else 0, float(engagement[i]) if has_metrics else 0.0,
+            int(reach[i]) if has_metrics else 0, int(impressions[i]) if has_metrics else 0,
+            sql_time(completed + timedelta(hours=1)) if has_metrics else None,
+            topic, ", ".join(tags), float(seo_scores[i]), float(readability[i])
+        ))
+    return rows
+
+def generate(db_path: str, posts: int, users: int = 100, days: int = 365, batch_size: int = 20000, seed: int = 42,
+             user_prefix: str = "synthetic", user_ids: list = None, queued: bool = True, progress: bool = False) -> dict:
+    """Bulk-insert `posts` synthetic posts spread over `users` users (or the given user ids)
+
+    Without `user_ids` the database must be new or synthetic (see check_scratch);
+    callers passing `user_ids` own a throwaway database. `queued` posts are
+    already due, so a dispatcher running on the database publishes them.
+    """
+    if user_ids is None:
+        check_scratch(db_path, user_prefix)
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine, tables=[User.__table__, PostLog.__table__])
+    engine.dispose()
+
+    conn = sqlite3.connect(db_path)
+    # Durability is irrelevant for throwaway data; a crash just means rerunning
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute("PRAGMA journal_mode = MEMORY")
+    conn.execute("PRAGMA cache_size = -200000")
+
+    user_ids = user_ids or ensure_users(conn, users, user_prefix)
+    conn.commit()
+    # Zipf-like activity: a few heavy users own most of the posts
+    weights = 1.0 / np.arange(1, len(user_ids) + 1) ** 1.1
+    weights /= weights.sum()
+
+    status_weights = STATUS_WEIGHTS if queued else np.where(STATUSES == "queued", 0.0, STATUS_WEIGHTS)
+    rng = np.random.default_rng(seed)
+    start = datetime.utcnow().replace(microsecond=0) - timedelta(days=days)
+    started = time.perf_counter()
+    inserted = 0
+    while inserted < posts:
+        size = min(batch_size, posts - inserted)
+        conn.executemany(INSERT_SQL, generate_batch(rng, size, user_ids, weights, start, days, status_weights))
+        conn.commit()
+        inserted += size
+        if progress:
+            print(f"{inserted}/{posts} posts ({inserted / (time.perf_counter() - started):.0f}/s)", file=sys.stderr, flush=True)
+
+    conn.execute("ANALYZE")
+    conn.close()
+    elapsed = time.perf_counter() - started
+    return {"posts": inserted, "users": len(user_ids), "seconds": round(elapsed, 1), "rows_per_second": round(inserted / elapsed)}
+
+def main():
+    parser = argparse.ArgumentParser(description="Fill a SQLite database with realistic synthetic posts")
+    parser.add_argument("--db", required=True, help="Scratch SQLite database file (created if missing; never the app's dashboard.db)")
+    parser.add_argument("--posts", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--days", type=int, default=365, help="Spread posts over this many past days")
+    parser.add_argument("--batch-size", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--user-prefix", default="synthetic", help="Username prefix of the generated users")
+    args = parser.parse_args()
+
+    try:
+        result = generate(args.db, args.posts, args.users, args.days, args.batch_size, args.seed, args.user_prefix, progress=True)
+    except ValueError as e:
+        parser.error(str(e))
+    print(json.dumps(result))
+    return result
+
+if __name__ == "__main__":
+    main()
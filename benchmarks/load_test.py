@@ -0,0 +1,219 @@
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import aiohttp
+import numpy as np
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from generate_posts import generate
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ADMIN_PASSWORD = "loadtest-password"
+
+# name -> (method, path); /post payloads are built per request
+SCENARIOS = {
+    "post": ("POST", "/post"),
+    "dashboard-stats": ("GET", "/dashboard-stats"),
+    "logs": ("GET", "/api/logs"),
+    "analytics": ("GET", "/analytics"),
+}
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+async def start_mock_platform(port: int, latency: float) -> web.AppRunner:
+    """Local stand-in for the Telegram Bot API answering after `latency` seconds"""
+    counter = {"message_id": 0}
+
+    async def send(request):
+        await request.read()
+        await asyncio.sleep(latency)
+        counter["message_id"] += 1
+        return web.json_response({"ok": True, "result": {"message_id": counter["message_id"]}})
+
+    app = web.Application(client_max_size=64 * 1024 ** 2)
+    app.router.add_post("/{bot}/{method}", send)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+    return runner
+
+def start_app(workdir: str, port: int, platform_url: str) -> subprocess.Popen:
+    """Run the app under uvicorn against a fresh database in `workdir`"""
+    for name in ("static", "templates"):
+        os.symlink(os.path.join(REPO_DIR, name), os.path.join(workdir, name))
+    os.makedirs(os.path.join(workdir, "uploads"))
+
+    env = dict(
+        os.environ,
+        PYTHONPATH=REPO_DIR,
+        ADMIN_PASSWORD=ADMIN_PASSWORD,
+        TELEGRAM_BOT_TOKEN="loadtest",
+        TELEGRAM_CHAT_ID="@loadtest",
+        TELEGRAM_API_URL=platform_url,
+        PLATFORM_RATE_LIMITS="off",
+        LOG_LEVEL="WARNING",
+    )
+    # Output goes to a file: an unread pipe would stall the app once it fills
+    with open(os.path.join(workdir, "app.log"), "wb") as log:
+        return subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning", "--no-access-log"],
+            cwd=workdir, env=env, stdout=log, stderr=subprocess.STDOUT
+        )
+
+async def wait_until_ready(base_url: str, process: subprocess.Popen, workdir: str, timeout: float = 60.0):
+    deadline = time.monotonic() + timeout
+    async with aiohttp.ClientSession() as session:
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                with open(os.path.join(workdir, "app.log"), errors="replace") as log:
+                    raise RuntimeError("App exited during startup:\n" + log.read()[-4000:])
+            try:
+                async with session.get(base_url + "/metrics") as response:
+                    if response.status == 200:
+                        return
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError("App did not start in time")
+
+def seed_posts(db_path: str, count: int):
+    """Give the admin user `count` synthetic posts so read endpoints have data"""
+    conn = sqlite3.connect(db_path)
+    user_id = conn.execute("SELECT id FROM users WHERE username = 'admin'").fetchone()[0]
+    conn.close()
+    # No queued posts: the app's dispatcher would publish them during the run
+    generate(db_path, count, days=90, user_ids=[user_id], queued=False)
+
+def post_form(index: int, media_bytes: int) -> aiohttp.FormData:
+    form = aiohttp.FormData()
+    form.add_field("content", f"Load test post {index} #benchmark {time.time_ns()}")
+    form.add_field("platforms", "telegram")
+    if media_bytes:
+        form.add_field("media", b"\x89PNG\r\n\x1a\n" + b"\0" * media_bytes, filename="bench.png", content_type="image/png")
+    return form
+
+async def run_scenario(session: aiohttp.ClientSession, base_url: str, name: str, total: int, concurrency: int, media_bytes: int) -> dict:
+    method, path = SCENARIOS[name]
+    latencies = []
+    errors = {}
+    next_index = iter(range(total))
+
+    async def worker():
+        for index in next_index:
+            data = post_form(index, media_bytes) if name == "post" else None
+            started = time.perf_counter()
+            try:
+                async with session.request(method, base_url + path, data=data, allow_redirects=False) as response:
+                    await response.read()
+                    status = response.status
+            except aiohttp.ClientError as e:
+                status = type(e).__name__
+            latencies.append(time.perf_counter() - started)
+            if status != 200:
+                errors[str(status)] = errors.get(str(status), 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    values = np.array(latencies) * 1000
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "scenario": name,
+        "concurrency": concurrency,
+        "requests": total,
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(total / elapsed, 1),
+        "latency_ms": {
+            "mean": round(float(values.mean()), 2),
+            "p50": round(float(p50), 2),
+            "p95": round(float(p95), 2),
+            "p99": round(float(p99), 2),
+            "max": round(float(values.max()), 2),
+        },
+    }
+
+async def run(args) -> dict:
+    scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        raise SystemExit(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+    concurrency_levels = [int(level) for level in args.concurrency.split(",")]
+
+    mock_port, app_port = free_port(), free_port()
+    base_url = f"http://127.0.0.1:{app_port}"
+    mock = await start_mock_platform(mock_port, args.platform_latency)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        process = start_app(workdir, app_port, f"http://127.0.0.1:{mock_port}")
+        try:
+            await wait_until_ready(base_url, process, workdir)
+            if args.seed_posts:
+                seed_posts(os.path.join(workdir, "dashboard.db"), args.seed_posts)
+
+            results = []
+            connector = aiohttp.TCPConnector(limit=max(concurrency_levels))
+            async with aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.CookieJar(unsafe=True)) as session:
+                async with session.post(base_url + "/login", data={"username": "admin", "password": ADMIN_PASSWORD}, allow_redirects=False) as response:
+                    if response.status != 302:
+                        raise RuntimeError(f"Login failed with HTTP {response.status}")
+
+                for name in scenarios:
+                    for concurrency in concurrency_levels:
+                        result = await run_scenario(session, base_url, name, args.requests, concurrency, args.media_bytes)
+                        print(json.dumps(result), file=sys.stderr, flush=True)
+                        results.append(result)
+        finally:
+            process.terminate()
+            process.wait(timeout=10)
+            await mock.cleanup()
+
+    return {
+        "started_at": datetime.utcnow().isoformat() + "Z",
+        "config": {
+            "requests": args.requests,
+            "concurrency": concurrency_levels,
+            "platform_latency_ms": args.platform_latency * 1000,
+            "seed_posts": args.seed_posts,
+            "media_bytes": args.media_bytes,
+            "python": sys.version.split()[0],
+        },
+        "results": results,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the posting pipeline against a temporary app and mock platform")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="Comma-separated scenarios: " + ", ".join(SCENARIOS))
+    parser.add_argument("--requests", type=int, default=200, help="Requests per scenario and concurrency level")
+    parser.add_argument("--concurrency", default="1,10,50", help="Comma-separated concurrency levels")
+    parser.add_argument("--platform-latency", type=float, default=0.05, help="Seconds the mock platform takes per call")
+    parser.add_argument("--seed-posts", type=int, default=1000, help="Posts created before the run")
+    parser.add_argument("--media-bytes", type=int, default=0, help="Attach an image of this size to each /post")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    return report
+
+if __name__ == "__main__":
+    main()
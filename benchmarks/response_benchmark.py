@@ -0,0 +1,87 @@
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from starlette.responses import JSONResponse
+
+from compression import brotli
+from fast_json import FastJSONResponse, orjson
+from generate_posts import generate_batch
+
+def log_payload(count: int, seed: int = 42) -> dict:
+    """An /api/logs-style payload of `count` posts with their full results blobs"""
+    rng = np.random.default_rng(seed)
+    rows = generate_batch(rng, count, [1], np.array([1.0]), datetime.utcnow() - timedelta(days=90), 90)
+    logs = []
+    for index, row in enumerate(rows):
+        content, platforms, _, _, _, status, results, created_at, completed_at = row[:9]
+        logs.append({
+            "id": index + 1,
+            "content": content,
+            "platforms": platforms.split(","),
+            "status": status,
+            "created_at": created_at,
+            "completed_at": completed_at,
+            "results": results,
+            "views": row[10],
+            "engagement_rate": row[15],
+        })
+    return {"logs": logs}
+
+def best_of(function, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+def measure(count: int, repeat: int) -> dict:
+    payload = log_payload(count)
+    stdlib = JSONResponse(None)
+    fast = FastJSONResponse(None)
+    body = fast.render(payload)
+
+    result = {
+        "logs": count,
+        "serialize_ms": {
+            "stdlib_json": round(best_of(lambda: stdlib.render(payload), repeat) * 1000, 3),
+            "fast_json": round(best_of(lambda: fast.render(payload), repeat) * 1000, 3),
+        },
+        "bytes": {"identity": len(body)},
+        "compress_ms": {},
+    }
+    codecs = {"gzip-6": lambda: gzip.compress(body, 6), "gzip-9": lambda: gzip.compress(body, 9)}
+    if brotli is not None:
+        codecs["br-4"] = lambda: brotli.compress(body, quality=4)
+        codecs["br-11"] = lambda: brotli.compress(body, quality=11)
+    for name, compress in codecs.items():
+        result["bytes"][name] = len(compress())
+        result["compress_ms"][name] = round(best_of(compress, repeat) * 1000, 3)
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Bytes on the wire and serialization time of large log payloads")
+    parser.add_argument("--sizes", default="50,1000,10000", help="Comma-separated numbers of logs per payload")
+    parser.add_argument("--repeat", type=int, default=5, help="Timings are the best of this many runs")
+    args = parser.parse_args()
+
+    report = {
+        "json_library": "orjson" if orjson is not None else "stdlib",
+        "brotli": brotli is not None,
+        "results": [measure(int(size), args.repeat) for size in args.sizes.split(",")],
+    }
+    print(json.dumps(report, indent=2))
+    return report
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+DAYS = 7
+HOURS = 24
+# Pseudo-posts at the platform average added to every slot, so a slot with a
+# single lucky post doesn't outrank slots with a consistent history
+PRIOR_POSTS = 2.0
+WEEKDAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+def post_slot(post) -> Optional[Tuple[int, int]]:
+    """(weekday, hour) in UTC at which a post went out"""
+    published = getattr(post, 'completed_at', None) or getattr(post, 'created_at', None)
+    if not published:
+        return None
+    return published.weekday(), published.hour
+
+def post_platforms(post) -> List[str]:
+    return [p.strip() for p in (post.platforms or '').split(',') if p.strip()]
+
+class BestTimeIndex:
+    """Per-user engagement histograms by platform, weekday and hour
+
+    Each (user, platform) keeps a 7x24 array of summed engagement rates and
+    one of post counts. Only posts with analytics contribute; each post's
+    contribution is remembered so analytics updates replace it in place.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.engagement: Dict[Tuple[int, str], np.ndarray] = {}
+        self.counts: Dict[Tuple[int, str], np.ndarray] = {}
+        self.contributions: Dict[int, tuple] = {}
+
+    def __len__(self):
+        return len(self.contributions)
+
+    def build(self, db, batch_size: int = 1000):
+        """(Re)build the histograms from all completed posts with analytics"""
+        from models import PostLog
+
+        query = db.query(
+            PostLog.id, PostLog.user_id, PostLog.platforms, PostLog.status, PostLog.engagement_rate,
+            PostLog.analytics_updated_at, PostLog.created_at, PostLog.completed_at
+        ).filter(
+            PostLog.status == "completed", PostLog.analytics_updated_at.isnot(None)
+        ).execution_options(yield_per=batch_size)
+
+        with self._lock:
+            self._reset()
+            for post in query:
+                self._update(post)
+
+        print(f"🕒 Best-time index built from {len(self.contributions)} posts")
+
+    def update(self, post):
+        """Add a post, or replace its contribution after its analytics changed"""
+        if getattr(post, 'status', 'completed') != "completed" or post.id is None:
+            return
+        if not getattr(post, 'analytics_updated_at', None):
+            return
+        with self._lock:
+            self._update(post)
+
+    def _update(self, post):
+        slot = post_slot(post)
+        if slot is None:
+            return
+        contribution = (post.user_id, tuple(post_platforms(post)), slot, float(post.engagement_rate or 0.0))
+
+        previous = self.contributions.get(post.id)
+        if previous == contribution:
+            return
+        if previous is not None:
+            self._apply(previous, -1)
+        self._apply(contribution, 1)
+        self.contributions[post.id] = contribution
+
+    def _apply(self, contribution: tuple, sign: int):
+        user_id, platforms, (weekday, hour), rate = contribution
+        for platform in platforms + ("general",):
+            key = (user_id, platform)
+            if key not in self.counts:
+                self.counts[key] = np.zeros((DAYS, HOURS))
+                self.engagement[key] = np.zeros((DAYS, HOURS))
+            self.counts[key][weekday, hour] += sign
+            self.engagement[key][weekday, hour] += sign * rate
+
+    def slot_scores(self, user_id: int, platforms: List[str]) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """Smoothed mean engagement rate and post count per (weekday, hour)"""
+        with self._lock:
+            # Platforms without history of their own fall back to all of the user's posts
+            keys = [(user_id, p) for p in platforms if (user_id, p) in self.counts]
+            if not keys and (user_id, "general") in self.counts:
+                keys = [(user_id, "general")]
+            if not keys:
+                return None, None
+            counts = sum(self.counts[key] for key in keys)
+            engagement = sum(self.engagement[key] for key in keys)
+
+        total = counts.sum()
+        if total <= 0:
+            return None, None
+        average = engagement.sum() / total
+        return (engagement + PRIOR_POSTS * average) / (counts + PRIOR_POSTS), counts
+
+    def suggest(self, user_id: int, platforms: Optional[List[str]] = None, count: int = 3, now: Optional[datetime] = None) -> dict:
+        """The `count` best upcoming hourly slots within the next week (UTC)"""
+        scores, counts = self.slot_scores(user_id, platforms or ["general"])
+        if scores is None:
+            return {"slots": [], "based_on_posts": 0}
+
+        now = now or datetime.utcnow()
+        first = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        # Scores of the next 168 hours, in order, starting from the next full hour
+        weekdays = (first.weekday() + (first.hour + np.arange(DAYS * HOURS)) // HOURS) % DAYS
+        hours = (first.hour + np.arange(DAYS * HOURS)) % HOURS
+        upcoming = scores[weekdays, hours]
+        history = counts[weekdays, hours]
+
+        # Highest score first; ties go to the slot with more history, then the sooner one
+        count = max(1, min(count, len(upcoming)))
+        best = np.sort(np.lexsort((np.arange(len(upcoming)), -history, -upcoming))[:count])
+        baseline = float(scores.mean())
+
+        return {
+            "slots": [
+                {
+                    "time": (first + timedelta(hours=int(offset))).isoformat() + "Z",
+                    "weekday": WEEKDAY_NAMES[int(weekdays[offset])],
+                    "hour": int(hours[offset]),
+                    "score": round(float(upcoming[offset]), 2),
+                    "posts": int(history[offset]),
+                    "lift": round(float(upcoming[offset]) / baseline, 2) if baseline else None
+                }
+                for offset in best
+            ],
+            "based_on_posts": int(counts.sum())
+        }
+
+best_time_index = BestTimeIndex()
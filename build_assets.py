@@ -0,0 +1,151 @@
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Optional
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+try:
+    import rcssmin
+except ImportError:
+    rcssmin = None
+
+from static_assets import DIST_DIR, MANIFEST_PATH, STATIC_DIR
+
+# Served as-is, minified; Tailwind's output is added as tailwind.css when the CLI is available
+SOURCES = ["script.js", "style.css"]
+TAILWIND_CONFIG = "tailwind.config.js"
+TAILWIND_INPUT = os.path.join(STATIC_DIR, "src", "tailwind.css")
+TAILWIND_TIMEOUT = int(os.getenv("TAILWIND_TIMEOUT", "300"))
+# Not worth compressing below this size
+COMPRESS_MIN_BYTES = 512
+
+def tailwind_command() -> Optional[List[str]]:
+    """The Tailwind v3 CLI: TAILWINDCSS, a standalone binary on PATH, or npx"""
+    if os.getenv("TAILWINDCSS"):
+        return [os.getenv("TAILWINDCSS")]
+    if shutil.which("tailwindcss"):
+        return [shutil.which("tailwindcss")]
+    if shutil.which("npx"):
+        return [shutil.which("npx"), "--yes", "tailwindcss@3"]
+    return None
+
+def build_tailwind(command: List[str]) -> Optional[bytes]:
+    """Compile only the utility classes used by the templates and script.js"""
+    with tempfile.TemporaryDirectory() as workdir:
+        output = os.path.join(workdir, "tailwind.css")
+        try:
+            subprocess.run(
+                command + ["-c", TAILWIND_CONFIG, "-i", TAILWIND_INPUT, "-o", output, "--minify"],
+                check=True, capture_output=True, timeout=TAILWIND_TIMEOUT
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            detail = getattr(e, "stderr", None) or b""
+            print(f"⚠️ Tailwind build failed, pages keep the CDN build: {e} {detail.decode(errors='replace')[-500:]}", file=sys.stderr)
+            return None
+        with open(output, "rb") as f:
+            return f.read()
+
+def minify_css(text: str) -> str:
+    if rcssmin:
+        return rcssmin.cssmin(text)
+    # Conservative fallback: comments and insignificant whitespace only
+    text = re.sub(r"/\*.*?\*/", "", text, flags=re.S)
+    text = re.sub(r"\s+", " ", text)
+    return re.sub(r"\s*([{};,>])\s*", r"\1", text).strip()
+
+def minify_js(text: str) -> str:
+    # No safe regex fallback for JavaScript: without rjsmin the file is only hashed
+    return rjsmin.jsmin(text) if rjsmin else text
+
+def hashed_name(name: str, data: bytes) -> str:
+    stem, extension = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:12]}{extension}"
+
+def write_asset(dist: str, name: str, data: bytes) -> List[str]:
+    """Write the hashed file and its precompressed siblings; returns the file names"""
+    filename = hashed_name(name, data)
+    written = [filename]
+    with open(os.path.join(dist, filename), "wb") as f:
+        f.write(data)
+    if len(data) >= COMPRESS_MIN_BYTES:
+        # mtime=0 keeps the .gz byte-identical between builds of the same input
+        with open(os.path.join(dist, filename + ".gz"), "wb") as f:
+            f.write(gzip.compress(data, compresslevel=9, mtime=0))
+        written.append(filename + ".gz")
+        if brotli:
+            with open(os.path.join(dist, filename + ".br"), "wb") as f:
+                f.write(brotli.compress(data, quality=11))
+            written.append(filename + ".br")
+    return written
+
+def build(tailwind: bool = True) -> Dict[str, str]:
+    """Build every asset into static/dist/ and write the manifest"""
+    dist = os.path.join(STATIC_DIR, DIST_DIR)
+    os.makedirs(dist, exist_ok=True)
+    manifest = {}
+    keep = {"manifest.json"}
+    # Pages rendered just before the build may still ask for the previous files
+    if os.path.exists(MANIFEST_PATH):
+        with open(MANIFEST_PATH) as f:
+            for path in json.load(f).values():
+                name = os.path.basename(path)
+                keep.update({name, name + ".gz", name + ".br"})
+
+    for name in SOURCES:
+        with open(os.path.join(STATIC_DIR, name), encoding="utf-8") as f:
+            text = f.read()
+        minified = minify_js(text) if name.endswith(".js") else minify_css(text)
+        files = write_asset(dist, name, minified.encode("utf-8"))
+        manifest[name] = f"{DIST_DIR}/{files[0]}"
+        keep.update(files)
+
+    command = tailwind_command() if tailwind else None
+    css = build_tailwind(command) if command else None
+    if css:
+        files = write_asset(dist, "tailwind.css", css)
+        manifest["tailwind.css"] = f"{DIST_DIR}/{files[0]}"
+        keep.update(files)
+
+    # Replace the manifest atomically so a running app never reads half of it
+    with open(MANIFEST_PATH + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(MANIFEST_PATH + ".tmp", MANIFEST_PATH)
+
+    for entry in os.scandir(dist):
+        if entry.name not in keep:
+            os.remove(entry.path)
+    return manifest
+
+def main():
+    parser = argparse.ArgumentParser(description="Build hashed, minified and precompressed static assets")
+    parser.add_argument("--no-tailwind", action="store_true", help="Skip the Tailwind build (pages use the CDN build)")
+    args = parser.parse_args()
+
+    manifest = build(tailwind=not args.no_tailwind)
+    for name, path in sorted(manifest.items()):
+        size = os.path.getsize(os.path.join(STATIC_DIR, path))
+        compressed = [suffix for suffix in (".br", ".gz") if os.path.exists(os.path.join(STATIC_DIR, path + suffix))]
+        sizes = ", ".join(f"{suffix[1:]} {os.path.getsize(os.path.join(STATIC_DIR, path + suffix))}" for suffix in compressed)
+        print(f"✅ {name} -> {path} ({size} bytes{', ' + sizes if sizes else ''})")
+    if "tailwind.css" not in manifest:
+        print("⚠️ tailwind.css not built: install the Tailwind CLI (or npx) to stop compiling CSS in the browser")
+    return manifest
+
+if __name__ == "__main__":
+    main()
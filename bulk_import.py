@@ -0,0 +1,163 @@
+import argparse
+import csv
+import io
+import json
+import re
+import time
+from typing import Iterator, Optional, Tuple
+
+from sqlalchemy import insert
+
+from models import PostLog
+from dispatcher import validate_post
+from seo import calculate_seo_score, calculate_readability_score, extract_hashtags
+from content_fingerprint import duplicate_index, simhash, to_signed, to_unsigned, DUPLICATE_POLICY
+
+IMPORT_BATCH_SIZE = 500
+MAX_REPORTED_ERRORS = 1000
+PLATFORM_SEPARATORS = re.compile(r'[,;|\s]+')
+
+def detect_format(filename: str) -> str:
+    """Pick the import format from a file name"""
+    name = (filename or "").lower()
+    if name.endswith((".jsonl", ".ndjson", ".json")):
+        return "jsonl"
+    return "csv"
+
+def iter_rows(stream, file_format: str) -> Iterator[Tuple[int, Optional[dict], Optional[str]]]:
+    """Stream (row_number, row, parse_error) tuples from a binary CSV or JSONL file"""
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+
+    if file_format == "jsonl":
+        for row_number, line in enumerate(text_stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield row_number, None, f"Invalid JSON: {e.msg}"
+                continue
+            if not isinstance(row, dict):
+                yield row_number, None, "Each line must be a JSON object"
+                continue
+            yield row_number, row, None
+    else:
+        # Row numbers count the header as line 1, like a spreadsheet
+        for row_number, row in enumerate(csv.DictReader(text_stream), start=2):
+            yield row_number, row, None
+
+def build_post_values(row: dict, user_id: int) -> dict:
+    """Validate one import row with the same rules as /post and build its PostLog values"""
+    content = (row.get("content") or "").strip()
+    platforms = row.get("platforms") or ""
+    if isinstance(platforms, str):
+        platforms = PLATFORM_SEPARATORS.split(platforms.lower())
+    schedule_time = row.get("schedule_time") or row.get("scheduled_for") or None
+
+    platforms, scheduled_for = validate_post(content, [str(p).strip() for p in platforms], schedule_time)
+
+    seo_keywords = row.get("seo_keywords") or ""
+    seo_title = row.get("seo_title") or ""
+    seo_description = row.get("seo_description") or ""
+
+    fingerprint = simhash(content)
+    if DUPLICATE_POLICY == "block" and not row.get("allow_duplicate"):
+        duplicates = duplicate_index.find_duplicates(user_id, platforms, fingerprint)
+        if duplicates:
+            raise ValueError(f"Near-duplicate of post {duplicates[0]['post_id']} on {', '.join(duplicates[0]['platforms'])}")
+
+    return {
+        "content": content,
+        "platforms": ",".join(platforms),
+        "scheduled_for": scheduled_for,
+        "user_id": user_id,
+        "status": "queued",
+        "seo_keywords": seo_keywords,
+        "seo_title": seo_title,
+        "seo_description": seo_description,
+        "hashtags": extract_hashtags(content),
+        "seo_score": calculate_seo_score(content, seo_keywords, seo_title, seo_description),
+        "readability_score": calculate_readability_score(content),
+        "content_simhash": to_signed(fingerprint) if fingerprint is not None else None
+    }
+
+def import_posts(db, user_id: int, stream, file_format: str = "csv", batch_size: int = IMPORT_BATCH_SIZE) -> dict:
+    """Import posts from a CSV/JSONL stream as queued PostLog rows
+
+    Rows are validated one by one and inserted in batched transactions; invalid
+    rows are reported without aborting the rest of the import.
+    """
+    started = time.perf_counter()
+    imported = 0
+    failed = 0
+    errors = []
+    batch = []
+
+    def flush():
+        nonlocal imported
+        if not batch:
+            return
+        post_ids = db.scalars(
+            insert(PostLog).returning(PostLog.id, sort_by_parameter_order=True),
+            batch
+        ).all()
+        db.commit()
+        for post_id, values in zip(post_ids, batch):
+            if values["content_simhash"] is not None:
+                duplicate_index.add(post_id, user_id, values["platforms"], to_unsigned(values["content_simhash"]))
+        imported += len(batch)
+        batch.clear()
+
+    for row_number, row, parse_error in iter_rows(stream, file_format):
+        try:
+            if parse_error:
+                raise ValueError(parse_error)
+            batch.append(build_post_values(row, user_id))
+        except Exception as e:
+            failed += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append({"row": row_number, "error": str(e)})
+            continue
+
+        if len(batch) >= batch_size:
+            flush()
+
+    flush()
+
+    return {
+        "imported": imported,
+        "failed": failed,
+        "errors": errors,
+        "errors_truncated": failed > len(errors),
+        "duration_seconds": round(time.perf_counter() - started, 3)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Import posts from a CSV or JSONL file")
+    parser.add_argument("file", help="CSV (with a header row) or JSONL file")
+    parser.add_argument("--username", default="admin", help="Owner of the imported posts")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="File format (detected from the extension by default)")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    from database import SessionLocal, init_db
+    from models import User
+
+    init_db()
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.username == args.username).first()
+        if not user:
+            raise SystemExit(f"❌ User not found: {args.username}")
+
+        duplicate_index.build(db)
+        with open(args.file, "rb") as stream:
+            report = import_posts(db, user.id, stream, args.format or detect_format(args.file), args.batch_size)
+    finally:
+        db.close()
+
+    print(json.dumps(report, indent=2))
+    print(f"✅ Imported {report['imported']} posts ({report['failed']} failed); the dashboard server dispatches them")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import os
+from typing import Optional
+
+import anyio.to_thread
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES, GZipMiddleware, GZipResponder, IdentityResponder
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+# Dynamic responses are compressed per request: favour speed over the last few percent
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+
+def accepted_encodings(header: str) -> dict:
+    """Accept-Encoding as {coding: q}, without the codings refused with q=0"""
+    encodings = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                continue
+        if coding and q > 0:
+            encodings[coding.strip().lower()] = q
+    return encodings
+
+class BrotliResponder(IdentityResponder):
+    content_encoding = "br"
+
+    def __init__(self, app, minimum_size: int, quality: int = COMPRESSION_BROTLI_QUALITY, *,
+                 thread_minimum_size: int = 128 * 1024, exclude_content_types=DEFAULT_EXCLUDED_CONTENT_TYPES):
+        super().__init__(app, minimum_size, exclude_content_types=exclude_content_types)
+        self.quality = quality
+        self.thread_minimum_size = thread_minimum_size
+        self._compressor = None
+
+    async def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        if len(body) >= self.thread_minimum_size:
+            # Like GZipResponder: large bodies would block the event loop
+            return await anyio.to_thread.run_sync(self._compress_body, body, more_body)
+        return self._compress_body(body, more_body)
+
+    def _compress_body(self, body: bytes, more_body: bool) -> bytes:
+        if self._compressor is None:
+            self._compressor = brotli.Compressor(quality=self.quality)
+        data = self._compressor.process(body)
+        # Flush each chunk so streamed responses (exports) reach the client as they are produced
+        return data + (self._compressor.flush() if more_body else self._compressor.finish())
+
+class CompressionMiddleware(GZipMiddleware):
+    """Negotiated brotli/gzip compression of responses over COMPRESSION_MIN_SIZE
+
+    Brotli is preferred when the client accepts it and the brotli package is
+    installed. Responses that are already encoded (precompressed static
+    assets), partial (206), media or server-sent events pass through as-is.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE, compresslevel: int = COMPRESSION_GZIP_LEVEL,
+                 brotli_quality: int = COMPRESSION_BROTLI_QUALITY):
+        super().__init__(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.brotli_quality = brotli_quality
+
+    def _coding(self, header: str) -> Optional[str]:
+        encodings = accepted_encodings(header)
+        if brotli is not None and "br" in encodings and encodings["br"] >= encodings.get("gzip", 0):
+            return "br"
+        if "gzip" in encodings:
+            return "gzip"
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        coding = self._coding(Headers(scope=scope).get("accept-encoding", ""))
+        if coding == "br":
+            responder = BrotliResponder(self.app, self.minimum_size, self.brotli_quality,
+                                        thread_minimum_size=self.thread_minimum_size,
+                                        exclude_content_types=self.exclude_content_types)
+        elif coding == "gzip":
+            responder = GZipResponder(self.app, self.minimum_size, compresslevel=self.compresslevel,
+                                      thread_minimum_size=self.thread_minimum_size,
+                                      exclude_content_types=self.exclude_content_types)
+        else:
+            responder = IdentityResponder(self.app, self.minimum_size, exclude_content_types=self.exclude_content_types)
+        await responder(scope, receive, send)
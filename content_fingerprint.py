@@ -0,0 +1,199 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+FINGERPRINT_BITS = 64
+# 4 bands of 16 bits: two fingerprints within 3 bits always share at least one band
+LSH_BANDS = 4
+BAND_BITS = FINGERPRINT_BITS // LSH_BANDS
+BAND_MASK = (1 << BAND_BITS) - 1
+
+MAX_DISTANCE = int(os.getenv("DUPLICATE_MAX_DISTANCE", "3"))
+WINDOW_DAYS = int(os.getenv("DUPLICATE_WINDOW_DAYS", "30"))
+# off: no check, flag: report duplicates in the response, block: reject the post
+DUPLICATE_POLICY = os.getenv("DUPLICATE_POLICY", "flag").lower()
+
+TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+URL_PATTERN = re.compile(r'https?://\S+')
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'big')
+
+def simhash(content: str) -> Optional[int]:
+    """64-bit SimHash of the normalised content (word bigrams as features)"""
+    tokens = TOKEN_PATTERN.findall(URL_PATTERN.sub(' ', (content or '').lower()))
+    if not tokens:
+        return None
+
+    if len(tokens) == 1:
+        features = Counter(tokens)
+    else:
+        features = Counter(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+
+    vector = [0] * FINGERPRINT_BITS
+    for feature, weight in features.items():
+        value = _feature_hash(feature)
+        for bit in range(FINGERPRINT_BITS):
+            if value >> bit & 1:
+                vector[bit] += weight
+            else:
+                vector[bit] -= weight
+
+    fingerprint = 0
+    for bit in range(FINGERPRINT_BITS):
+        if vector[bit] > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+def to_signed(fingerprint: int) -> int:
+    """Store unsigned 64-bit fingerprints in SQLite's signed INTEGER column"""
+    return fingerprint - (1 << 64) if fingerprint >= 1 << 63 else fingerprint
+
+def to_unsigned(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+def published_platforms(status: str, platforms: Optional[str], results: Optional[str]) -> str:
+    """The platforms a post counts as posted to: all for completed, queued or pending posts,
+    only the successful ones for failed posts"""
+    if status != "failed":
+        return platforms or ""
+    try:
+        outcome = json.loads(results) if results else {}
+    except ValueError:
+        outcome = {}
+    return ",".join(p for p in (platforms or "").split(",") if outcome.get(p, {}).get("success"))
+
+def hamming_distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+class DuplicateIndex:
+    """LSH index over the fingerprints of each user's recent posts
+
+    Fingerprints are split into bands; each band value maps to the posts that
+    share it, so a lookup only compares against a handful of candidates no
+    matter how many posts are indexed.
+    """
+
+    def __init__(self, window_days: int = WINDOW_DAYS, max_distance: int = MAX_DISTANCE):
+        self.window = timedelta(days=window_days)
+        self.max_distance = max_distance
+        self._lock = threading.Lock()
+        self.buckets: Dict[tuple, List[tuple]] = defaultdict(list)
+        self.size = 0
+
+    @staticmethod
+    def _bands(fingerprint: int):
+        for band in range(LSH_BANDS):
+            yield band, (fingerprint >> (band * BAND_BITS)) & BAND_MASK
+
+    def build(self, db):
+        """Load the fingerprints of posts inside the duplicate window"""
+        from models import PostLog
+
+        since = datetime.utcnow() - self.window
+        query = db.query(
+            PostLog.id, PostLog.user_id, PostLog.platforms, PostLog.status, PostLog.results,
+            PostLog.content_simhash, PostLog.created_at
+        ).filter(
+            PostLog.created_at >= since,
+            PostLog.content_simhash.isnot(None)
+        ).order_by(PostLog.id).execution_options(yield_per=1000)
+
+        with self._lock:
+            self.buckets = defaultdict(list)
+            self.size = 0
+        for post in query:
+            platforms = published_platforms(post.status, post.platforms, post.results)
+            if platforms:
+                self.add(post.id, post.user_id, platforms, to_unsigned(post.content_simhash), post.created_at)
+
+        print(f"🧬 Duplicate index built from {self.size} recent posts")
+
+    def add(self, post_id: int, user_id: int, platforms: str, fingerprint: Optional[int], created_at: Optional[datetime] = None):
+        if fingerprint is None:
+            return
+
+        entry = (post_id, fingerprint, frozenset((platforms or '').split(',')), created_at or datetime.utcnow())
+        with self._lock:
+            for band, value in self._bands(fingerprint):
+                self.buckets[(user_id, band, value)].append(entry)
+            self.size += 1
+
+    def _remove(self, post_id: int, user_id: int, fingerprint: int):
+        """Remove a post from all of its band buckets (caller holds the lock)"""
+        removed = False
+        for band, value in self._bands(fingerprint):
+            bucket = self.buckets.get((user_id, band, value))
+            if bucket:
+                remaining = [entry for entry in bucket if entry[0] != post_id]
+                if len(remaining) != len(bucket):
+                    bucket[:] = remaining
+                    removed = True
+        if removed:
+            self.size -= 1
+
+    def discard(self, post_id: int, user_id: int, fingerprint: Optional[int]):
+        if fingerprint is None:
+            return
+
+        with self._lock:
+            self._remove(post_id, user_id, fingerprint)
+
+    def settle(self, post):
+        """(Re)index a finished post under the platforms it actually reached
+
+        A post that failed everywhere is left out, so it never flags or
+        blocks a repost.
+        """
+        if post.content_simhash is None:
+            return
+        fingerprint = to_unsigned(post.content_simhash)
+        self.discard(post.id, post.user_id, fingerprint)
+        platforms = published_platforms(post.status, post.platforms, post.results)
+        if platforms:
+            self.add(post.id, post.user_id, platforms, fingerprint, post.created_at)
+
+    def find_duplicates(self, user_id: int, platforms: List[str], fingerprint: Optional[int]) -> List[dict]:
+        """Recent posts by the user on overlapping platforms with near-identical content"""
+        if fingerprint is None:
+            return []
+
+        cutoff = datetime.utcnow() - self.window
+        wanted = set(platforms)
+        matches = {}
+
+        with self._lock:
+            for band, value in self._bands(fingerprint):
+                bucket = self.buckets.get((user_id, band, value))
+                if not bucket:
+                    continue
+
+                # Drop posts that fell out of the window while we're here. Buckets
+                # aren't sorted by created_at (settle() re-adds published posts),
+                # so check every entry
+                for post_id, other, _, _ in [entry for entry in bucket if entry[3] < cutoff]:
+                    self._remove(post_id, user_id, other)
+
+                for post_id, other, other_platforms, created_at in bucket:
+                    if post_id in matches or created_at < cutoff:
+                        continue
+                    overlap = wanted & other_platforms
+                    if not overlap:
+                        continue
+                    distance = hamming_distance(fingerprint, other)
+                    if distance <= self.max_distance:
+                        matches[post_id] = {
+                            "post_id": post_id,
+                            "distance": distance,
+                            "platforms": sorted(overlap),
+                            "created_at": created_at.isoformat()
+                        }
+
+        return sorted(matches.values(), key=lambda match: (match["distance"], -match["post_id"]))
+
+duplicate_index = DuplicateIndex()
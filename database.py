@@ -44,6 +44,10 @@ def init_db():
         
         # Create all tables
         Base.metadata.create_all(bind=engine)
+
+        # Full-text search index over post history
+        from post_search import init_search_index
+        init_search_index(engine)
         print("Database initialized successfully")
     except Exception as e:
         print(f"Database initialization error: {e}")
@@ -75,7 +79,8 @@ def migrate_existing_db():
             ("clicks", "INTEGER DEFAULT 0"),
             ("engagement_rate", "REAL DEFAULT 0.0"),
             ("reach", "INTEGER DEFAULT 0"),
-            ("impressions", "INTEGER DEFAULT 0")
+            ("impressions", "INTEGER DEFAULT 0"),
+            ("analytics_updated_at", "DATETIME")
         ]
         
         # SEO columns to add
@@ -87,8 +92,23 @@ def migrate_existing_db():
             ("seo_score", "REAL DEFAULT 0.0"),
             ("readability_score", "REAL DEFAULT 0.0")
         ]
+
+        # Content fingerprint columns to add
+        fingerprint_columns = [
+            ("content_simhash", "INTEGER")
+        ]
+
+        # Media preview columns to add
+        media_columns = [
+            ("thumbnail_path", "VARCHAR(255)")
+        ]
+
+        # Dispatch lease columns to add
+        dispatch_columns = [
+            ("claimed_at", "DATETIME")
+        ]
         
-        all_new_columns = analytics_columns + seo_columns
+        all_new_columns = analytics_columns + seo_columns + fingerprint_columns + media_columns + dispatch_columns
         
         # Add missing columns
         for column_name, column_type in all_new_columns:
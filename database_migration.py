@@ -35,7 +35,8 @@ def migrate_database():
             ("clicks", "INTEGER DEFAULT 0"),
             ("engagement_rate", "REAL DEFAULT 0.0"),
             ("reach", "INTEGER DEFAULT 0"),
-            ("impressions", "INTEGER DEFAULT 0")
+            ("impressions", "INTEGER DEFAULT 0"),
+            ("analytics_updated_at", "DATETIME")
         ]
         
         # SEO columns to add
@@ -47,8 +48,23 @@ def migrate_database():
             ("seo_score", "REAL DEFAULT 0.0"),
             ("readability_score", "REAL DEFAULT 0.0")
         ]
+
+        # Content fingerprint columns to add
+        fingerprint_columns = [
+            ("content_simhash", "INTEGER")
+        ]
+
+        # Media preview columns to add
+        media_columns = [
+            ("thumbnail_path", "VARCHAR(255)")
+        ]
+
+        # Dispatch lease columns to add
+        dispatch_columns = [
+            ("claimed_at", "DATETIME")
+        ]
         
-        all_new_columns = analytics_columns + seo_columns
+        all_new_columns = analytics_columns + seo_columns + fingerprint_columns + media_columns + dispatch_columns
         
         # Add missing columns
         for column_name, column_type in all_new_columns:
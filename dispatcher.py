@@ -0,0 +1,326 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+from sqlalchemy import or_, update
+
+from database import SessionLocal
+from models import PostLog
+from hashtag_index import hashtag_index
+from content_fingerprint import duplicate_index
+from metrics import platform_request_duration
+from tracing import start_span, tracer
+from social_platforms import ADAPTERS
+from media_pipeline import media_pipeline
+from pubsub import event_hub, user_channel
+from accounts import account_store
+
+VALID_PLATFORMS = list(ADAPTERS)
+
+DISPATCH_WORKERS = int(os.getenv("DISPATCH_WORKERS", "4"))
+DISPATCH_POLL_SECONDS = float(os.getenv("DISPATCH_POLL_SECONDS", "15"))
+DISPATCH_BATCH_SIZE = 500
+# A post still pending this long after it was claimed is assumed abandoned (its process died)
+DISPATCH_LEASE_SECONDS = float(os.getenv("DISPATCH_LEASE_SECONDS", "1800"))
+
+logger = logging.getLogger("dispatcher")
+
+# Dashboard counter each post status is shown under
+STAT_BUCKETS = {"completed": "successful", "failed": "failed", "pending": "pending", "queued": "pending"}
+
+def validate_post(content: str, platforms: List[str], schedule_time: Optional[str] = None) -> Tuple[List[str], Optional[datetime]]:
+    """Validate the fields of a new post, returning (platforms, scheduled_for)
+
+    Raises ValueError with a user-facing message when the post is invalid.
+    """
+    if not content or not content.strip():
+        raise ValueError("Content is required")
+
+    platforms = [p for p in platforms if p in VALID_PLATFORMS]
+    if not platforms:
+        raise ValueError("At least one platform must be selected")
+
+    scheduled_for = None
+    if schedule_time:
+        try:
+            scheduled_for = datetime.fromisoformat(schedule_time)
+        except ValueError:
+            raise ValueError(f"Invalid schedule time: {schedule_time}")
+        if scheduled_for.tzinfo is not None:
+            # Stored and compared as naive UTC, like every other timestamp
+            scheduled_for = scheduled_for.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return platforms, scheduled_for
+
+async def announce_status(user_id: int, post_id: int, status: str, previous: Optional[str] = None):
+    """Push a post's new status and the resulting dashboard counter changes to its owner
+
+    `previous` is None for a newly created post.
+    """
+    delta = {"total": 1} if previous is None else {STAT_BUCKETS[previous]: -1}
+    bucket = STAT_BUCKETS[status]
+    delta[bucket] = delta.get(bucket, 0) + 1
+    channel = user_channel(user_id)
+    await event_hub.publish(channel, "post.status", {"post_id": post_id, "status": status})
+    delta = {name: change for name, change in delta.items() if change}
+    if delta:
+        await event_hub.publish(channel, "stats.delta", delta)
+
+async def publish_to_platforms(social_manager, content: str, file_path: Optional[str], file_type: Optional[str], platforms: List[str],
+                               post_id: Optional[int] = None, user_id: Optional[int] = None,
+                               previous: Optional[dict] = None) -> Tuple[dict, bool]:
+    """Post content to each platform, returning (results, overall_success)
+
+    A platform for which the user has stored accounts is published to every
+    enabled account, the others through the environment-configured adapter.
+    All destinations are published to concurrently, each behind its own
+    rate limiter. Platforms whose capabilities rule the post out are
+    reported as failed without calling them. With a user_id, each
+    destination's result is pushed to that user's event channel as soon as
+    it is known. Accounts that already succeeded in `previous` results (a
+    retry) are not published to again.
+    """
+    accounts = await account_store.accounts_async(user_id) if user_id is not None else {}
+    destinations = []  # (platform, account or None)
+    account_results = {}  # platform -> {account name: result}
+    for platform in platforms:
+        if not accounts.get(platform):
+            destinations.append((platform, None))
+            continue
+        earlier = ((previous or {}).get(platform) or {}).get("accounts", {})
+        account_results[platform] = {}
+        for account in accounts[platform]:
+            if earlier.get(account.name, {}).get("success"):
+                account_results[platform][account.name] = earlier[account.name]
+            else:
+                destinations.append((platform, account))
+
+    with start_span("media.prepare", platforms=len(platforms)):
+        renditions = await media_pipeline.prepare(file_path, file_type, platforms)
+
+    done = 0
+
+    async def publish(platform: str, account) -> dict:
+        nonlocal done
+        started = time.perf_counter()
+        destination = f"{platform}/{account.name}" if account else platform
+        try:
+            media_path, media_type = renditions.get(platform, (file_path, file_type))
+            rejection = social_manager.check(platform, content, media_path, media_type, account)
+            if rejection:
+                platform_request_duration.observe(0.0, platform=platform, outcome="rejected")
+                logger.info("%s skipped: %s", destination, rejection, extra={"platform": platform})
+                result = {"success": False, "message": rejection}
+            else:
+                logger.debug("Posting to %s", destination)
+                attributes = {"account_id": account.id} if account else {}
+                with start_span("platform.publish", platform=platform, has_media=bool(media_path), **attributes) as span:
+                    published = await social_manager.publish(platform, content, media_path, media_type, account)
+                    if span is not None:
+                        span.set_attribute("success", published.success)
+
+                elapsed = time.perf_counter() - started
+                outcome = "success" if published.success else ("error" if published.retryable else "failure")
+                platform_request_duration.observe(elapsed, platform=platform, outcome=outcome)
+                logger.log(
+                    logging.INFO if published.success else logging.WARNING, "%s result: %s", destination, published.message,
+                    extra={"platform": platform, "success": published.success, "duration_ms": round(elapsed * 1000, 1)}
+                )
+                result = published.as_dict()
+        except Exception as e:
+            # One destination's failure must not abort the others (or leave the post pending)
+            logger.exception("Publishing to %s failed", destination, extra={"platform": platform})
+            platform_request_duration.observe(time.perf_counter() - started, platform=platform, outcome="error")
+            result = {"success": False, "message": f"{platform} publishing error: {e}"}
+
+        done += 1
+        if user_id is not None:
+            await event_hub.publish(user_channel(user_id), "post.progress", {
+                "post_id": post_id, "platform": platform, "account": account.name if account else None, **result,
+                "done": done, "total": len(destinations)
+            })
+        return result
+
+    outcomes = await asyncio.gather(*(publish(platform, account) for platform, account in destinations))
+
+    results = {}
+    for (platform, account), result in zip(destinations, outcomes):
+        if account is None:
+            results[platform] = result
+        else:
+            account_results[platform][account.name] = result
+    for platform, by_account in account_results.items():
+        succeeded = sum(1 for result in by_account.values() if result.get("success"))
+        results[platform] = {
+            "success": succeeded == len(by_account),
+            "message": f"Posted to {succeeded}/{len(by_account)} accounts",
+            "accounts": by_account
+        }
+    results = {platform: results[platform] for platform in platforms}
+    return results, all(result["success"] for result in results.values())
+
+class PostDispatcher:
+    """Background dispatch of queued posts (bulk imports and scheduled posts)
+
+    Posts are written with status "queued". A sweeper enqueues the ones that are
+    due, and workers claim each post atomically (queued -> pending) before
+    publishing it, so a post is never dispatched twice. Posts left pending
+    longer than the lease by a crashed or restarted process are recovered.
+    """
+
+    def __init__(self, social_manager, workers: int = DISPATCH_WORKERS, poll_seconds: float = DISPATCH_POLL_SECONDS,
+                 lease_seconds: float = DISPATCH_LEASE_SECONDS):
+        self.social_manager = social_manager
+        self.workers = workers
+        self.poll_seconds = poll_seconds
+        self.lease_seconds = lease_seconds
+        self.queue: Optional[asyncio.Queue] = None
+        self.in_flight = set()
+        self._wake: Optional[asyncio.Event] = None
+        self._tasks = []
+
+    def start(self):
+        """Start the sweeper and worker tasks on the running event loop"""
+        if self._tasks:
+            return
+        self.queue = asyncio.Queue(maxsize=DISPATCH_BATCH_SIZE * 2)
+        self._wake = asyncio.Event()
+        self._tasks.append(asyncio.create_task(self._sweep_loop()))
+        for _ in range(self.workers):
+            self._tasks.append(asyncio.create_task(self._worker()))
+        logger.info("Post dispatcher started with %d workers", self.workers)
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def wake(self):
+        """Sweep for due posts now instead of waiting for the next poll"""
+        if self._wake:
+            self._wake.set()
+
+    def queue_depth(self) -> int:
+        return self.queue.qsize() if self.queue else 0
+
+    async def _sweep_loop(self):
+        while True:
+            try:
+                await self._recover()
+                await self._sweep()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Dispatch sweep error")
+
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    async def _recover(self):
+        """Put posts whose lease expired back where they can be published again
+
+        Retried posts (which already have results) go back to failed so only
+        their failed platforms are retried; the others are re-queued.
+        """
+        cutoff = datetime.utcnow() - timedelta(seconds=self.lease_seconds)
+        stale = (PostLog.status == "pending", or_(PostLog.claimed_at.is_(None), PostLog.claimed_at < cutoff))
+        db = SessionLocal()
+        try:
+            interrupted = db.query(PostLog.id, PostLog.user_id).filter(*stale, PostLog.results.isnot(None)).all()
+            if interrupted:
+                db.execute(
+                    update(PostLog)
+                    .where(PostLog.id.in_([post.id for post in interrupted]), *stale)
+                    .values(status="failed", claimed_at=None)
+                )
+            requeued = db.execute(
+                update(PostLog).where(*stale, PostLog.results.is_(None)).values(status="queued", claimed_at=None)
+            ).rowcount
+            db.commit()
+        finally:
+            db.close()
+
+        for post in interrupted:
+            await announce_status(post.user_id, post.id, "failed", previous="pending")
+        if interrupted or requeued:
+            logger.warning("Recovered %d abandoned pending posts (%d re-queued, %d back to failed)",
+                           len(interrupted) + requeued, requeued, len(interrupted))
+
+    async def _sweep(self):
+        """Enqueue queued posts whose schedule time has come, in id order"""
+        last_id = 0
+        while True:
+            db = SessionLocal()
+            try:
+                now = datetime.utcnow()
+                rows = db.query(PostLog.id).filter(
+                    PostLog.status == "queued",
+                    PostLog.id > last_id,
+                    or_(PostLog.scheduled_for.is_(None), PostLog.scheduled_for <= now)
+                ).order_by(PostLog.id).limit(DISPATCH_BATCH_SIZE).all()
+            finally:
+                db.close()
+
+            if not rows:
+                return
+
+            for (post_id,) in rows:
+                if post_id not in self.in_flight:
+                    self.in_flight.add(post_id)
+                    await self.queue.put(post_id)
+            last_id = rows[-1][0]
+
+    async def _worker(self):
+        while True:
+            post_id = await self.queue.get()
+            try:
+                with tracer.root_span("dispatch", post_id=post_id):
+                    await self.dispatch(post_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Dispatch error for post %s", post_id)
+            finally:
+                self.in_flight.discard(post_id)
+                self.queue.task_done()
+
+    async def dispatch(self, post_id: int):
+        """Claim a queued post and publish it to its platforms"""
+        db = SessionLocal()
+        try:
+            claimed = db.execute(
+                update(PostLog)
+                .where(PostLog.id == post_id, PostLog.status == "queued")
+                .values(status="pending", claimed_at=datetime.utcnow())
+            ).rowcount
+            db.commit()
+            if not claimed:
+                return
+
+            post = db.query(PostLog).filter(PostLog.id == post_id).first()
+            file_path = os.path.abspath(post.file_path) if post.file_path else None
+            platforms = [p for p in post.platforms.split(",") if p]
+            await announce_status(post.user_id, post.id, "pending", previous="queued")
+
+            results, overall_success = await publish_to_platforms(
+                self.social_manager, post.content, file_path, post.file_type, platforms,
+                post_id=post.id, user_id=post.user_id
+            )
+
+            post.status = "completed" if overall_success else "failed"
+            post.results = json.dumps(results)
+            post.completed_at = datetime.utcnow()
+            db.commit()
+            hashtag_index.update(post)
+            duplicate_index.settle(post)
+            await announce_status(post.user_id, post.id, post.status, previous="pending")
+        finally:
+            db.close()
@@ -0,0 +1,210 @@
+import argparse
+import json
+import logging
+import sys
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+from sqlalchemy import DateTime, Float, Integer, select
+
+from models import PostLog
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+EXPORT_CHUNK_SIZE = 5000
+EXPORT_FORMATS = ["parquet", "arrow", "ndjson"]
+
+logger = logging.getLogger("export")
+
+DEFAULT_EXPORT_COLUMNS = [
+    'id', 'content', 'platforms', 'status', 'created_at', 'completed_at', 'scheduled_for',
+    'views', 'likes', 'shares', 'comments', 'clicks', 'reach', 'impressions', 'engagement_rate',
+    'analytics_updated_at', 'hashtags', 'seo_keywords', 'seo_title', 'seo_score', 'readability_score'
+]
+# Internal columns that are never exported
+EXCLUDED_COLUMNS = {'user_id', 'file_path', 'content_simhash'}
+EXPORTABLE_COLUMNS = [c.name for c in PostLog.__table__.columns if c.name not in EXCLUDED_COLUMNS]
+
+EXPORT_MEDIA_TYPES = {
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream",
+    "ndjson": "application/x-ndjson"
+}
+EXPORT_EXTENSIONS = {"parquet": "parquet", "arrow": "arrows", "ndjson": "ndjson"}
+
+def resolve_format(file_format: Optional[str]) -> str:
+    """Requested format, falling back to NDJSON when pyarrow isn't installed"""
+    file_format = (file_format or "parquet").lower()
+    if file_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {file_format}")
+    if file_format != "ndjson" and pa is None:
+        logger.warning("pyarrow is not installed, exporting NDJSON instead of %s", file_format)
+        return "ndjson"
+    return file_format
+
+def resolve_columns(columns: Optional[List[str]]) -> List[str]:
+    """Validate a column projection; the id column is always included"""
+    if not columns:
+        return list(DEFAULT_EXPORT_COLUMNS)
+    unknown = [c for c in columns if c not in EXPORTABLE_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown export columns: {', '.join(unknown)}")
+    return ['id'] + [c for c in dict.fromkeys(columns) if c != 'id']
+
+def arrow_schema(columns: List[str]):
+    fields = []
+    for name in columns:
+        column_type = PostLog.__table__.columns[name].type
+        if isinstance(column_type, Integer):
+            arrow_type = pa.int64()
+        elif isinstance(column_type, Float):
+            arrow_type = pa.float64()
+        elif isinstance(column_type, DateTime):
+            arrow_type = pa.timestamp("us")
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(name, arrow_type))
+    return pa.schema(fields)
+
+def iter_column_chunks(db, user_id: int, columns: List[str], date_from: Optional[datetime] = None, date_to: Optional[datetime] = None, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[List[tuple]]:
+    """Yield the user's posts in id order as chunks of column tuples
+
+    Each chunk is a list with one tuple per column, read with keyset
+    pagination so memory stays bounded by the chunk size.
+    """
+    table = PostLog.__table__
+    query = select(*(table.c[name] for name in columns)).where(table.c.user_id == user_id)
+    if date_from:
+        query = query.where(table.c.created_at >= date_from)
+    if date_to:
+        query = query.where(table.c.created_at <= date_to)
+
+    last_id = 0
+    while True:
+        rows = db.execute(
+            query.where(table.c.id > last_id).order_by(table.c.id).limit(chunk_size)
+        ).all()
+        if not rows:
+            return
+        last_id = rows[-1][0]
+        yield list(zip(*rows))
+
+class _ChunkSink:
+    """Write-only file object that hands out whatever was written since the last drain"""
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def writable(self) -> bool:
+        return True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+def _ndjson_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+def stream_export(db, user_id: int, file_format: str = "parquet", columns: Optional[List[str]] = None, date_from: Optional[datetime] = None, date_to: Optional[datetime] = None, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Encode the user's posts chunk by chunk as Parquet, Arrow IPC or NDJSON bytes"""
+    columns = resolve_columns(columns)
+    chunks = iter_column_chunks(db, user_id, columns, date_from, date_to, chunk_size)
+
+    if file_format == "ndjson":
+        for chunk in chunks:
+            yield "".join(
+                json.dumps(dict(zip(columns, map(_ndjson_value, row)))) + "\n"
+                for row in zip(*chunk)
+            ).encode("utf-8")
+        return
+
+    schema = arrow_schema(columns)
+    sink = _ChunkSink()
+    output = pa.PythonFile(sink, mode="w")
+    if file_format == "parquet":
+        writer = pq.ParquetWriter(output, schema, compression="zstd")
+    else:
+        writer = pa.ipc.new_stream(output, schema)
+
+    for chunk in chunks:
+        batch = pa.record_batch(
+            [pa.array(values, type=field.type) for values, field in zip(chunk, schema)],
+            schema=schema
+        )
+        if file_format == "parquet":
+            # One row group per chunk keeps the writer from buffering the whole table
+            writer.write_batch(batch, row_group_size=len(batch))
+        else:
+            writer.write_batch(batch)
+        data = sink.drain()
+        if data:
+            yield data
+
+    writer.close()
+    yield sink.drain()
+
+def parse_date(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+def main():
+    parser = argparse.ArgumentParser(description="Export posts and their metrics")
+    parser.add_argument("output", help="Output file, or - for stdout")
+    parser.add_argument("--username", default="admin", help="Owner of the exported posts")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="parquet")
+    parser.add_argument("--columns", help="Comma-separated columns to export")
+    parser.add_argument("--from", dest="date_from", help="Only posts created at or after this ISO date")
+    parser.add_argument("--to", dest="date_to", help="Only posts created at or before this ISO date")
+    parser.add_argument("--chunk-size", type=int, default=EXPORT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    from database import SessionLocal
+    from models import User
+
+    file_format = resolve_format(args.format)
+    columns = args.columns.split(",") if args.columns else None
+
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.username == args.username).first()
+        if not user:
+            raise SystemExit(f"❌ User not found: {args.username}")
+
+        output = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+        try:
+            written = 0
+            for data in stream_export(db, user.id, file_format, columns, parse_date(args.date_from), parse_date(args.date_to), args.chunk_size):
+                output.write(data)
+                written += len(data)
+        finally:
+            if output is not sys.stdout.buffer:
+                output.close()
+    finally:
+        db.close()
+
+    print(f"✅ Exported {written} bytes of {file_format} to {args.output}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+import math
+import re
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+# Same tokenisation rules as the keyword suggester in main.py
+WORD_PATTERN = re.compile(r'\b[a-zA-Z]{3,}\b')
+HASHTAG_PATTERN = re.compile(r'#\w+')
+STOP_WORDS = {
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+    'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does',
+    'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'this', 'that',
+    'these', 'those', 'you', 'your', 'our', 'from', 'just', 'not', 'all', 'out', 'get'
+}
+
+# Words shared by more posts than this are too generic to point at a hashtag
+MAX_WORD_DOCUMENT_SHARE = 0.25
+
+def engagement_weight(post) -> float:
+    """Weight a post's contribution by its engagement (1.0 for posts without analytics)"""
+    engagements = (
+        (getattr(post, 'likes', 0) or 0)
+        + 2 * (getattr(post, 'shares', 0) or 0)
+        + (getattr(post, 'comments', 0) or 0)
+        + (getattr(post, 'clicks', 0) or 0)
+    )
+    return 1.0 + math.log1p(engagements)
+
+def tokenize_words(content: str) -> set:
+    """Extract the meaningful words of a post"""
+    content = HASHTAG_PATTERN.sub(' ', content or '')
+    return {word for word in WORD_PATTERN.findall(content.lower()) if word not in STOP_WORDS}
+
+def parse_hashtags(hashtags: Optional[str], content: str = "") -> set:
+    """Normalise the stored hashtag column (falls back to the content itself)"""
+    tags = HASHTAG_PATTERN.findall(hashtags or '') or HASHTAG_PATTERN.findall(content or '')
+    return {tag.lower() for tag in tags}
+
+class UserHashtags:
+    """One user's share of the index: per-platform hashtag scores and word associations"""
+
+    def __init__(self):
+        self.tag_scores: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self.word_tags: Dict[str, Dict[str, Dict[str, float]]] = defaultdict(lambda: defaultdict(lambda: defaultdict(float)))
+        self.cooccurrence: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.word_documents: Dict[str, int] = defaultdict(int)
+        self.post_weights: Dict[int, float] = {}
+
+class HashtagIndex:
+    """In-memory hashtag recommendation index built from post history
+
+    Keeps, per user and platform, an engagement-weighted score for every
+    hashtag and the weighted association between content words and hashtags,
+    plus per-user hashtag co-occurrence counts. Users never see each other's
+    hashtags. Each post's contribution is remembered so analytics updates can
+    replace it incrementally instead of rebuilding the index.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.users: Dict[int, UserHashtags] = defaultdict(UserHashtags)
+        self.ready = False
+
+    def __len__(self):
+        return sum(len(user.post_weights) for user in self.users.values())
+
+    def build(self, db, batch_size: int = 1000):
+        """(Re)build the index from all completed posts"""
+        from models import PostLog
+
+        query = db.query(
+            PostLog.id, PostLog.user_id, PostLog.content, PostLog.platforms, PostLog.hashtags,
+            PostLog.likes, PostLog.shares, PostLog.comments, PostLog.clicks
+        ).filter(PostLog.status == "completed").execution_options(yield_per=batch_size)
+
+        with self._lock:
+            self._reset()
+            for post in query:
+                self._apply(self.users[post.user_id], post, engagement_weight(post), with_counts=True)
+            self.ready = True
+
+        print(f"🏷️ Hashtag index built from {len(self)} posts")
+
+    def update(self, post):
+        """Add a completed post, or refresh its weight after analytics changed"""
+        if getattr(post, 'status', 'completed') != "completed" or post.id is None:
+            return
+
+        weight = engagement_weight(post)
+        with self._lock:
+            user = self.users[post.user_id]
+            previous = user.post_weights.get(post.id)
+            if previous is None:
+                self._apply(user, post, weight, with_counts=True)
+            elif previous != weight:
+                self._apply(user, post, weight - previous, with_counts=False)
+
+    def _apply(self, user: UserHashtags, post, weight: float, with_counts: bool):
+        tags = parse_hashtags(post.hashtags, post.content)
+        if not tags:
+            return
+
+        words = tokenize_words(post.content)
+        platforms = [p.strip() for p in (post.platforms or '').split(',') if p.strip()]
+
+        for platform in platforms + ["general"]:
+            scores = user.tag_scores[platform]
+            associations = user.word_tags[platform]
+            for tag in tags:
+                scores[tag] += weight
+            for word in words:
+                word_associations = associations[word]
+                for tag in tags:
+                    word_associations[tag] += weight
+
+        if with_counts:
+            for word in words:
+                user.word_documents[word] += 1
+            for tag in tags:
+                related = user.cooccurrence[tag]
+                for other in tags:
+                    if other != tag:
+                        related[other] += 1
+
+        user.post_weights[post.id] = user.post_weights.get(post.id, 0.0) + weight
+
+    def recommend(self, user_id: int, content: str, platform: str = "general", limit: int = 10) -> List[str]:
+        """Recommend hashtags for a user's draft; returns an empty list when the index has no signal"""
+        words = tokenize_words(content)
+        existing = parse_hashtags(None, content)
+        candidates: Dict[str, float] = defaultdict(float)
+
+        with self._lock:
+            user = self.users.get(user_id)
+            if user is None:
+                return []
+            total_posts = max(len(user.post_weights), 1)
+            associations = user.word_tags.get(platform) or user.word_tags.get("general") or {}
+
+            for word in words:
+                documents = user.word_documents.get(word, 0)
+                if not documents or (total_posts > 20 and documents / total_posts > MAX_WORD_DOCUMENT_SHARE):
+                    continue
+                idf = math.log(1 + total_posts / documents)
+                for tag, score in associations.get(word, {}).items():
+                    candidates[tag] += score * idf
+
+            for tag in existing:
+                for other, count in user.cooccurrence.get(tag, {}).items():
+                    candidates[other] += count
+
+            if not candidates:
+                return []
+
+            popularity = user.tag_scores.get(platform) or user.tag_scores.get("general") or {}
+            ranked = sorted(
+                ((score + 0.1 * popularity.get(tag, 0.0), tag) for tag, score in candidates.items() if tag not in existing),
+                reverse=True
+            )
+
+        return [tag for _, tag in ranked[:limit]]
+
+    def top_hashtags(self, user_id: int, platform: str = "general", limit: int = 8) -> List[str]:
+        """A user's highest scoring hashtags on a platform"""
+        with self._lock:
+            user = self.users.get(user_id)
+            scores = user.tag_scores.get(platform) if user else None
+            if not scores:
+                return []
+            return [tag for tag, _ in sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]]
+
+hashtag_index = HashtagIndex()
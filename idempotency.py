@@ -0,0 +1,77 @@
+import hashlib
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+
+from models import IdempotencyKey
+
+IDEMPOTENCY_KEY_TTL_HOURS = float(os.getenv("IDEMPOTENCY_KEY_TTL_HOURS", "24"))
+# A key still in progress this long after it was claimed, without a post, belongs to a request that died
+IDEMPOTENCY_LEASE_SECONDS = float(os.getenv("IDEMPOTENCY_LEASE_SECONDS", "300"))
+MAX_KEY_LENGTH = 255
+
+def request_hash(*parts) -> str:
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+def prune_keys(db, ttl_hours: float = IDEMPOTENCY_KEY_TTL_HOURS) -> int:
+    cutoff = datetime.utcnow() - timedelta(hours=ttl_hours)
+    removed = db.query(IdempotencyKey).filter(IdempotencyKey.created_at < cutoff).delete(synchronize_session=False)
+    db.commit()
+    return removed
+
+def claim_key(db, user_id: int, key: str, fingerprint: str) -> Optional[IdempotencyKey]:
+    """Reserve `key` for a new request
+
+    Returns None when the caller now owns the key, or the earlier request's
+    record when the key was already used (possibly still in progress).
+    A key left in progress past the lease without creating a post has
+    expired and is taken over.
+    """
+    prune_keys(db)
+    db.add(IdempotencyKey(user_id=user_id, key=key, request_hash=fingerprint))
+    try:
+        db.commit()
+        return None
+    except IntegrityError:
+        # The unique (user_id, key) constraint makes concurrent claims race-free
+        db.rollback()
+
+    now = datetime.utcnow()
+    taken_over = db.execute(
+        update(IdempotencyKey)
+        .where(
+            IdempotencyKey.user_id == user_id, IdempotencyKey.key == key,
+            IdempotencyKey.status_code.is_(None), IdempotencyKey.post_id.is_(None),
+            IdempotencyKey.created_at < now - timedelta(seconds=IDEMPOTENCY_LEASE_SECONDS)
+        )
+        .values(request_hash=fingerprint, created_at=now)
+    ).rowcount
+    db.commit()
+    if taken_over:
+        return None
+    return db.query(IdempotencyKey).filter(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key).first()
+
+def attach_post(db, user_id: int, key: str, post_id: int):
+    """Record the post a key's request created, before publishing it"""
+    db.query(IdempotencyKey).filter(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key).update(
+        {IdempotencyKey.post_id: post_id}, synchronize_session=False
+    )
+    db.commit()
+
+def complete_key(db, user_id: int, key: str, post_id: int, status_code: int, body: bytes):
+    """Store the response that replays of `key` will receive"""
+    db.query(IdempotencyKey).filter(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key).update({
+        IdempotencyKey.post_id: post_id,
+        IdempotencyKey.status_code: status_code,
+        IdempotencyKey.response: body.decode("utf-8"),
+    }, synchronize_session=False)
+    db.commit()
+
+def release_key(db, user_id: int, key: str):
+    """Forget a key whose request failed before creating a post, so it can be retried"""
+    db.query(IdempotencyKey).filter(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key).delete(synchronize_session=False)
+    db.commit()
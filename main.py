@@ -1,13 +1,18 @@
 from fastapi import FastAPI, Request, Depends, HTTPException, status, UploadFile, File, Form
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import Response, HTMLResponse, RedirectResponse, StreamingResponse, PlainTextResponse, FileResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import func, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 import os
 import shutil
+import asyncio
+import logging
+import time
 from datetime import datetime, timedelta
 from typing import Optional, List
 import uuid
@@ -24,18 +29,50 @@ from typing import Dict, List
 print("🔑 Loading environment variables...")
 load_dotenv()
 
+# Structured logging through a background queue (LOG_LEVEL, LOG_FORMAT, LOG_SAMPLE_RATES)
+from structured_logging import setup_logging, RequestIdMiddleware
+setup_logging()
+logger = logging.getLogger("app")
+
 # Initialize OpenAI client
 print("🤖 Setting up OpenAI client...")
 openai.api_key = os.getenv("OPENAI_API_KEY")
 
 try:
     print("📦 Importing database modules...")
-    from database import get_db, init_db
-    from models import PostLog, User
+    from database import get_db, init_db, SessionLocal, engine
+    from models import PostLog, User, SocialAccount
     print("🔐 Importing authentication modules...")
     from auth import verify_password, get_password_hash, create_access_token, verify_token
     print("📱 Importing social media modules...")
     from social_platforms import SocialMediaManager
+    from metrics import (
+        MetricsMiddleware, instrument_engine, render_metrics, ai_request_duration,
+        cache_requests, dispatch_queue_depth, upload_bytes, upload_duration
+    )
+    from profiling import ProfilingMiddleware, is_admin, list_profiles, profile_path
+    from tracing import TracingMiddleware, instrument_sessions, start_span, chrome_trace
+    from hashtag_index import hashtag_index
+    from best_time import best_time_index
+    from post_search import search_posts
+    from media_pipeline import media_pipeline
+    from resumable_uploads import resumable_uploads
+    from media_serving import MediaFiles
+    from static_assets import StaticAssets, asset_url, asset_built
+    from compression import CompressionMiddleware
+    from fast_json import FastJSONResponse
+    from thumbnails import thumbnail_generator
+    from dispatcher import PostDispatcher, validate_post, publish_to_platforms, announce_status, STAT_BUCKETS, VALID_PLATFORMS
+    from pubsub import event_hub, user_channel
+    from idempotency import request_hash, claim_key, attach_post, complete_key, release_key, MAX_KEY_LENGTH
+    from accounts import account_store, describe as describe_account
+    from bulk_import import import_posts, detect_format
+    from export import stream_export, resolve_format, resolve_columns, EXPORT_MEDIA_TYPES, EXPORT_EXTENSIONS
+    from analytics_collector import AnalyticsCollector, simulate_analytics_data, compute_engagement_rate
+    from analytics_engine import load_metrics, summarize
+    from analytics_snapshots import RollupJob, record_snapshots, get_metric_series
+    from seo import calculate_seo_score, calculate_readability_score, extract_hashtags, suggest_keywords, get_seo_recommendations
+    from content_fingerprint import duplicate_index, simhash, to_signed, DUPLICATE_POLICY
     print("✅ All modules imported successfully")
 except ImportError as e:
     print(f"❌ Import error: {e}")
@@ -43,7 +80,10 @@ except ImportError as e:
     traceback.print_exc()
     raise
 
-app = FastAPI(title="Anonymous Creations Dashboard")
+app = FastAPI(title="Anonymous Creations Dashboard", default_response_class=FastJSONResponse)
+
+# On-demand request profiling for admins (added first so it runs inside the session middleware)
+app.add_middleware(ProfilingMiddleware)
 
 # Add session middleware with proper configuration
 app.add_middleware(
@@ -63,12 +103,31 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Mount static files
-app.mount("/static", StaticFiles(directory="static"), name="static")
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+# brotli/gzip for pages and API responses (COMPRESSION_MIN_SIZE)
+app.add_middleware(CompressionMiddleware)
+
+# Correlation ids for log records
+app.add_middleware(RequestIdMiddleware)
+
+# Server-sent event streams stay open for the whole session: neither timed nor traced
+STREAMING_PATHS = ("/api/events",)
+
+# Request latency metrics (second outermost, inside tracing, so they include the other middleware)
+app.add_middleware(MetricsMiddleware, exclude_paths=STREAMING_PATHS)
+instrument_engine(engine)
+
+# Sampled request traces (TRACE_SAMPLE_RATE, TRACE_EXPORTER); added last, so outermost
+app.add_middleware(TracingMiddleware, exclude_paths=STREAMING_PATHS)
+instrument_sessions(SessionLocal)
+
+# Mount static files (hashed build output from build_assets.py is cached immutably)
+app.mount("/static", StaticAssets(directory="static"), name="static")
+# Uploaded media: ranges, ETags and immutable caching of content-addressed names
+app.mount("/uploads", MediaFiles(directory="uploads"), name="uploads")
 
 # Templates
 templates = Jinja2Templates(directory="templates")
+templates.env.globals.update(asset_url=asset_url, asset_built=asset_built)
 
 # Initialize database
 init_db()
@@ -76,6 +135,16 @@ init_db()
 # Social media manager
 social_manager = SocialMediaManager()
 
+# Background dispatch of queued (bulk imported and scheduled) posts
+post_dispatcher = PostDispatcher(social_manager)
+dispatch_queue_depth.set_function(post_dispatcher.queue_depth)
+
+# Background analytics refresh for all posts
+analytics_collector = AnalyticsCollector()
+
+# Hourly/daily rollups and retention of the analytics history
+analytics_rollups = RollupJob()
+
 # Allowed file types and max size (10MB)
 ALLOWED_EXTENSIONS = {
     'image': ['jpg', 'jpeg', 'png', 'gif', 'webp'],
@@ -83,6 +152,8 @@ ALLOWED_EXTENSIONS = {
 }
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 
+SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+
 def get_current_user(request: Request, db: Session = Depends(get_db)):
     """Get current user from session"""
     try:
@@ -184,8 +255,58 @@ async def startup_event():
         except:
             pass
 
+    # Build the local hashtag, best-time and duplicate indexes from post history
+    try:
+        db = next(get_db())
+        hashtag_index.build(db)
+        best_time_index.build(db)
+        duplicate_index.build(db)
+    except Exception as e:
+        print(f"❌ Post history index build error: {e}")
+    finally:
+        try:
+            db.close()
+        except:
+            pass
+
+    # Start dispatching queued posts and refreshing analytics
+    post_dispatcher.start()
+    analytics_collector.start()
+    analytics_rollups.start()
+    thumbnail_generator.start()
+
     print("🎉 Application startup completed!")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background tasks"""
+    await post_dispatcher.stop()
+    await analytics_collector.stop()
+    await analytics_rollups.stop()
+    await thumbnail_generator.stop()
+    await event_hub.close()
+    await social_manager.close()
+    media_pipeline.shutdown()
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint():
+    """Prometheus scrape endpoint"""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+@app.get("/api/traces")
+async def download_traces(request: Request, db: Session = Depends(get_db)):
+    """Recent sampled traces in Chrome trace format (open in Perfetto or chrome://tracing); admins only"""
+    user = get_current_user(request, db)
+    if not user:
+        return FastJSONResponse(status_code=401, content={"success": False, "message": "Not authenticated"})
+    if not is_admin(request.session):
+        # Traces cover every user's requests
+        return FastJSONResponse(status_code=403, content={"success": False, "message": "Admin access required"})
+    return FastJSONResponse(
+        content=chrome_trace(),
+        headers={"Content-Disposition": 'attachment; filename="traces.json"'}
+    )
+
 @app.get("/", response_class=HTMLResponse)
 async def root(request: Request, db: Session = Depends(get_db)):
     """Redirect to dashboard or login"""
@@ -407,7 +528,7 @@ async def dashboard(request: Request, db: Session = Depends(get_db)):
             ).count()
             pending_posts = db.query(PostLog).filter(
                 PostLog.user_id == user.id, 
-                PostLog.status == "pending"
+                PostLog.status.in_(["pending", "queued"])
             ).count()
         except Exception as db_error:
             print(f"Database query error: {db_error}")
@@ -436,21 +557,21 @@ async def dashboard(request: Request, db: Session = Depends(get_db)):
             pass
         return RedirectResponse(url="/login?error=dashboard_error", status_code=302)
 
+def dashboard_stats(db: Session, user_id: int) -> dict:
+    """Post counts per dashboard counter, in one grouped query"""
+    stats = {"total": 0, "successful": 0, "failed": 0, "pending": 0}
+    rows = db.query(PostLog.status, func.count(PostLog.id)).filter(PostLog.user_id == user_id).group_by(PostLog.status).all()
+    for post_status, count in rows:
+        stats["total"] += count
+        if post_status in STAT_BUCKETS:
+            stats[STAT_BUCKETS[post_status]] += count
+    return stats
+
 @app.get("/dashboard-stats")
 async def get_dashboard_stats(user: User = Depends(require_auth), db: Session = Depends(get_db)):
     """Get dashboard statistics via API"""
     try:
-        total_posts = db.query(PostLog).filter(PostLog.user_id == user.id).count()
-        successful_posts = db.query(PostLog).filter(PostLog.user_id == user.id, PostLog.status == "completed").count()
-        failed_posts = db.query(PostLog).filter(PostLog.user_id == user.id, PostLog.status == "failed").count()
-        pending_posts = db.query(PostLog).filter(PostLog.user_id == user.id, PostLog.status == "pending").count()
-        
-        return {
-            "total": total_posts,
-            "successful": successful_posts,
-            "failed": failed_posts,
-            "pending": pending_posts
-        }
+        return dashboard_stats(db, user.id)
     except Exception as e:
         print(f"Dashboard stats error: {e}")
         return {
@@ -460,6 +581,38 @@ async def get_dashboard_stats(user: User = Depends(require_auth), db: Session =
             "pending": 0
         }
 
+@app.get("/api/events")
+async def stream_events(request: Request):
+    """Server-sent events for the current user: post progress, status changes and stat deltas"""
+    # Authenticate with a short-lived session rather than a dependency, which
+    # would hold a database connection for as long as the stream stays open
+    db = SessionLocal()
+    try:
+        user = get_current_user(request, db)
+        stats = dashboard_stats(db, user.id) if user else None
+    finally:
+        db.close()
+    if not user:
+        return FastJSONResponse(status_code=401, content={"success": False, "message": "Not authenticated"})
+
+    async def events():
+        async with event_hub.subscribe(user_channel(user.id)) as queue:
+            # Current counters first, so the client never needs to poll
+            yield f"event: stats\ndata: {json.dumps(stats)}\n\n"
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=SSE_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    # Keeps proxies from closing an idle connection
+                    yield ": heartbeat\n\n"
+                    continue
+                yield f"event: {message['event']}\ndata: {json.dumps(message['data'])}\n\n"
+
+    return StreamingResponse(
+        events(), media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.post("/post")
 async def create_post(
     request: Request,
@@ -470,33 +623,107 @@ async def create_post(
     seo_keywords: Optional[str] = Form(""),
     seo_title: Optional[str] = Form(""),
     seo_description: Optional[str] = Form(""),
+    allow_duplicate: bool = Form(False),
+    upload_id: Optional[str] = Form(None),
     user: User = Depends(require_auth),
     db: Session = Depends(get_db)
 ):
-    """Create and post content to selected platforms"""
+    """Create and post content to selected platforms
+
+    Media comes either inline (`media`, up to 10MB) or from a finished
+    resumable upload (`upload_id`). With an `Idempotency-Key` header a
+    resubmitted request gets the first request's response instead of
+    creating and publishing the post again.
+    """
+    args = (request, content, platforms, schedule_time, media, seo_keywords, seo_title,
+            seo_description, allow_duplicate, upload_id, user, db)
+    key = request.headers.get("idempotency-key", "").strip()
+    if not key:
+        return await _create_post(*args)
+    if len(key) > MAX_KEY_LENGTH:
+        return FastJSONResponse(status_code=400, content={"success": False, "message": f"Idempotency-Key longer than {MAX_KEY_LENGTH} characters"})
+
+    fingerprint = request_hash(
+        content, sorted(platforms), schedule_time, upload_id,
+        media.filename if media else None, media.size if media else None
+    )
+    previous = claim_key(db, user.id, key, fingerprint)
+    if previous is not None:
+        if previous.request_hash != fingerprint:
+            return FastJSONResponse(status_code=422, content={"success": False, "message": "Idempotency-Key was already used for a different request"})
+        if previous.status_code is None:
+            if previous.post_id is not None:
+                # Never publish twice: the post exists even if its request never finished
+                return FastJSONResponse(status_code=409, content={"success": False, "message": f"A request with this Idempotency-Key already created post {previous.post_id}", "post_id": previous.post_id})
+            return FastJSONResponse(status_code=409, content={"success": False, "message": "A request with this Idempotency-Key is still in progress"})
+        logger.info("Replaying response for idempotency key", extra={"post_id": previous.post_id})
+        return Response(content=previous.response, status_code=previous.status_code,
+                        media_type="application/json", headers={"Idempotent-Replayed": "true"})
+
+    request.state.idempotency_key = key
+    response = None
     try:
-        # Validate platforms - expanded list
-        valid_platforms = [
-            'telegram', 'instagram', 'youtube', 'tiktok', 'facebook',
-            'twitter', 'linkedin', 'snapchat', 'pinterest', 'reddit',
-            'discord', 'whatsapp', 'threads', 'medium', 'tumblr'
-        ]
-        platforms = [p for p in platforms if p in valid_platforms]
-
-        if not platforms:
-            return JSONResponse(
+        response = await _create_post(*args)
+    finally:
+        post_id = getattr(request.state, "post_id", None)
+        if post_id is None:
+            # Nothing was created or published (validation error, duplicate...): the key may be reused
+            release_key(db, user.id, key)
+        elif response is not None:
+            complete_key(db, user.id, key, post_id, response.status_code, response.body)
+    return response
+
+async def _create_post(request, content, platforms, schedule_time, media, seo_keywords, seo_title,
+                       seo_description, allow_duplicate, upload_id, user, db):
+    try:
+        # Validate content, platforms and schedule
+        try:
+            platforms, scheduled_for = validate_post(content, platforms, schedule_time)
+        except ValueError as e:
+            return FastJSONResponse(
                 status_code=400,
-                content={"success": False, "message": "At least one platform must be selected"}
+                content={"success": False, "message": str(e)}
             )
 
+        # Check for near-duplicates of the user's recent posts on the same platforms
+        content_fingerprint = simhash(content)
+        duplicates = []
+        if DUPLICATE_POLICY != "off":
+            duplicates = duplicate_index.find_duplicates(user.id, platforms, content_fingerprint)
+            if duplicates and DUPLICATE_POLICY == "block" and not allow_duplicate:
+                return FastJSONResponse(
+                    status_code=409,
+                    content={
+                        "success": False,
+                        "message": "This content is nearly identical to a recent post on the same platforms",
+                        "duplicates": duplicates
+                    }
+                )
+
         # Handle media upload with improved error handling
         file_path = None
         file_type = None
         full_file_path = None
 
-        if media and media.filename and media.filename.strip() and media.size and media.size > 0:
+        if upload_id:
+            upload = resumable_uploads.get(upload_id, user.id)
+            if not upload:
+                return FastJSONResponse(status_code=404, content={"success": False, "message": "Upload not found or expired"})
+            try:
+                upload_started = time.perf_counter()
+                with start_span("upload.assemble", file_type=upload["file_type"], bytes=upload["size"]):
+                    file_path = await run_in_threadpool(resumable_uploads.assemble, upload)
+            except ValueError as e:
+                return FastJSONResponse(status_code=400, content={"success": False, "message": str(e)})
+            file_type = upload["file_type"]
+            full_file_path = os.path.abspath(file_path)
+            upload_bytes.observe(upload["size"], file_type=file_type)
+            upload_duration.observe(time.perf_counter() - upload_started, file_type=file_type)
+            logger.info("Media assembled: %s (%d bytes, %s)", file_path, upload["size"], file_type)
+
+        elif media and media.filename and media.filename.strip() and media.size and media.size > 0:
             try:
-                print(f"Processing media upload: {media.filename}, size: {media.size}")
+                logger.debug("Processing media upload %s (%d bytes)", media.filename, media.size)
 
                 # Validate file type first
                 file_ext = media.filename.split('.')[-1].lower()
@@ -506,24 +733,25 @@ async def create_post(
                 elif file_ext in ALLOWED_EXTENSIONS['video']:
                     file_type = "video"
                 else:
-                    return JSONResponse(
+                    return FastJSONResponse(
                         status_code=400,
                         content={"success": False, "message": f"File type .{file_ext} not supported. Use: {', '.join(ALLOWED_EXTENSIONS['image'] + ALLOWED_EXTENSIONS['video'])}"}
                     )
 
                 # Check file size
                 if media.size > MAX_FILE_SIZE:
-                    return JSONResponse(
+                    return FastJSONResponse(
                         status_code=400,
                         content={"success": False, "message": f"File size ({media.size} bytes) exceeds 10MB limit"}
                     )
 
                 # Read file content first to validate
+                upload_started = time.perf_counter()
                 media.file.seek(0)  # Reset file pointer
                 file_content = await media.read()
 
                 if len(file_content) == 0:
-                    return JSONResponse(
+                    return FastJSONResponse(
                         status_code=400,
                         content={"success": False, "message": "Uploaded file is empty"}
                     )
@@ -537,8 +765,9 @@ async def create_post(
                 os.makedirs("uploads", exist_ok=True)
 
                 # Save file with proper binary mode
-                with open(full_file_path, "wb") as buffer:
-                    buffer.write(file_content)
+                with start_span("upload.write", file_type=file_type, bytes=len(file_content)):
+                    with open(full_file_path, "wb") as buffer:
+                        buffer.write(file_content)
 
                 # Verify file was saved correctly
                 if not os.path.exists(full_file_path):
@@ -548,10 +777,12 @@ async def create_post(
                 if saved_size == 0:
                     raise Exception("Saved file is empty")
 
-                print(f"Media saved successfully: {full_file_path} ({saved_size} bytes, type: {file_type})")
+                upload_bytes.observe(saved_size, file_type=file_type)
+                upload_duration.observe(time.perf_counter() - upload_started, file_type=file_type)
+                logger.info("Media saved: %s (%d bytes, %s)", file_path, saved_size, file_type)
 
             except Exception as e:
-                print(f"Media upload error: {e}")
+                logger.exception("Media upload error")
                 # Clean up any partial file
                 if full_file_path and os.path.exists(full_file_path):
                     try:
@@ -562,17 +793,21 @@ async def create_post(
                     file_type = None
                     full_file_path = None
 
-                return JSONResponse(
+                return FastJSONResponse(
                     status_code=500,
                     content={"success": False, "message": f"Media upload failed: {str(e)}"}
                 )
         else:
-            print("No media file provided or file is empty")
+            logger.debug("No media file provided")
 
         # Calculate SEO metrics
-        seo_score = calculate_seo_score(content, seo_keywords, seo_title, seo_description)
-        readability_score = calculate_readability_score(content)
-        hashtags = extract_hashtags(content)
+        with start_span("seo.analyze", content_length=len(content)):
+            seo_score = calculate_seo_score(content, seo_keywords, seo_title, seo_description)
+            readability_score = calculate_readability_score(content)
+            hashtags = extract_hashtags(content)
+
+        # Posts scheduled for later are queued for the dispatcher instead of published now
+        scheduled = scheduled_for is not None and scheduled_for > datetime.utcnow()
 
         # Create post log
         post_log = PostLog(
@@ -580,74 +815,198 @@ async def create_post(
             platforms=",".join(platforms),
             file_path=file_path,
             file_type=file_type,
-            scheduled_for=datetime.fromisoformat(schedule_time) if schedule_time else None,
+            scheduled_for=scheduled_for,
             user_id=user.id,
-            status="pending",
+            status="queued" if scheduled else "pending",
+            claimed_at=None if scheduled else datetime.utcnow(),
             seo_keywords=seo_keywords,
             seo_title=seo_title,
             seo_description=seo_description,
             hashtags=hashtags,
             seo_score=seo_score,
-            readability_score=readability_score
+            readability_score=readability_score,
+            content_simhash=to_signed(content_fingerprint) if content_fingerprint is not None else None
         )
         db.add(post_log)
         db.commit()
         db.refresh(post_log)
+        request.state.post_id = post_log.id
+        key = getattr(request.state, "idempotency_key", None)
+        if key:
+            attach_post(db, user.id, key, post_log.id)
+        if scheduled:
+            # Published posts are indexed once their outcome is known (see below)
+            duplicate_index.add(post_log.id, user.id, post_log.platforms, content_fingerprint, post_log.created_at)
+        thumbnail_generator.schedule(post_log.id, file_path, file_type)
+        await announce_status(user.id, post_log.id, post_log.status)
+
+        if scheduled:
+            logger.info("Post %s scheduled for %s UTC", post_log.id, scheduled_for.isoformat(), extra={"post_id": post_log.id})
+            return FastJSONResponse(content={
+                "success": True,
+                "scheduled": True,
+                "scheduled_for": scheduled_for.isoformat(),
+                "message": f"Post scheduled for {scheduled_for.strftime('%Y-%m-%d %H:%M')} UTC",
+                "post_id": post_log.id,
+                "media_included": bool(full_file_path),
+                "duplicates": duplicates
+            })
 
-        print(f"Starting to post to platforms: {platforms}")
-        print(f"Content: {content[:50]}...")
-        print(f"Media: {full_file_path} ({file_type})" if full_file_path else "No media")
+        logger.info(
+            "Publishing post %s to %s", post_log.id, ",".join(platforms),
+            extra={"post_id": post_log.id, "content_length": len(content), "file_type": file_type}
+        )
 
         # Post to platforms with full file path
-        results = {}
-        overall_success = True
-
-        for platform in platforms:
-            try:
-                print(f"Posting to {platform}...")
-
-                # Use the social manager method based on platform
-                if hasattr(social_manager, f'post_to_{platform}'):
-                    method = getattr(social_manager, f'post_to_{platform}')
-                    success, message = await method(content, full_file_path, file_type)
-                else:
-                    success, message = False, f"Platform {platform} not implemented yet"
-
-                print(f"{platform} result: {success} - {message}")
-
-                results[platform] = {"success": success, "message": message}
-                if not success:
-                    overall_success = False
-
-            except Exception as e:
-                error_msg = f"Error posting to {platform}: {str(e)}"
-                print(error_msg)
-                results[platform] = {"success": False, "message": str(e)}
-                overall_success = False
+        results, overall_success = await publish_to_platforms(
+            social_manager, content, full_file_path, file_type, platforms, post_id=post_log.id, user_id=user.id
+        )
 
         # Update post log
         post_log.status = "completed" if overall_success else "failed"
         post_log.results = json.dumps(results)
         post_log.completed_at = datetime.utcnow()
         db.commit()
+        hashtag_index.update(post_log)
+        duplicate_index.settle(post_log)
+        await announce_status(user.id, post_log.id, post_log.status, previous="pending")
 
-        print(f"Post processing completed. Overall success: {overall_success}")
+        logger.info("Post %s completed, success: %s", post_log.id, overall_success, extra={"post_id": post_log.id})
 
-        return JSONResponse(content={
+        return FastJSONResponse(content={
             "success": overall_success,
             "results": results,
             "message": "Post published successfully!" if overall_success else "Some platforms failed",
             "post_id": post_log.id,
-            "media_included": bool(full_file_path)
+            "media_included": bool(full_file_path),
+            "duplicates": duplicates
         })
 
     except Exception as e:
-        print(f"Post creation error: {e}")
-        return JSONResponse(
+        logger.exception("Post creation error")
+        return FastJSONResponse(
             status_code=500,
             content={"success": False, "message": f"Internal server error: {str(e)}"}
         )
 
+@app.post("/api/uploads", status_code=201)
+async def create_upload(
+    filename: str = Form(...),
+    size: int = Form(...),
+    user: User = Depends(require_auth)
+):
+    """Start a resumable upload; send the chunks with PATCH /api/uploads/{upload_id}"""
+    file_ext = filename.rsplit('.', 1)[-1].lower()
+    if file_ext in ALLOWED_EXTENSIONS['image']:
+        file_type = "image"
+    elif file_ext in ALLOWED_EXTENSIONS['video']:
+        file_type = "video"
+    else:
+        return FastJSONResponse(status_code=400, content={"success": False, "message": f"File type .{file_ext} not supported"})
+    if file_type == "image" and size > MAX_FILE_SIZE:
+        return FastJSONResponse(status_code=400, content={"success": False, "message": f"File size ({size} bytes) exceeds 10MB limit"})
+    try:
+        upload = await run_in_threadpool(resumable_uploads.create, user.id, filename, size, file_type, file_ext)
+    except ValueError as e:
+        return FastJSONResponse(status_code=400, content={"success": False, "message": str(e)})
+    return FastJSONResponse(status_code=201, content=upload, headers={"Location": f"/api/uploads/{upload['upload_id']}"})
+
+@app.get("/api/uploads/{upload_id}")
+async def upload_status(upload_id: str, user: User = Depends(require_auth)):
+    """Offset query: which chunks of an upload still need to be sent"""
+    upload = resumable_uploads.get(upload_id, user.id)
+    if not upload:
+        return FastJSONResponse(status_code=404, content={"success": False, "message": "Upload not found or expired"})
+    status_ = await run_in_threadpool(resumable_uploads.status, upload)
+    return FastJSONResponse(content=status_, headers={"Upload-Offset": str(status_["offset"]), "Upload-Length": str(status_["size"])})
+
+@app.patch("/api/uploads/{upload_id}")
+async def upload_chunk(upload_id: str, request: Request, user: User = Depends(require_auth)):
+    """Store one chunk; its byte offset goes in the Upload-Offset header"""
+    upload = resumable_uploads.get(upload_id, user.id)
+    if not upload:
+        return FastJSONResponse(status_code=404, content={"success": False, "message": "Upload not found or expired"})
+    offset = request.headers.get("upload-offset", "")
+    if not offset.isdigit():
+        return FastJSONResponse(status_code=400, content={"success": False, "message": "Upload-Offset header required"})
+    try:
+        status_ = await resumable_uploads.write_chunk(upload, int(offset), request.stream())
+    except ValueError as e:
+        return FastJSONResponse(status_code=400, content={"success": False, "message": str(e)})
+    return FastJSONResponse(content=status_, headers={"Upload-Offset": str(status_["offset"])})
+
+@app.delete("/api/uploads/{upload_id}")
+async def cancel_upload(upload_id: str, user: User = Depends(require_auth)):
+    """Abandon an upload and discard its chunks"""
+    if not resumable_uploads.get(upload_id, user.id):
+        return FastJSONResponse(status_code=404, content={"success": False, "message": "Upload not found or expired"})
+    await run_in_threadpool(resumable_uploads.delete, upload_id)
+    return {"success": True}
+
+@app.post("/api/bulk-import")
+async def bulk_import_posts(
+    file: UploadFile = File(...),
+    file_format: Optional[str] = Form(None),
+    user: User = Depends(require_auth)
+):
+    """Import posts from a CSV or JSONL file and queue them for dispatch"""
+    try:
+        file_format = file_format or detect_format(file.filename)
+        if file_format not in ("csv", "jsonl"):
+            return FastJSONResponse(status_code=400, content={"success": False, "message": "Format must be csv or jsonl"})
+
+        def run_import():
+            db = SessionLocal()
+            try:
+                return import_posts(db, user.id, file.file, file_format)
+            finally:
+                db.close()
+
+        report = await run_in_threadpool(run_import)
+        post_dispatcher.wake()
+        if report["imported"]:
+            await event_hub.publish(user_channel(user.id), "stats.delta", {"total": report["imported"], "pending": report["imported"]})
+
+        logger.info("Bulk import: %d imported, %d failed in %ss", report["imported"], report["failed"], report["duration_seconds"])
+        return FastJSONResponse(content={"success": report["failed"] == 0, **report})
+    except Exception as e:
+        logger.exception("Bulk import error")
+        return FastJSONResponse(
+            status_code=500,
+            content={"success": False, "message": f"Bulk import failed: {str(e)}"}
+        )
+
+@app.get("/api/export")
+async def export_posts(
+    format: Optional[str] = None,
+    columns: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    user: User = Depends(require_auth)
+):
+    """Stream the user's posts and metrics as Parquet, Arrow IPC or NDJSON"""
+    try:
+        file_format = resolve_format(format)
+        selected = resolve_columns(columns.split(",") if columns else None)
+        start = datetime.fromisoformat(date_from) if date_from else None
+        end = datetime.fromisoformat(date_to) if date_to else None
+    except ValueError as e:
+        return FastJSONResponse(status_code=400, content={"error": str(e)})
+
+    def generate():
+        db = SessionLocal()
+        try:
+            yield from stream_export(db, user.id, file_format, selected, start, end)
+        finally:
+            db.close()
+
+    filename = f"posts-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}.{EXPORT_EXTENSIONS[file_format]}"
+    return StreamingResponse(
+        generate(),
+        media_type=EXPORT_MEDIA_TYPES[file_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
 @app.get("/logs", response_class=HTMLResponse)
 async def logs_page(
     request: Request,
@@ -709,7 +1068,7 @@ async def get_logs(
         return {"logs": logs_data}
     except Exception as e:
         print(f"API logs error: {e}")
-        return JSONResponse(status_code=500, content={"error": "Internal server error"})
+        return FastJSONResponse(status_code=500, content={"error": "Internal server error"})
 
 @app.get("/api/logs/{log_id}")
 async def get_log_details(
@@ -734,11 +1093,200 @@ async def get_log_details(
             "results": log.results,
             "file_path": log.file_path,
             "file_type": log.file_type,
+            "thumbnail_path": log.thumbnail_path,
             "scheduled_for": log.scheduled_for.isoformat() if log.scheduled_for else None
         }
     except Exception as e:
         print(f"API log details error: {e}")
-        return JSONResponse(status_code=500, content={"error": "Internal server error"})
+        return FastJSONResponse(status_code=500, content={"error": "Internal server error"})
+
+@app.post("/api/posts/{post_id}/retry")
+async def retry_failed_platforms(
+    post_id: int,
+    platforms: Optional[List[str]] = Form(None),
+    user: User = Depends(require_auth),
+    db: Session = Depends(get_db)
+):
+    """Publish a failed post again, only to the platforms (and accounts) that failed
+
+    `platforms` narrows the retry further. The new results are merged into
+    the post's existing ones.
+    """
+    claimed = 0
+    try:
+        post = db.query(PostLog).filter(PostLog.id == post_id, PostLog.user_id == user.id).first()
+        if not post:
+            return FastJSONResponse(status_code=404, content={"success": False, "message": "Post not found"})
+        if post.status != "failed":
+            return FastJSONResponse(status_code=409, content={"success": False, "message": f"Only failed posts can be retried (status: {post.status})"})
+
+        results = json.loads(post.results) if post.results else {}
+        failed = [p for p in post.platforms.split(",") if p and not results.get(p, {}).get("success")]
+        if platforms:
+            failed = [p for p in failed if p in platforms]
+        if not failed:
+            return FastJSONResponse(status_code=400, content={"success": False, "message": "No failed platforms to retry"})
+
+        # Claim the post so concurrent retries cannot publish twice
+        claimed = db.execute(
+            update(PostLog)
+            .where(PostLog.id == post_id, PostLog.status == "failed")
+            .values(status="pending", claimed_at=datetime.utcnow())
+        ).rowcount
+        db.commit()
+        if not claimed:
+            return FastJSONResponse(status_code=409, content={"success": False, "message": "Post is already being retried"})
+        db.refresh(post)
+        await announce_status(user.id, post.id, "pending", previous="failed")
+
+        logger.info("Retrying post %s on %s", post.id, ",".join(failed), extra={"post_id": post.id})
+        file_path = os.path.abspath(post.file_path) if post.file_path else None
+        retried, _ = await publish_to_platforms(
+            social_manager, post.content, file_path, post.file_type, failed, post_id=post.id, user_id=user.id, previous=results
+        )
+
+        results.update(retried)
+        overall_success = all(results.get(p, {}).get("success") for p in post.platforms.split(",") if p)
+        post.status = "completed" if overall_success else "failed"
+        post.results = json.dumps(results)
+        post.completed_at = datetime.utcnow()
+        db.commit()
+        hashtag_index.update(post)
+        duplicate_index.settle(post)
+        await announce_status(user.id, post.id, post.status, previous="pending")
+
+        return FastJSONResponse(content={
+            "success": overall_success,
+            "retried": failed,
+            "results": results,
+            "message": "Post published successfully!" if overall_success else "Some platforms failed",
+            "post_id": post.id
+        })
+    except Exception as e:
+        logger.exception("Post retry error")
+        if claimed:
+            # Leave the post retryable rather than stuck in pending
+            db.rollback()
+            db.execute(update(PostLog).where(PostLog.id == post_id, PostLog.status == "pending").values(status="failed"))
+            db.commit()
+        return FastJSONResponse(status_code=500, content={"success": False, "message": f"Internal server error: {str(e)}"})
+
+@app.get("/api/search")
+async def search_logs(
+    q: str,
+    platform: Optional[str] = None,
+    status: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    limit: int = 20,
+    offset: int = 0,
+    user: User = Depends(require_auth),
+    db: Session = Depends(get_db)
+):
+    """Full-text search over the user's post history"""
+    try:
+        try:
+            start = datetime.fromisoformat(date_from) if date_from else None
+            end = datetime.fromisoformat(date_to) if date_to else None
+        except ValueError:
+            return FastJSONResponse(status_code=400, content={"error": "Dates must be in ISO format"})
+
+        results = search_posts(
+            db,
+            user.id,
+            q,
+            platform=platform,
+            status=status,
+            date_from=start,
+            date_to=end,
+            limit=max(1, min(limit, 100)),
+            offset=max(offset, 0)
+        )
+        return {"query": q, "results": results}
+    except Exception as e:
+        print(f"Search error: {e}")
+        return FastJSONResponse(status_code=500, content={"error": "Search failed"})
+
+@app.get("/api/best-times")
+async def get_best_times(
+    platforms: Optional[str] = None,
+    count: int = 3,
+    user: User = Depends(require_auth)
+):
+    """Best upcoming posting slots from the user's engagement history"""
+    try:
+        selected = [p for p in (platforms or "").split(",") if p in VALID_PLATFORMS]
+        return FastJSONResponse(best_time_index.suggest(user.id, selected, max(1, min(count, 24))))
+    except Exception as e:
+        print(f"Best times error: {e}")
+        return FastJSONResponse(status_code=500, content={"error": "Failed to suggest posting times"})
+
+@app.get("/api/platforms")
+async def platform_capabilities(user: User = Depends(require_auth)):
+    """Media types, length and size limits, rate limits and live/test mode of each platform"""
+    return FastJSONResponse(social_manager.capabilities())
+
+@app.get("/api/accounts")
+async def list_accounts(user: User = Depends(require_auth), db: Session = Depends(get_db)):
+    """The user's stored accounts, and the credentials each platform's accounts take"""
+    accounts = db.query(SocialAccount).filter(SocialAccount.user_id == user.id).order_by(SocialAccount.platform, SocialAccount.name).all()
+    return {
+        "accounts": [describe_account(account) for account in accounts],
+        "credentials": {
+            name: {"fields": list(adapter.credentials), "required": list(adapter.required)}
+            for name, adapter in social_manager.adapters.items()
+        }
+    }
+
+@app.post("/api/accounts", status_code=201)
+async def create_account(
+    platform: str = Form(...),
+    name: str = Form(...),
+    credentials: str = Form(...),
+    user: User = Depends(require_auth),
+    db: Session = Depends(get_db)
+):
+    """Store an account (channel, page...) to publish to; `credentials` is a JSON object"""
+    try:
+        account = account_store.create(db, user.id, platform, name, json.loads(credentials))
+    except ValueError as e:
+        # json.JSONDecodeError is a ValueError too
+        return FastJSONResponse(status_code=400, content={"success": False, "message": str(e)})
+    except IntegrityError:
+        db.rollback()
+        return FastJSONResponse(status_code=409, content={"success": False, "message": f"A {platform} account named {name} already exists"})
+    return FastJSONResponse(status_code=201, content=describe_account(account))
+
+@app.patch("/api/accounts/{account_id}")
+async def update_account(
+    account_id: int,
+    name: Optional[str] = Form(None),
+    credentials: Optional[str] = Form(None),
+    enabled: Optional[bool] = Form(None),
+    user: User = Depends(require_auth),
+    db: Session = Depends(get_db)
+):
+    """Rename, enable/disable or replace the credentials of an account"""
+    account = db.query(SocialAccount).filter(SocialAccount.id == account_id, SocialAccount.user_id == user.id).first()
+    if not account:
+        return FastJSONResponse(status_code=404, content={"success": False, "message": "Account not found"})
+    try:
+        account = account_store.update(db, account, name, json.loads(credentials) if credentials else None, enabled)
+    except ValueError as e:
+        return FastJSONResponse(status_code=400, content={"success": False, "message": str(e)})
+    except IntegrityError:
+        db.rollback()
+        return FastJSONResponse(status_code=409, content={"success": False, "message": f"A {account.platform} account named {name} already exists"})
+    return describe_account(account)
+
+@app.delete("/api/accounts/{account_id}")
+async def delete_account(account_id: int, user: User = Depends(require_auth), db: Session = Depends(get_db)):
+    """Forget an account and its credentials"""
+    account = db.query(SocialAccount).filter(SocialAccount.id == account_id, SocialAccount.user_id == user.id).first()
+    if not account:
+        return FastJSONResponse(status_code=404, content={"success": False, "message": "Account not found"})
+    account_store.delete(db, account)
+    return {"success": True}
 
 @app.get("/settings", response_class=HTMLResponse)
 async def settings_page(
@@ -763,133 +1311,26 @@ async def settings_page(
                 "request": request,
                 "user": user,
                 "total_posts": total_posts,
-                "success_rate": success_rate
+                "success_rate": success_rate,
+                "profiles": list_profiles() if is_admin(request.session) else None,
+                "accounts": db.query(SocialAccount).filter(SocialAccount.user_id == user.id).order_by(SocialAccount.platform, SocialAccount.name).all(),
+                "account_fields": {name: list(adapter.credentials) for name, adapter in social_manager.adapters.items()},
+                "telegram_channel": social_manager.get("telegram").chat_id
             }
         )
     except Exception as e:
         print(f"Settings page error: {e}")
         return HTMLResponse(content="<h1>Settings Error</h1><p>Unable to load settings.</p>", status_code=500)
 
-# SEO and Analytics helper functions
-def calculate_seo_score(content: str, keywords: str = "", title: str = "", description: str = "") -> float:
-    """Calculate SEO score based on content optimization"""
-    score = 0.0
-
-    # Content length score (5-10 points)
-    content_length = len(content.split())
-    if 50 <= content_length <= 300:
-        score += 10
-    elif 20 <= content_length < 50 or 300 < content_length <= 500:
-        score += 7
-    else:
-        score += 3
-
-    # Keywords usage (10-20 points)
-    if keywords:
-        keyword_list = [k.strip().lower() for k in keywords.split(',')]
-        content_lower = content.lower()
-        keyword_mentions = sum(content_lower.count(keyword) for keyword in keyword_list)
-        if keyword_mentions >= 3:
-            score += 20
-        elif keyword_mentions >= 1:
-            score += 15
-        else:
-            score += 5
-
-    # Title optimization (5-15 points)
-    if title:
-        title_length = len(title)
-        if 30 <= title_length <= 60:
-            score += 15
-        elif 20 <= title_length < 30 or 60 < title_length <= 80:
-            score += 10
-        else:
-            score += 5
-
-    # Description optimization (5-15 points)
-    if description:
-        desc_length = len(description)
-        if 120 <= desc_length <= 160:
-            score += 15
-        elif 80 <= desc_length < 120 or 160 < desc_length <= 200:
-            score += 10
-        else:
-            score += 5
-
-    # Hashtag presence (5-10 points)
-    hashtag_count = len(re.findall(r'#\w+', content))
-    if 3 <= hashtag_count <= 8:
-        score += 10
-    elif 1 <= hashtag_count < 3:
-        score += 7
-    else:
-        score += 3
-
-    # Readability (5-10 points)
-    readability = calculate_readability_score(content)
-    if readability >= 70:
-        score += 10
-    elif readability >= 50:
-        score += 7
-    else:
-        score += 5
-
-    return min(score, 100)
-
-def calculate_readability_score(content: str) -> float:
-    """Calculate readability score using simplified Flesch Reading Ease"""
-    sentences = len(re.split(r'[.!?]+', content))
-    words = len(content.split())
-
-    if sentences == 0 or words == 0:
-        return 0
-
-    # Simplified calculation
-    avg_sentence_length = words / sentences
-
-    # Simple readability score (higher is better)
-    if avg_sentence_length <= 15:
-        return 90  # Very easy
-    elif avg_sentence_length <= 20:
-        return 75  # Easy
-    elif avg_sentence_length <= 25:
-        return 60  # Fairly easy
-    else:
-        return 40  # Difficult
-
-def extract_hashtags(content: str) -> str:
-    """Extract hashtags from content"""
-    hashtags = re.findall(r'#\w+', content)
-    return ', '.join(hashtags)
-
-def suggest_keywords(content: str) -> str:
-    """Suggest keywords based on content analysis"""
-    # Remove common stop words and get meaningful words
-    stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those'}
-
-    words = re.findall(r'\b[a-zA-Z]{3,}\b', content.lower())
-    meaningful_words = [word for word in words if word not in stop_words]
-
-    # Get most common words
-    word_counts = Counter(meaningful_words)
-    top_keywords = [word for word, count in word_counts.most_common(5)]
-
-    return ', '.join(top_keywords[:5])
-
-def simulate_analytics_data(post_id: int) -> dict:
-    """Simulate analytics data for demonstration"""
-    # In a real application, this would fetch data from social media APIs
-    base_engagement = random.randint(10, 1000)
-
-    return {
-        'views': base_engagement * random.randint(5, 20),
-        'likes': base_engagement + random.randint(0, base_engagement // 2),
-        'shares': random.randint(0, base_engagement // 4),
-        'comments': random.randint(0, base_engagement // 6),
-        'clicks': random.randint(0, base_engagement // 3),
-        'reach': base_engagement * random.randint(2, 8),
-        'impressions': base_engagement * random.randint(8, 25)
-    }
+@app.get("/api/profiles/{name}")
+async def download_profile(name: str, request: Request, user: User = Depends(require_auth)):
+    """Download a stored request profile (admins only)"""
+    if not is_admin(request.session):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
+    path = profile_path(name)
+    if not path:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    return FileResponse(path, media_type="application/octet-stream", filename=name)
 
 @app.get("/analytics", response_class=HTMLResponse)
 async def analytics_page(
@@ -899,68 +1340,34 @@ async def analytics_page(
 ):
     """Analytics dashboard page"""
     try:
-        # Get all posts for analytics with error handling
-        posts = []
-        try:
-            posts = db.query(PostLog).filter(PostLog.user_id == user.id).order_by(PostLog.created_at.desc()).all()
-        except Exception as db_error:
-            print(f"Database error in analytics: {db_error}")
-            posts = []
-
-        # Calculate overall analytics with safe defaults
-        total_views = sum(getattr(post, 'views', 0) or 0 for post in posts)
-        total_likes = sum(getattr(post, 'likes', 0) or 0 for post in posts)
-        total_shares = sum(getattr(post, 'shares', 0) or 0 for post in posts)
-        total_comments = sum(getattr(post, 'comments', 0) or 0 for post in posts)
-        total_clicks = sum(getattr(post, 'clicks', 0) or 0 for post in posts)
-        total_reach = sum(getattr(post, 'reach', 0) or 0 for post in posts)
-        total_impressions = sum(getattr(post, 'impressions', 0) or 0 for post in posts)
-
-        # Calculate engagement rate
-        avg_engagement_rate = sum(getattr(post, 'engagement_rate', 0) or 0 for post in posts) / len(posts) if posts else 0
+        # Load every metric column in one query and aggregate with NumPy
+        summary = summarize(load_metrics(db, user.id))
+        totals = summary['totals']
 
         # Get top performing posts
-        top_posts = sorted(posts, key=lambda x: (getattr(x, 'views', 0) or 0) + (getattr(x, 'likes', 0) or 0) + (getattr(x, 'shares', 0) or 0), reverse=True)[:5]
-
-        # Platform performance
-        platform_stats = {}
-        for post in posts:
-            try:
-                platforms = post.platforms.split(',') if post.platforms else []
-                for platform in platforms:
-                    platform = platform.strip()
-                    if platform not in platform_stats:
-                        platform_stats[platform] = {'posts': 0, 'views': 0, 'likes': 0, 'shares': 0}
-                    platform_stats[platform]['posts'] += 1
-                    platform_stats[platform]['views'] += getattr(post, 'views', 0) or 0
-                    platform_stats[platform]['likes'] += getattr(post, 'likes', 0) or 0
-                    platform_stats[platform]['shares'] += getattr(post, 'shares', 0) or 0
-            except Exception as platform_error:
-                print(f"Platform stats error: {platform_error}")
-                continue
-
-        # SEO performance
-        avg_seo_score = sum(getattr(post, 'seo_score', 0) or 0 for post in posts) / len(posts) if posts else 0
-        avg_readability = sum(getattr(post, 'readability_score', 0) or 0 for post in posts) / len(posts) if posts else 0
+        top_ids = summary['top_post_ids']
+        top_posts = db.query(PostLog).filter(PostLog.id.in_(top_ids)).all() if top_ids else []
+        top_posts.sort(key=lambda post: top_ids.index(post.id))
 
         return templates.TemplateResponse(
             "analytics.html",
             {
                 "request": request,
                 "user": user,
-                "posts": posts,
-                "total_views": total_views,
-                "total_likes": total_likes,
-                "total_shares": total_shares,
-                "total_comments": total_comments,
-                "total_clicks": total_clicks,
-                "total_reach": total_reach,
-                "total_impressions": total_impressions,
-                "avg_engagement_rate": round(avg_engagement_rate, 2),
+                "post_count": summary['post_count'],
+                "total_views": totals['views'],
+                "total_likes": totals['likes'],
+                "total_shares": totals['shares'],
+                "total_comments": totals['comments'],
+                "total_clicks": totals['clicks'],
+                "total_reach": totals['reach'],
+                "total_impressions": totals['impressions'],
+                "avg_engagement_rate": round(summary['avg_engagement_rate'], 2),
+                "engagement_percentiles": {k: round(v, 2) for k, v in summary['engagement_percentiles'].items()},
                 "top_posts": top_posts,
-                "platform_stats": platform_stats,
-                "avg_seo_score": round(avg_seo_score, 1),
-                "avg_readability": round(avg_readability, 1)
+                "platform_stats": summary['platform_stats'],
+                "avg_seo_score": round(summary['avg_seo_score'], 1),
+                "avg_readability": round(summary['avg_readability'], 1)
             }
         )
     except Exception as e:
@@ -972,7 +1379,7 @@ async def analytics_page(
             {
                 "request": request,
                 "user": user,
-                "posts": [],
+                "post_count": 0,
                 "total_views": 0,
                 "total_likes": 0,
                 "total_shares": 0,
@@ -1005,7 +1412,7 @@ async def analyze_seo(
         suggested_keywords = suggest_keywords(content)
         hashtags = extract_hashtags(content)
 
-        return JSONResponse({
+        return FastJSONResponse({
             "seo_score": round(seo_score, 1),
             "readability_score": round(readability_score, 1),
             "suggested_keywords": suggested_keywords,
@@ -1014,7 +1421,7 @@ async def analyze_seo(
         })
     except Exception as e:
         print(f"SEO analysis error: {e}")
-        return JSONResponse({"error": "SEO analysis failed"}, status_code=500)
+        return FastJSONResponse({"error": "SEO analysis failed"}, status_code=500)
 
 async def generate_ai_content_suggestions(topic: str, platform: str = "general", tone: str = "professional") -> Dict[str, any]:
     """Generate AI-powered content suggestions using OpenAI"""
@@ -1055,15 +1462,16 @@ async def generate_ai_content_suggestions(topic: str, platform: str = "general",
         Format your response as JSON with 'suggestions' array and 'hashtags' array.
         """
 
-        response = await openai.ChatCompletion.acreate(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "You are a social media content expert."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=500,
-            temperature=0.8
-        )
+        with ai_request_duration.time(operation="content_suggestions"):
+            response = await openai.ChatCompletion.acreate(
+                model="gpt-3.5-turbo",
+                messages=[
+                    {"role": "system", "content": "You are a social media content expert."},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=500,
+                temperature=0.8
+            )
 
         content = response.choices[0].message.content
         try:
@@ -1092,9 +1500,14 @@ async def generate_ai_content_suggestions(topic: str, platform: str = "general",
             "ai_powered": False
         }
 
-async def generate_ai_hashtags(content: str, platform: str = "general") -> List[str]:
-    """Generate AI-powered hashtag recommendations"""
+async def generate_ai_hashtags(user_id: int, content: str, platform: str = "general") -> List[str]:
+    """Generate hashtag recommendations, asking the model only when the user's local index has no signal"""
     try:
+        local_hashtags = hashtag_index.recommend(user_id, content, platform, limit=12)
+        cache_requests.inc(cache="hashtag_index", result="hit" if local_hashtags else "miss")
+        if local_hashtags:
+            return local_hashtags
+
         if not openai.api_key:
             # Fallback hashtag generation
             words = re.findall(r'\b[a-zA-Z]{3,}\b', content.lower())
@@ -1116,15 +1529,16 @@ async def generate_ai_hashtags(content: str, platform: str = "general") -> List[
         Return only the hashtags, one per line, starting with #
         """
 
-        response = await openai.ChatCompletion.acreate(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "You are a social media hashtag expert."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=200,
-            temperature=0.7
-        )
+        with ai_request_duration.time(operation="hashtags"):
+            response = await openai.ChatCompletion.acreate(
+                model="gpt-3.5-turbo",
+                messages=[
+                    {"role": "system", "content": "You are a social media hashtag expert."},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=200,
+                temperature=0.7
+            )
 
         hashtags = re.findall(r'#\w+', response.choices[0].message.content)
         return hashtags[:12]
@@ -1135,55 +1549,12 @@ async def generate_ai_hashtags(content: str, platform: str = "general") -> List[
         words = re.findall(r'\b[a-zA-Z]{3,}\b', content.lower())
         return [f"#{word}" for word in words[:5]] + ["#ai", "#content"]
 
-def get_seo_recommendations(score: float, content: str, keywords: str, title: str, description: str) -> list:
-    """Get SEO improvement recommendations"""
-    recommendations = []
+def get_trending_hashtags(user_id: int, platform: str = "general") -> List[str]:
+    """Get platform-specific trending hashtags (the user's own best performers first)"""
+    top_hashtags = hashtag_index.top_hashtags(user_id, platform)
+    if top_hashtags:
+        return top_hashtags
 
-    if score < 50:
-        recommendations.append("Your content needs significant SEO improvements")
-    elif score < 70:
-        recommendations.append("Good SEO foundation, but there's room for improvement")
-    else:
-        recommendations.append("Excellent SEO optimization!")
-
-    # Content length recommendations
-    word_count = len(content.split())
-    if word_count < 20:
-        recommendations.append("Consider adding more content (aim for 50-300 words)")
-    elif word_count > 500:
-        recommendations.append("Consider shortening your content for better engagement")
-
-    # Keywords recommendations
-    if not keywords:
-        recommendations.append("Add relevant keywords to improve discoverability")
-
-    # Title recommendations
-    if not title:
-        recommendations.append("Add a compelling title (30-60 characters)")
-    elif len(title) < 30:
-        recommendations.append("Consider making your title longer (30-60 characters)")
-    elif len(title) > 80:
-        recommendations.append("Consider shortening your title (30-60 characters)")
-
-    # Description recommendations
-    if not description:
-        recommendations.append("Add a meta description (120-160 characters)")
-    elif len(description) < 120:
-        recommendations.append("Consider making your description longer (120-160 characters)")
-    elif len(description) > 200:
-        recommendations.append("Consider shortening your description (120-160 characters)")
-
-    # Hashtag recommendations
-    hashtag_count = len(re.findall(r'#\w+', content))
-    if hashtag_count == 0:
-        recommendations.append("Add relevant hashtags to increase reach")
-    elif hashtag_count > 10:
-        recommendations.append("Consider reducing hashtags (3-8 is optimal)")
-
-    return recommendations
-
-def get_trending_hashtags(platform: str = "general") -> List[str]:
-    """Get platform-specific trending hashtags"""
     trending_by_platform = {
         "instagram": ["#instagood", "#photooftheday", "#love", "#beautiful", "#happy", "#follow", "#fashion", "#art"],
         "twitter": ["#trending", "#viral", "#breaking", "#news", "#follow", "#retweet", "#thread", "#discussion"],
@@ -1237,19 +1608,82 @@ async def update_analytics(
         post.impressions = analytics_data['impressions']
 
         # Calculate engagement rate
-        total_engagements = post.likes + post.shares + post.comments + post.clicks
-        post.engagement_rate = (total_engagements / max(post.reach, 1)) * 100 if post.reach else 0
+        post.engagement_rate = compute_engagement_rate(analytics_data)
+        post.analytics_updated_at = datetime.utcnow()
+        record_snapshots(db, [{"id": post.id, **analytics_data, "engagement_rate": post.engagement_rate}], post.analytics_updated_at)
 
         db.commit()
+        hashtag_index.update(post)
+        best_time_index.update(post)
 
-        return JSONResponse({
+        return FastJSONResponse({
             "message": "Analytics updated successfully",
             "analytics": analytics_data,
             "engagement_rate": round(post.engagement_rate, 2)
         })
     except Exception as e:
         print(f"Update analytics error: {e}")
-        return JSONResponse({"error": "Failed to update analytics"}, status_code=500)
+        return FastJSONResponse({"error": "Failed to update analytics"}, status_code=500)
+
+@app.get("/api/analytics/summary")
+async def get_analytics_summary(
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    user: User = Depends(require_auth),
+    db: Session = Depends(get_db)
+):
+    """Totals, percentiles, per-platform stats and the daily views trend"""
+    try:
+        start = datetime.fromisoformat(date_from) if date_from else None
+        end = datetime.fromisoformat(date_to) if date_to else None
+    except ValueError:
+        return FastJSONResponse({"error": "date_from and date_to must be ISO timestamps"}, status_code=400)
+
+    try:
+        return FastJSONResponse(summarize(load_metrics(db, user.id, start, end)))
+    except Exception as e:
+        print(f"Analytics summary error: {e}")
+        return FastJSONResponse({"error": "Failed to load analytics summary"}, status_code=500)
+
+@app.get("/api/analytics/{post_id}/history")
+async def get_analytics_history(
+    post_id: int,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    user: User = Depends(require_auth),
+    db: Session = Depends(get_db)
+):
+    """Metric history of a post, at a granularity chosen from the requested range"""
+    try:
+        post = db.query(PostLog.id).filter(PostLog.id == post_id, PostLog.user_id == user.id).first()
+        if not post:
+            raise HTTPException(status_code=404, detail="Post not found")
+
+        try:
+            end_time = datetime.fromisoformat(end) if end else datetime.utcnow()
+            start_time = datetime.fromisoformat(start) if start else end_time - timedelta(days=1)
+        except ValueError:
+            return FastJSONResponse({"error": "start and end must be ISO timestamps"}, status_code=400)
+
+        return FastJSONResponse(get_metric_series(db, post_id, start_time, end_time))
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"Analytics history error: {e}")
+        return FastJSONResponse({"error": "Failed to load analytics history"}, status_code=500)
+
+@app.post("/api/refresh-analytics")
+async def refresh_all_analytics(
+    user: User = Depends(require_auth)
+):
+    """Refresh analytics for all of the user's posts in the background"""
+    try:
+        if not analytics_collector.refresh_user(user.id):
+            return FastJSONResponse({"message": "Analytics refresh already running"}, status_code=202)
+        return FastJSONResponse({"message": "Analytics refresh started"}, status_code=202)
+    except Exception as e:
+        print(f"Refresh analytics error: {e}")
+        return FastJSONResponse({"error": "Failed to start analytics refresh"}, status_code=500)
 
 @app.post("/api/ai-content-suggestions")
 async def get_ai_content_suggestions(
@@ -1262,10 +1696,10 @@ async def get_ai_content_suggestions(
     """Get AI-powered content suggestions"""
     try:
         suggestions = await generate_ai_content_suggestions(topic, platform, tone)
-        return JSONResponse(suggestions)
+        return FastJSONResponse(suggestions)
     except Exception as e:
         print(f"AI content suggestions error: {e}")
-        return JSONResponse({"error": "Failed to generate content suggestions"}, status_code=500)
+        return FastJSONResponse({"error": "Failed to generate content suggestions"}, status_code=500)
 
 @app.post("/api/ai-hashtags")
 async def get_ai_hashtags(
@@ -1276,11 +1710,11 @@ async def get_ai_hashtags(
 ):
     """Get AI-powered hashtag recommendations"""
     try:
-        hashtags = await generate_ai_hashtags(content, platform)
-        return JSONResponse({"hashtags": hashtags})
+        hashtags = await generate_ai_hashtags(user.id, content, platform)
+        return FastJSONResponse({"hashtags": hashtags})
     except Exception as e:
         print(f"AI hashtag generation error: {e}")
-        return JSONResponse({"error": "Failed to generate hashtags"}, status_code=500)
+        return FastJSONResponse({"error": "Failed to generate hashtags"}, status_code=500)
 
 @app.post("/api/enhance-content")
 async def enhance_content_with_ai(
@@ -1292,7 +1726,7 @@ async def enhance_content_with_ai(
     """Enhance existing content with AI suggestions"""
     try:
         if not openai.api_key:
-            return JSONResponse({
+            return FastJSONResponse({
                 "enhanced_content": content,
                 "suggestions": ["Add emojis to make it more engaging", "Consider adding a call-to-action"],
                 "ai_powered": False
@@ -1312,22 +1746,23 @@ async def enhance_content_with_ai(
         Format as JSON with 'enhanced_content' and 'suggestions' array.
         """
 
-        response = await openai.ChatCompletion.acreate(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "You are a social media content optimization expert."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=400,
-            temperature=0.7
-        )
+        with ai_request_duration.time(operation="enhance_content"):
+            response = await openai.ChatCompletion.acreate(
+                model="gpt-3.5-turbo",
+                messages=[
+                    {"role": "system", "content": "You are a social media content optimization expert."},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=400,
+                temperature=0.7
+            )
 
         try:
             result = json.loads(response.choices[0].message.content)
             result["ai_powered"] = True
-            return JSONResponse(result)
+            return FastJSONResponse(result)
         except json.JSONDecodeError:
-            return JSONResponse({
+            return FastJSONResponse({
                 "enhanced_content": content,
                 "suggestions": ["Consider adding emojis", "Add a call-to-action", "Make it more conversational"],
                 "ai_powered": True
@@ -1335,7 +1770,7 @@ async def enhance_content_with_ai(
 
     except Exception as e:
         print(f"Content enhancement error: {e}")
-        return JSONResponse({"error": "Failed to enhance content"}, status_code=500)
+        return FastJSONResponse({"error": "Failed to enhance content"}, status_code=500)
 
 @app.post("/api/generate-content-ideas")
 async def generate_content_ideas(
@@ -1348,10 +1783,10 @@ async def generate_content_ideas(
     """Generate AI-powered content ideas"""
     try:
         suggestions = await generate_ai_content_suggestions(topic, platform, tone)
-        return JSONResponse(suggestions)
+        return FastJSONResponse(suggestions)
     except Exception as e:
         print(f"Content ideas generation error: {e}")
-        return JSONResponse({"error": "Failed to generate content ideas"}, status_code=500)
+        return FastJSONResponse({"error": "Failed to generate content ideas"}, status_code=500)
 
 @app.post("/api/optimize-hashtags")
 async def optimize_hashtags(
@@ -1362,17 +1797,17 @@ async def optimize_hashtags(
 ):
     """Get optimized hashtag recommendations"""
     try:
-        hashtags = await generate_ai_hashtags(content, platform)
-        trending_hashtags = get_trending_hashtags(platform)
+        hashtags = await generate_ai_hashtags(user.id, content, platform)
+        trending_hashtags = get_trending_hashtags(user.id, platform)
 
-        return JSONResponse({
+        return FastJSONResponse({
             "ai_hashtags": hashtags,
             "trending_hashtags": trending_hashtags,
             "recommended_count": get_optimal_hashtag_count(platform)
         })
     except Exception as e:
         print(f"Hashtag optimization error: {e}")
-        return JSONResponse({"error": "Failed to optimize hashtags"}, status_code=500)
+        return FastJSONResponse({"error": "Failed to optimize hashtags"}, status_code=500)
 @app.get("/settings", response_class=HTMLResponse)
 async def settings_page(
     request: Request,
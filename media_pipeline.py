@@ -0,0 +1,289 @@
+import asyncio
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+    ImageOps = None
+
+MEDIA_WORKERS = int(os.getenv("MEDIA_WORKERS", str(min(4, os.cpu_count() or 1))))
+RENDITIONS_DIR = os.getenv("RENDITIONS_DIR", os.path.join("uploads", "renditions"))
+FFMPEG = os.getenv("FFMPEG_PATH") or shutil.which("ffmpeg")
+VIDEO_TIMEOUT = int(os.getenv("MEDIA_VIDEO_TIMEOUT", "600"))
+
+MB = 1024 * 1024
+
+logger = logging.getLogger("media")
+
+@dataclass(frozen=True)
+class MediaProfile:
+    """Target limits of one family of platforms; None means unconstrained"""
+    name: str
+    max_width: int
+    max_height: int
+    image_format: str = "JPEG"
+    quality: int = 85
+    max_image_bytes: Optional[int] = None
+    # Images outside these width/height ratios are center-cropped into range
+    min_aspect: Optional[float] = None
+    max_aspect: Optional[float] = None
+    max_video_bytes: Optional[int] = None
+    video_max_seconds: Optional[int] = None
+    video_bitrate: str = "5M"
+
+    @property
+    def version(self) -> str:
+        """Changes whenever the profile does, so stale renditions aren't reused"""
+        return hashlib.sha1(json.dumps(asdict(self), sort_keys=True).encode()).hexdigest()[:8]
+
+PROFILES = {
+    "instagram": MediaProfile(
+        "instagram", 1080, 1350, max_image_bytes=8 * MB, min_aspect=4 / 5, max_aspect=1.91,
+        max_video_bytes=100 * MB, video_max_seconds=90
+    ),
+    # TikTok and Snapchat: portrait 1080x1920, 10 minute uploads
+    "vertical_video": MediaProfile(
+        "vertical_video", 1080, 1920, max_image_bytes=10 * MB, max_video_bytes=250 * MB, video_max_seconds=600
+    ),
+    # YouTube takes landscape video up to 4K of any practical length and size:
+    # only formats that need it are transcoded, never shortened or downscaled below 2160p
+    "youtube": MediaProfile("youtube", 3840, 2160, video_bitrate="35M"),
+    "pinterest": MediaProfile("pinterest", 1000, 1500, max_image_bytes=20 * MB, min_aspect=1 / 2.1, max_aspect=2.0),
+    "telegram": MediaProfile("telegram", 2560, 2560, max_image_bytes=10 * MB, max_video_bytes=50 * MB),
+    "twitter": MediaProfile("twitter", 4096, 4096, max_image_bytes=5 * MB, max_video_bytes=15 * MB, video_max_seconds=140),
+    "thumbnail": MediaProfile("thumbnail", 320, 320, image_format="WEBP", quality=70),
+}
+
+# Platforms not listed here get the original upload
+PLATFORM_PROFILES = {
+    "instagram": "instagram",
+    "threads": "instagram",
+    "tiktok": "vertical_video",
+    "youtube": "youtube",
+    "snapchat": "vertical_video",
+    "pinterest": "pinterest",
+    "telegram": "telegram",
+    "twitter": "twitter",
+}
+
+IMAGE_EXTENSIONS = {"JPEG": "jpg", "WEBP": "webp", "PNG": "png"}
+
+def _fit_aspect(image, min_aspect: Optional[float], max_aspect: Optional[float]):
+    width, height = image.size
+    aspect = width / height
+    if max_aspect and aspect > max_aspect:
+        new_width = int(height * max_aspect)
+        left = (width - new_width) // 2
+        return image.crop((left, 0, left + new_width, height))
+    if min_aspect and aspect < min_aspect:
+        new_height = int(width / min_aspect)
+        top = (height - new_height) // 2
+        return image.crop((0, top, width, top + new_height))
+    return image
+
+def render_image(source: str, target: str, profile: MediaProfile) -> Optional[str]:
+    """Resize/recompress an image for a profile; None when the original already fits
+
+    Runs in a worker process.
+    """
+    with Image.open(source) as original:
+        if getattr(original, "is_animated", False):
+            return None  # re-encoding would drop the animation
+        width, height = original.size
+        aspect = width / height
+        fits = (
+            width <= profile.max_width and height <= profile.max_height
+            and (not profile.min_aspect or aspect >= profile.min_aspect)
+            and (not profile.max_aspect or aspect <= profile.max_aspect)
+            and (not profile.max_image_bytes or os.path.getsize(source) <= profile.max_image_bytes)
+            and original.format == profile.image_format
+        )
+        if fits:
+            return None
+
+        image = ImageOps.exif_transpose(original)
+        image = _fit_aspect(image, profile.min_aspect, profile.max_aspect)
+        image.thumbnail((profile.max_width, profile.max_height), Image.Resampling.LANCZOS)
+        if profile.image_format == "JPEG" and image.mode != "RGB":
+            background = Image.new("RGB", image.size, (255, 255, 255))
+            background.paste(image, mask=image.convert("RGBA").split()[-1])
+            image = background
+
+    # Step the quality down until the file fits the size limit
+    temporary = target + ".tmp"
+    quality = profile.quality
+    while True:
+        image.save(temporary, profile.image_format, quality=quality, optimize=True)
+        if not profile.max_image_bytes or os.path.getsize(temporary) <= profile.max_image_bytes or quality <= 40:
+            break
+        quality -= 10
+    os.replace(temporary, target)
+    return target
+
+def render_video(source: str, target: str, profile: MediaProfile) -> Optional[str]:
+    """Transcode a video to H.264/AAC MP4 within a profile's limits with ffmpeg
+
+    Videos that are already MP4 and under the size limit are left alone, as
+    are all videos when ffmpeg isn't installed. Runs in a worker process.
+    """
+    if not FFMPEG:
+        return None
+    if source.lower().endswith(".mp4") and (not profile.max_video_bytes or os.path.getsize(source) <= profile.max_video_bytes):
+        return None
+
+    scale = (
+        f"scale='min({profile.max_width},iw)':'min({profile.max_height},ih)':force_original_aspect_ratio=decrease,"
+        "scale=trunc(iw/2)*2:trunc(ih/2)*2"
+    )
+    command = [FFMPEG, "-y", "-v", "error", "-i", source, "-vf", scale,
+               "-c:v", "libx264", "-preset", "veryfast", "-crf", "23",
+               "-maxrate", profile.video_bitrate, "-bufsize", profile.video_bitrate,
+               "-pix_fmt", "yuv420p", "-c:a", "aac", "-b:a", "128k", "-movflags", "+faststart"]
+    if profile.video_max_seconds:
+        command += ["-t", str(profile.video_max_seconds)]
+    temporary = target + ".tmp.mp4"
+    subprocess.run(command + [temporary], check=True, timeout=VIDEO_TIMEOUT, capture_output=True)
+    os.replace(temporary, target)
+    return target
+
+def render_thumbnail(source: str, target: str, file_type: str, profile: MediaProfile) -> Optional[str]:
+    """Small preview of an image, or of a video's first frame. Runs in a worker process."""
+    if file_type == "video":
+        if not FFMPEG:
+            return None
+        frame = target + ".frame.png"
+        subprocess.run(
+            [FFMPEG, "-y", "-v", "error", "-i", source, "-frames:v", "1", frame],
+            check=True, timeout=60, capture_output=True
+        )
+        source = frame
+    try:
+        with Image.open(source) as original:
+            image = ImageOps.exif_transpose(original)
+            image.thumbnail((profile.max_width, profile.max_height), Image.Resampling.LANCZOS)
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+            image.save(target, profile.image_format, quality=profile.quality)
+    finally:
+        if file_type == "video" and os.path.exists(source):
+            os.remove(source)
+    return target
+
+def _render(kind: str, source: str, target: str, file_type: str, profile: MediaProfile) -> Optional[str]:
+    if kind == "thumbnail":
+        return render_thumbnail(source, target, file_type, profile)
+    if file_type == "image":
+        return render_image(source, target, profile)
+    return render_video(source, target, profile)
+
+def file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+class MediaPipeline:
+    """Per-platform renditions of uploaded media, rendered on a process pool
+
+    Renditions are cached on disk by (content hash, profile), and identical
+    concurrent requests share one render. Any failure falls back to the
+    original file, so media preparation never blocks a post.
+    """
+
+    def __init__(self, workers: int = MEDIA_WORKERS, directory: str = RENDITIONS_DIR):
+        self.workers = workers
+        self.directory = directory
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: Dict[str, asyncio.Future] = {}
+        # Cache keys whose original already fits the profile
+        self._originals = set()
+
+    @property
+    def available(self) -> bool:
+        return Image is not None
+
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a process with running threads and an event loop is unsafe
+            self._executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+        return self._executor
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _target(self, digest: str, kind: str, profile: MediaProfile, file_type: str) -> str:
+        if kind == "thumbnail" or file_type == "image":
+            extension = IMAGE_EXTENSIONS[profile.image_format]
+        else:
+            extension = "mp4"
+        return os.path.join(self.directory, digest[:2], f"{digest}-{profile.name}-{profile.version}.{extension}")
+
+    async def render(self, file_path: str, file_type: str, profile: MediaProfile, kind: str = "rendition",
+                     digest: Optional[str] = None, target: Optional[str] = None) -> Optional[str]:
+        """Path of the cached or newly rendered file, or None to use the original"""
+        if not self.available or file_type not in ("image", "video"):
+            return None
+        if target is None:
+            digest = digest or await asyncio.to_thread(file_hash, file_path)
+            target = self._target(digest, kind, profile, file_type)
+        if target in self._originals:
+            return None
+        if os.path.exists(target):
+            return target
+
+        pending = self._pending.get(target)
+        if pending is None:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            loop = asyncio.get_running_loop()
+            pending = loop.run_in_executor(self.executor(), _render, kind, file_path, target, file_type, profile)
+            self._pending[target] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(target, None))
+        try:
+            rendered = await asyncio.shield(pending)
+        except Exception as e:
+            logger.warning("Rendering %s for %s failed: %s", file_path, profile.name, e)
+            return None
+        if rendered is None:
+            self._originals.add(target)
+        return rendered
+
+    async def thumbnail(self, file_path: str, file_type: str) -> Optional[str]:
+        """Small WebP preview stored next to the media file (first frame for videos)"""
+        profile = PROFILES["thumbnail"]
+        target = f"{os.path.splitext(file_path)[0]}.thumb.{IMAGE_EXTENSIONS[profile.image_format]}"
+        return await self.render(file_path, file_type, profile, kind="thumbnail", target=target)
+
+    async def prepare(self, file_path: Optional[str], file_type: Optional[str], platforms: List[str]) -> Dict[str, Tuple[str, str]]:
+        """(path, file type) to post on each platform, rendering all profiles in parallel"""
+        if not file_path or not file_type:
+            return {}
+        renditions = {platform: (file_path, file_type) for platform in platforms}
+        profiles = {PLATFORM_PROFILES[p] for p in platforms if p in PLATFORM_PROFILES}
+        if not profiles or not self.available:
+            return renditions
+
+        digest = await asyncio.to_thread(file_hash, file_path)
+        names = sorted(profiles)
+        rendered = await asyncio.gather(*(self.render(file_path, file_type, PROFILES[name], digest=digest) for name in names))
+        paths = dict(zip(names, rendered))
+
+        for platform in platforms:
+            path = paths.get(PLATFORM_PROFILES.get(platform))
+            if path:
+                renditions[platform] = (path, file_type)
+        return renditions
+
+media_pipeline = MediaPipeline()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Float, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database import Base
@@ -23,8 +23,10 @@ class PostLog(Base):
     platforms = Column(String(255), nullable=False)  # Comma-separated
     file_path = Column(String(255), nullable=True)
     file_type = Column(String(20), nullable=True)  # image, video
+    thumbnail_path = Column(String(255), nullable=True)  # small WebP preview of the media
     scheduled_for = Column(DateTime, nullable=True)
-    status = Column(String(20), default="pending")  # pending, completed, failed
+    status = Column(String(20), default="pending")  # queued, pending, completed, failed
+    claimed_at = Column(DateTime, nullable=True)  # when publishing started (status pending)
     results = Column(Text, nullable=True)  # JSON string of results
     created_at = Column(DateTime, default=datetime.utcnow)
     completed_at = Column(DateTime, nullable=True)
@@ -39,6 +41,7 @@ class PostLog(Base):
     engagement_rate = Column(Float, default=0.0)
     reach = Column(Integer, default=0)
     impressions = Column(Integer, default=0)
+    analytics_updated_at = Column(DateTime, nullable=True)
     
     # SEO fields
     seo_keywords = Column(Text, nullable=True)  # Comma-separated keywords
@@ -47,6 +50,84 @@ class PostLog(Base):
     hashtags = Column(Text, nullable=True)  # Comma-separated hashtags
     seo_score = Column(Float, default=0.0)
     readability_score = Column(Float, default=0.0)
+
+    # Near-duplicate detection (64-bit SimHash stored as a signed integer)
+    content_simhash = Column(Integer, nullable=True)
     
     # Relationship
     user = relationship("User", back_populates="posts")
+
+class PostMetricSnapshot(Base):
+    """Append-only raw analytics points (kept until rolled up)"""
+    __tablename__ = "post_metric_snapshots"
+    __table_args__ = (
+        Index("ix_post_metric_snapshots_post_time", "post_id", "captured_at"),
+        Index("ix_post_metric_snapshots_time", "captured_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    post_id = Column(Integer, ForeignKey("post_logs.id"), nullable=False)
+    captured_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    views = Column(Integer, default=0)
+    likes = Column(Integer, default=0)
+    shares = Column(Integer, default=0)
+    comments = Column(Integer, default=0)
+    clicks = Column(Integer, default=0)
+    reach = Column(Integer, default=0)
+    impressions = Column(Integer, default=0)
+    engagement_rate = Column(Float, default=0.0)
+
+class PostMetricRollup(Base):
+    """Hourly and daily analytics buckets (latest counter values in each bucket)"""
+    __tablename__ = "post_metric_rollups"
+    __table_args__ = (
+        UniqueConstraint("post_id", "granularity", "bucket_start", name="uq_post_metric_rollups_bucket"),
+        Index("ix_post_metric_rollups_time", "granularity", "bucket_start"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    post_id = Column(Integer, ForeignKey("post_logs.id"), nullable=False)
+    granularity = Column(String(10), nullable=False)  # hour, day
+    bucket_start = Column(DateTime, nullable=False)
+    views = Column(Integer, default=0)
+    likes = Column(Integer, default=0)
+    shares = Column(Integer, default=0)
+    comments = Column(Integer, default=0)
+    clicks = Column(Integer, default=0)
+    reach = Column(Integer, default=0)
+    impressions = Column(Integer, default=0)
+    engagement_rate = Column(Float, default=0.0)
+    samples = Column(Integer, default=0)
+
+class IdempotencyKey(Base):
+    """Client-supplied Idempotency-Key of a /post request and the response it produced"""
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (
+        UniqueConstraint("user_id", "key", name="uq_idempotency_keys_user_key"),
+        Index("ix_idempotency_keys_created", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    key = Column(String(255), nullable=False)
+    request_hash = Column(String(64), nullable=False)  # detects the key being reused for another request
+    post_id = Column(Integer, ForeignKey("post_logs.id"), nullable=True)
+    status_code = Column(Integer, nullable=True)  # null while the first request is in progress
+    response = Column(Text, nullable=True)  # JSON body returned to replays
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+class SocialAccount(Base):
+    """One destination (channel, page, profile...) a user posts to on a platform"""
+    __tablename__ = "social_accounts"
+    __table_args__ = (
+        UniqueConstraint("user_id", "platform", "name", name="uq_social_accounts_user_platform_name"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    platform = Column(String(50), nullable=False)
+    name = Column(String(100), nullable=False)  # shown in results, e.g. the channel username
+    credentials = Column(Text, nullable=False)  # Fernet-encrypted JSON of the adapter's credentials
+    enabled = Column(Boolean, default=True, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -0,0 +1,132 @@
+import html
+import re
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import text
+
+# Columns of post_logs mirrored into the full-text index
+SEARCH_COLUMNS = ["content", "hashtags", "seo_keywords", "seo_title"]
+
+SEARCH_TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+# Private-use markers so snippets can be HTML-escaped before highlighting
+SNIPPET_START = "\ue000"
+SNIPPET_END = "\ue001"
+
+def init_search_index(engine):
+    """Create the FTS5 index over post_logs and the triggers that keep it in sync"""
+    columns = ", ".join(SEARCH_COLUMNS)
+    new_values = ", ".join(f"new.{column}" for column in SEARCH_COLUMNS)
+    old_values = ", ".join(f"old.{column}" for column in SEARCH_COLUMNS)
+
+    with engine.begin() as conn:
+        exists = conn.execute(text(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='post_logs_fts'"
+        )).fetchone()
+
+        conn.execute(text(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS post_logs_fts USING fts5(
+                {columns},
+                content='post_logs',
+                content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            )
+        """))
+
+        conn.execute(text(f"""
+            CREATE TRIGGER IF NOT EXISTS post_logs_fts_insert AFTER INSERT ON post_logs BEGIN
+                INSERT INTO post_logs_fts(rowid, {columns}) VALUES (new.id, {new_values});
+            END
+        """))
+        conn.execute(text(f"""
+            CREATE TRIGGER IF NOT EXISTS post_logs_fts_delete AFTER DELETE ON post_logs BEGIN
+                INSERT INTO post_logs_fts(post_logs_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+            END
+        """))
+        # Only reindex when a searchable column changes, not on every status/analytics update
+        conn.execute(text(f"""
+            CREATE TRIGGER IF NOT EXISTS post_logs_fts_update AFTER UPDATE OF {columns} ON post_logs BEGIN
+                INSERT INTO post_logs_fts(post_logs_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+                INSERT INTO post_logs_fts(rowid, {columns}) VALUES (new.id, {new_values});
+            END
+        """))
+
+        if not exists:
+            # Index posts that were written before the search table existed
+            conn.execute(text("INSERT INTO post_logs_fts(post_logs_fts) VALUES ('rebuild')"))
+            print("✅ Full-text search index created")
+
+def build_match_query(query: str) -> str:
+    """Turn free text into a safe FTS5 MATCH expression (all terms, prefix match on the last)"""
+    tokens = SEARCH_TOKEN_PATTERN.findall(query or "")
+    if not tokens:
+        return ""
+
+    terms = [f'"{token}"' for token in tokens]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+def highlight_snippet(snippet: Optional[str]) -> str:
+    """Escape a raw FTS snippet and turn the match markers into <mark> tags"""
+    escaped = html.escape(snippet or "")
+    return escaped.replace(SNIPPET_START, "<mark>").replace(SNIPPET_END, "</mark>")
+
+def search_posts(
+    db,
+    user_id: int,
+    query: str,
+    platform: Optional[str] = None,
+    status: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    limit: int = 20,
+    offset: int = 0
+) -> list:
+    """Ranked full-text search over a user's post history"""
+    match = build_match_query(query)
+    if not match:
+        return []
+
+    filters = ["post_logs_fts MATCH :match", "p.user_id = :user_id"]
+    params = {
+        "match": match, "user_id": user_id, "limit": limit, "offset": offset,
+        "snippet_start": SNIPPET_START, "snippet_end": SNIPPET_END
+    }
+
+    if platform:
+        filters.append("(',' || p.platforms || ',') LIKE :platform")
+        params["platform"] = f"%,{platform},%"
+    if status:
+        filters.append("p.status = :status")
+        params["status"] = status
+    if date_from:
+        filters.append("p.created_at >= :date_from")
+        params["date_from"] = date_from
+    if date_to:
+        filters.append("p.created_at <= :date_to")
+        params["date_to"] = date_to
+
+    # bm25 weights follow SEARCH_COLUMNS: content, hashtags, seo_keywords, seo_title
+    rows = db.execute(text(f"""
+        SELECT p.id, p.platforms, p.status, p.created_at,
+               snippet(post_logs_fts, -1, :snippet_start, :snippet_end, '…', 16) AS snippet,
+               bm25(post_logs_fts, 1.0, 2.0, 2.0, 3.0) AS rank
+        FROM post_logs_fts
+        JOIN post_logs p ON p.id = post_logs_fts.rowid
+        WHERE {' AND '.join(filters)}
+        ORDER BY rank
+        LIMIT :limit OFFSET :offset
+    """), params).fetchall()
+
+    return [
+        {
+            "id": row.id,
+            "snippet": highlight_snippet(row.snippet),
+            "platforms": row.platforms.split(",") if row.platforms else [],
+            "status": row.status,
+            "created_at": str(row.created_at) if row.created_at else None,
+            "rank": round(row.rank, 4)
+        }
+        for row in rows
+    ]
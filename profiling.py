@@ -0,0 +1,163 @@
+import cProfile
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import List, Optional
+from urllib.parse import parse_qs
+
+PROFILES_DIR = os.getenv("PROFILES_DIR", "profiles")
+# cprofile (deterministic, .pstats) or sample (statistical, folded stacks for flamegraphs)
+PROFILE_MODE = os.getenv("PROFILE_MODE", "cprofile")
+# Fraction of requests to PROFILE_PATHS profiled without a flag; 0 profiles only flagged requests
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_PATHS = [p.strip() for p in os.getenv("PROFILE_PATHS", "/post,/analytics").split(",") if p.strip()]
+PROFILE_KEEP = int(os.getenv("PROFILE_KEEP", "50"))
+PROFILE_SAMPLE_INTERVAL = float(os.getenv("PROFILE_SAMPLE_INTERVAL", "0.005"))
+ADMIN_USERNAMES = {u.strip() for u in os.getenv("ADMIN_USERNAMES", "admin").split(",") if u.strip()}
+
+PROFILE_EXTENSIONS = {"cprofile": ".pstats", "sample": ".folded"}
+PROFILE_NAME_PATTERN = re.compile(r"^[\w.-]+\.(pstats|folded)$")
+
+logger = logging.getLogger("profiling")
+
+def is_admin(session: Optional[dict]) -> bool:
+    return bool(session and session.get("authenticated") and session.get("username") in ADMIN_USERNAMES)
+
+class StackSampler:
+    """Samples one thread's stack at a fixed interval into folded stacks"""
+
+    def __init__(self, thread_id: int, interval: float = PROFILE_SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def write(self, path: str):
+        with open(path, "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+def profile_filename(method: str, path: str, duration: float, mode: str = PROFILE_MODE) -> str:
+    slug = re.sub(r"[^\w]+", "_", path).strip("_") or "root"
+    stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+    return f"{stamp}-{method}-{slug[:60]}-{int(duration * 1000)}ms{PROFILE_EXTENSIONS[mode]}"
+
+def list_profiles(limit: int = PROFILE_KEEP) -> List[dict]:
+    """Stored profiles, newest first"""
+    if not os.path.isdir(PROFILES_DIR):
+        return []
+    profiles = []
+    for entry in os.scandir(PROFILES_DIR):
+        if not PROFILE_NAME_PATTERN.match(entry.name):
+            continue
+        stat = entry.stat()
+        parts = entry.name.rsplit(".", 1)[0].split("-")
+        profiles.append({
+            "name": entry.name,
+            "method": parts[1] if len(parts) > 3 else "",
+            "path": "/" + parts[2].replace("_", "/") if len(parts) > 3 else "",
+            "duration_ms": int(parts[-1][:-2]) if parts[-1].endswith("ms") and parts[-1][:-2].isdigit() else None,
+            "size": stat.st_size,
+            "created_at": datetime.utcfromtimestamp(stat.st_mtime)
+        })
+    profiles.sort(key=lambda p: p["name"], reverse=True)
+    return profiles[:limit]
+
+def profile_path(name: str) -> Optional[str]:
+    """Absolute path of a stored profile, or None for unknown or unsafe names"""
+    if not PROFILE_NAME_PATTERN.match(name):
+        return None
+    path = os.path.join(PROFILES_DIR, name)
+    return path if os.path.isfile(path) else None
+
+def _prune():
+    for stale in list_profiles(limit=10 ** 6)[PROFILE_KEEP:]:
+        try:
+            os.remove(os.path.join(PROFILES_DIR, stale["name"]))
+        except OSError:
+            pass
+
+class ProfilingMiddleware:
+    """Profile a request when an admin asks for it (X-Profile: 1 or ?profile=1)
+    or when it is sampled by PROFILE_SAMPLE_RATE.
+
+    Must run inside SessionMiddleware. Only one request is profiled at a time;
+    others proceed unprofiled. The profiler sees the whole event loop thread,
+    so concurrent requests can show up in a profile.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._busy = threading.Lock()
+
+    def _wanted(self, scope) -> bool:
+        headers = dict(scope["headers"])
+        flagged = headers.get(b"x-profile") in (b"1", b"true") or \
+            parse_qs(scope.get("query_string", b"").decode("latin-1")).get("profile") in (["1"], ["true"])
+        if flagged:
+            return is_admin(scope.get("session"))
+        return PROFILE_SAMPLE_RATE > 0 and scope["path"] in PROFILE_PATHS and random.random() < PROFILE_SAMPLE_RATE
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._wanted(scope) or not self._busy.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            if PROFILE_MODE == "sample":
+                profiler = StackSampler(threading.get_ident())
+                profiler.start()
+            else:
+                profiler = cProfile.Profile()
+                profiler.enable()
+            started = time.perf_counter()
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                duration = time.perf_counter() - started
+                if PROFILE_MODE == "sample":
+                    profiler.stop()
+                else:
+                    profiler.disable()
+                self._save(profiler, scope, duration)
+        finally:
+            self._busy.release()
+
+    def _save(self, profiler, scope, duration: float):
+        try:
+            os.makedirs(PROFILES_DIR, exist_ok=True)
+            mode = "sample" if PROFILE_MODE == "sample" else "cprofile"
+            path = os.path.join(PROFILES_DIR, profile_filename(scope["method"], scope["path"], duration, mode))
+            if mode == "sample":
+                profiler.write(path)
+            else:
+                profiler.dump_stats(path)
+            _prune()
+            logger.info("Profile saved: %s", path, extra={"duration_ms": round(duration * 1000, 1)})
+        except Exception:
+            logger.exception("Failed to save profile")
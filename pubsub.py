@@ -0,0 +1,115 @@
+import asyncio
+import json
+import logging
+import os
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Set
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+# redis://... shares events between app processes; empty keeps them in-process
+EVENT_BROKER_URL = os.getenv("EVENT_BROKER_URL", "")
+# Events buffered per subscriber; a client this far behind loses the oldest
+EVENT_QUEUE_SIZE = int(os.getenv("EVENT_QUEUE_SIZE", "100"))
+
+logger = logging.getLogger("pubsub")
+
+def user_channel(user_id: int) -> str:
+    return f"user:{user_id}"
+
+class EventHub:
+    """In-process pub/sub: every subscriber of a channel gets its own bounded queue
+
+    Events are dicts {"event": name, "data": payload}. Publishing never
+    blocks on a slow subscriber.
+    """
+
+    def __init__(self, queue_size: int = EVENT_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+
+    def subscriber_count(self) -> int:
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    def _deliver(self, channel: str, message: dict):
+        for queue in list(self._subscribers.get(channel, ())):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(message)
+
+    async def publish(self, channel: str, event: str, data: dict):
+        self._deliver(channel, {"event": event, "data": data})
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[asyncio.Queue]:
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers[channel].add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers[channel].discard(queue)
+            if not self._subscribers[channel]:
+                del self._subscribers[channel]
+
+    async def close(self):
+        pass
+
+class RedisEventHub(EventHub):
+    """EventHub shared through Redis pub/sub, for several app processes
+
+    Each process keeps one Redis subscription per channel with local
+    subscribers and fans messages out to their queues.
+    """
+
+    def __init__(self, url: str, queue_size: int = EVENT_QUEUE_SIZE):
+        super().__init__(queue_size)
+        self.redis = aioredis.from_url(url)
+        self._readers: Dict[str, asyncio.Task] = {}
+
+    async def publish(self, channel: str, event: str, data: dict):
+        try:
+            await self.redis.publish(channel, json.dumps({"event": event, "data": data}))
+        except Exception as e:
+            logger.warning("Publishing %s to %s failed: %s", event, channel, e)
+
+    async def _read(self, channel: str):
+        pubsub = self.redis.pubsub()
+        await pubsub.subscribe(channel)
+        try:
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    self._deliver(channel, json.loads(message["data"]))
+        finally:
+            await pubsub.aclose()
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[asyncio.Queue]:
+        if channel not in self._readers:
+            self._readers[channel] = asyncio.create_task(self._read(channel))
+        try:
+            async with super().subscribe(channel) as queue:
+                yield queue
+        finally:
+            if channel not in self._subscribers and channel in self._readers:
+                self._readers.pop(channel).cancel()
+
+    async def close(self):
+        for task in self._readers.values():
+            task.cancel()
+        await asyncio.gather(*self._readers.values(), return_exceptions=True)
+        self._readers.clear()
+        await self.redis.aclose()
+
+def create_event_hub() -> EventHub:
+    if EVENT_BROKER_URL:
+        if aioredis is None:
+            logger.warning("EVENT_BROKER_URL is set but redis is not installed; using in-process events")
+        else:
+            return RedisEventHub(EVENT_BROKER_URL)
+    return EventHub()
+
+event_hub = create_event_hub()
@@ -0,0 +1,150 @@
+import json
+import os
+import re
+import shutil
+import time
+import uuid
+from typing import Optional
+
+UPLOAD_STAGING_DIR = os.getenv("UPLOAD_STAGING_DIR", "upload_staging")
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(8 * 1024 * 1024)))
+MAX_UPLOAD_SIZE = int(os.getenv("MAX_UPLOAD_SIZE", str(4 * 1024 ** 3)))
+UPLOAD_EXPIRY_HOURS = float(os.getenv("UPLOAD_EXPIRY_HOURS", "24"))
+
+UPLOAD_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+CHUNK_NAME_PATTERN = re.compile(r"^(\d+)\.part$")
+
+class ResumableUploads:
+    """Chunked, resumable uploads staged on disk until a post claims them
+
+    An upload is a directory holding its metadata and one file per chunk.
+    Chunks have a fixed size (the last one may be shorter) and are addressed
+    by byte offset, so they can arrive in any order, in parallel, from
+    several app processes, and be re-sent after a failure. A chunk only
+    counts once fully written. Nothing but the directory listing is shared,
+    so the offset query is always accurate after a crash or restart.
+    """
+
+    def __init__(self, directory: str = UPLOAD_STAGING_DIR, chunk_size: int = UPLOAD_CHUNK_SIZE,
+                 max_size: int = MAX_UPLOAD_SIZE, expiry_hours: float = UPLOAD_EXPIRY_HOURS):
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.max_size = max_size
+        self.expiry_seconds = expiry_hours * 3600
+
+    def _dir(self, upload_id: str) -> str:
+        return os.path.join(self.directory, upload_id)
+
+    def create(self, user_id: int, filename: str, size: int, file_type: str, extension: str) -> dict:
+        if size <= 0:
+            raise ValueError("Upload size must be positive")
+        if size > self.max_size:
+            raise ValueError(f"File size ({size} bytes) exceeds the {self.max_size // 1024 ** 2}MB upload limit")
+        self.prune()
+        upload_id = uuid.uuid4().hex
+        os.makedirs(self._dir(upload_id))
+        meta = {
+            "upload_id": upload_id,
+            "user_id": user_id,
+            "filename": filename,
+            "extension": extension,
+            "file_type": file_type,
+            "size": size,
+            "chunk_size": self.chunk_size,
+            "created_at": time.time(),
+        }
+        with open(os.path.join(self._dir(upload_id), "upload.json"), "w") as f:
+            json.dump(meta, f)
+        return self.status(meta)
+
+    def get(self, upload_id: str, user_id: int) -> Optional[dict]:
+        """Metadata of one of the user's uploads, or None"""
+        if not UPLOAD_ID_PATTERN.match(upload_id):
+            return None
+        try:
+            with open(os.path.join(self._dir(upload_id), "upload.json")) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return meta if meta["user_id"] == user_id else None
+
+    def _received(self, meta: dict) -> set:
+        offsets = set()
+        for entry in os.scandir(self._dir(meta["upload_id"])):
+            match = CHUNK_NAME_PATTERN.match(entry.name)
+            if match:
+                offsets.add(int(match.group(1)))
+        return offsets
+
+    def status(self, meta: dict) -> dict:
+        """Progress of an upload; `offset` is the length of the contiguous prefix received"""
+        size, chunk_size = meta["size"], meta["chunk_size"]
+        received = self._received(meta)
+        missing = [offset for offset in range(0, size, chunk_size) if offset not in received]
+        received_bytes = sum(min(chunk_size, size - offset) for offset in received)
+        return {
+            "upload_id": meta["upload_id"],
+            "filename": meta["filename"],
+            "size": size,
+            "chunk_size": chunk_size,
+            "offset": missing[0] if missing else size,
+            "received_bytes": received_bytes,
+            "missing": missing,
+            "complete": not missing,
+        }
+
+    async def write_chunk(self, meta: dict, offset: int, stream) -> dict:
+        """Store the chunk at `offset` from an async byte stream"""
+        size, chunk_size = meta["size"], meta["chunk_size"]
+        if offset < 0 or offset >= size or offset % chunk_size:
+            raise ValueError(f"Upload-Offset must be a multiple of {chunk_size} below {size}")
+        expected = min(chunk_size, size - offset)
+
+        directory = self._dir(meta["upload_id"])
+        temporary = os.path.join(directory, f"{offset}.{uuid.uuid4().hex}.tmp")
+        written = 0
+        try:
+            with open(temporary, "wb") as f:
+                async for data in stream:
+                    written += len(data)
+                    if written > expected:
+                        raise ValueError(f"Chunk at offset {offset} must be {expected} bytes")
+                    f.write(data)
+            if written != expected:
+                raise ValueError(f"Chunk at offset {offset} must be {expected} bytes, got {written}")
+            # Publish atomically: a half-written chunk is never counted as received
+            os.replace(temporary, os.path.join(directory, f"{offset}.part"))
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+        return self.status(meta)
+
+    def assemble(self, meta: dict, target_dir: str = "uploads") -> str:
+        """Join a complete upload's chunks into the media store and return its path"""
+        status = self.status(meta)
+        if not status["complete"]:
+            raise ValueError(f"Upload is incomplete: {len(status['missing'])} chunks missing")
+        os.makedirs(target_dir, exist_ok=True)
+        file_path = os.path.join(target_dir, f"{uuid.uuid4()}.{meta['extension']}")
+        directory = self._dir(meta["upload_id"])
+        with open(file_path + ".tmp", "wb") as target:
+            for offset in range(0, meta["size"], meta["chunk_size"]):
+                with open(os.path.join(directory, f"{offset}.part"), "rb") as chunk:
+                    shutil.copyfileobj(chunk, target, 1024 * 1024)
+        os.replace(file_path + ".tmp", file_path)
+        self.delete(meta["upload_id"])
+        return file_path
+
+    def delete(self, upload_id: str):
+        shutil.rmtree(self._dir(upload_id), ignore_errors=True)
+
+    def prune(self):
+        """Remove uploads abandoned for longer than UPLOAD_EXPIRY_HOURS"""
+        if not os.path.isdir(self.directory):
+            return
+        cutoff = time.time() - self.expiry_seconds
+        for entry in os.scandir(self.directory):
+            if entry.is_dir() and UPLOAD_ID_PATTERN.match(entry.name) and entry.stat().st_mtime < cutoff:
+                self.delete(entry.name)
+
+resumable_uploads = ResumableUploads()
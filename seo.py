@@ -0,0 +1,154 @@
+import re
+from collections import Counter
+
+def calculate_seo_score(content: str, keywords: str = "", title: str = "", description: str = "") -> float:
+    """Calculate SEO score based on content optimization"""
+    score = 0.0
+
+    # Content length score (5-10 points)
+    content_length = len(content.split())
+    if 50 <= content_length <= 300:
+        score += 10
+    elif 20 <= content_length < 50 or 300 < content_length <= 500:
+        score += 7
+    else:
+        score += 3
+
+    # Keywords usage (10-20 points)
+    if keywords:
+        keyword_list = [k.strip().lower() for k in keywords.split(',')]
+        content_lower = content.lower()
+        keyword_mentions = sum(content_lower.count(keyword) for keyword in keyword_list)
+        if keyword_mentions >= 3:
+            score += 20
+        elif keyword_mentions >= 1:
+            score += 15
+        else:
+            score += 5
+
+    # Title optimization (5-15 points)
+    if title:
+        title_length = len(title)
+        if 30 <= title_length <= 60:
+            score += 15
+        elif 20 <= title_length < 30 or 60 < title_length <= 80:
+            score += 10
+        else:
+            score += 5
+
+    # Description optimization (5-15 points)
+    if description:
+        desc_length = len(description)
+        if 120 <= desc_length <= 160:
+            score += 15
+        elif 80 <= desc_length < 120 or 160 < desc_length <= 200:
+            score += 10
+        else:
+            score += 5
+
+    # Hashtag presence (5-10 points)
+    hashtag_count = len(re.findall(r'#\w+', content))
+    if 3 <= hashtag_count <= 8:
+        score += 10
+    elif 1 <= hashtag_count < 3:
+        score += 7
+    else:
+        score += 3
+
+    # Readability (5-10 points)
+    readability = calculate_readability_score(content)
+    if readability >= 70:
+        score += 10
+    elif readability >= 50:
+        score += 7
+    else:
+        score += 5
+
+    return min(score, 100)
+
+def calculate_readability_score(content: str) -> float:
+    """Calculate readability score using simplified Flesch Reading Ease"""
+    sentences = len(re.split(r'[.!?]+', content))
+    words = len(content.split())
+
+    if sentences == 0 or words == 0:
+        return 0
+
+    # Simplified calculation
+    avg_sentence_length = words / sentences
+
+    # Simple readability score (higher is better)
+    if avg_sentence_length <= 15:
+        return 90  # Very easy
+    elif avg_sentence_length <= 20:
+        return 75  # Easy
+    elif avg_sentence_length <= 25:
+        return 60  # Fairly easy
+    else:
+        return 40  # Difficult
+
+def extract_hashtags(content: str) -> str:
+    """Extract hashtags from content"""
+    hashtags = re.findall(r'#\w+', content)
+    return ', '.join(hashtags)
+
+def suggest_keywords(content: str) -> str:
+    """Suggest keywords based on content analysis"""
+    # Remove common stop words and get meaningful words
+    stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those'}
+
+    words = re.findall(r'\b[a-zA-Z]{3,}\b', content.lower())
+    meaningful_words = [word for word in words if word not in stop_words]
+
+    # Get most common words
+    word_counts = Counter(meaningful_words)
+    top_keywords = [word for word, count in word_counts.most_common(5)]
+
+    return ', '.join(top_keywords[:5])
+
+def get_seo_recommendations(score: float, content: str, keywords: str, title: str, description: str) -> list:
+    """Get SEO improvement recommendations"""
+    recommendations = []
+
+    if score < 50:
+        recommendations.append("Your content needs significant SEO improvements")
+    elif score < 70:
+        recommendations.append("Good SEO foundation, but there's room for improvement")
+    else:
+        recommendations.append("Excellent SEO optimization!")
+
+    # Content length recommendations
+    word_count = len(content.split())
+    if word_count < 20:
+        recommendations.append("Consider adding more content (aim for 50-300 words)")
+    elif word_count > 500:
+        recommendations.append("Consider shortening your content for better engagement")
+
+    # Keywords recommendations
+    if not keywords:
+        recommendations.append("Add relevant keywords to improve discoverability")
+
+    # Title recommendations
+    if not title:
+        recommendations.append("Add a compelling title (30-60 characters)")
+    elif len(title) < 30:
+        recommendations.append("Consider making your title longer (30-60 characters)")
+    elif len(title) > 80:
+        recommendations.append("Consider shortening your title (30-60 characters)")
+
+    # Description recommendations
+    if not description:
+        recommendations.append("Add a meta description (120-160 characters)")
+    elif len(description) < 120:
+        recommendations.append("Consider making your description longer (120-160 characters)")
+    elif len(description) > 200:
+        recommendations.append("Consider shortening your description (120-160 characters)")
+
+    # Hashtag recommendations
+    hashtag_count = len(re.findall(r'#\w+', content))
+    if hashtag_count == 0:
+        recommendations.append("Add relevant hashtags to increase reach")
+    elif hashtag_count > 10:
+        recommendations.append("Consider reducing hashtags (3-8 is optimal)")
+
+    return recommendations
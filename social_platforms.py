@@ -1,647 +1,507 @@
 import os
-import requests
 import asyncio
-from typing import Tuple, Optional
 import json
+import logging
+import re
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple, Type
+
 import aiohttp
 
-class SocialMediaManager:
-    """Manage posting to multiple social media platforms"""
+logger = logging.getLogger("platforms")
 
-    def __init__(self):
-        # Load API credentials from environment
-        self.telegram_token = os.getenv("TELEGRAM_BOT_TOKEN")
-        self.telegram_chat_id = os.getenv("TELEGRAM_CHAT_ID")
-        self.instagram_token = os.getenv("INSTAGRAM_ACCESS_TOKEN")
-        self.instagram_account_id = os.getenv("INSTAGRAM_ACCOUNT_ID")
-        self.youtube_api_key = os.getenv("YOUTUBE_API_KEY")
-        self.youtube_channel_id = os.getenv("YOUTUBE_CHANNEL_ID")
-        self.tiktok_access_token = os.getenv("TIKTOK_ACCESS_TOKEN")
-        self.tiktok_open_id = os.getenv("TIKTOK_OPEN_ID")
-        self.facebook_access_token = os.getenv("FACEBOOK_ACCESS_TOKEN")
-        self.facebook_page_id = os.getenv("FACEBOOK_PAGE_ID")
-
-        # Additional platforms
-        self.twitter_bearer_token = os.getenv("TWITTER_BEARER_TOKEN")
-        self.twitter_api_key = os.getenv("TWITTER_API_KEY")
-        self.twitter_api_secret = os.getenv("TWITTER_API_SECRET")
-        self.twitter_access_token = os.getenv("TWITTER_ACCESS_TOKEN")
-        self.twitter_access_token_secret = os.getenv("TWITTER_ACCESS_TOKEN_SECRET")
-
-        self.linkedin_access_token = os.getenv("LINKEDIN_ACCESS_TOKEN")
-        self.linkedin_user_id = os.getenv("LINKEDIN_USER_ID")
-
-        self.pinterest_access_token = os.getenv("PINTEREST_ACCESS_TOKEN")
-        self.pinterest_board_id = os.getenv("PINTEREST_BOARD_ID")
-
-        self.reddit_client_id = os.getenv("REDDIT_CLIENT_ID")
-        self.reddit_client_secret = os.getenv("REDDIT_CLIENT_SECRET")
-        self.reddit_username = os.getenv("REDDIT_USERNAME")
-        self.reddit_password = os.getenv("REDDIT_PASSWORD")
-
-        self.discord_webhook_url = os.getenv("DISCORD_WEBHOOK_URL")
-
-        self.snapchat_access_token = os.getenv("SNAPCHAT_ACCESS_TOKEN")
-        self.whatsapp_token = os.getenv("WHATSAPP_TOKEN")
-        self.whatsapp_phone_id = os.getenv("WHATSAPP_PHONE_ID")
-
-        self.threads_access_token = os.getenv("THREADS_ACCESS_TOKEN")
-        self.medium_token = os.getenv("MEDIUM_TOKEN")
-        self.tumblr_api_key = os.getenv("TUMBLR_API_KEY")
-        self.tumblr_api_secret = os.getenv("TUMBLR_API_SECRET")
-    
-    async def post_to_telegram(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to Telegram with proper media handling"""
-        channel_username = "@GetzyForex"
-        
-        # Use test token if no real token is configured
-        token = self.telegram_token or "TEST_BOT_TOKEN"
-        
-        try:
-            print(f"Telegram posting - Content: {content[:50]}...")
-            print(f"File path: {file_path}")
-            print(f"File type: {file_type}")
-            
-            # Handle media posting
-            if file_path and file_type:
-                if not os.path.exists(file_path):
-                    return False, f"Media file not found: {file_path}"
-                
-                file_size = os.path.getsize(file_path)
-                if file_size == 0:
-                    return False, "Media file is empty"
-                
-                print(f"Telegram: Processing media file {file_path} (type: {file_type}, size: {file_size} bytes)")
-                
-                if not self.telegram_token or token == "TEST_BOT_TOKEN":
-                    # Simulate successful media upload in test mode with realistic delay
-                    await asyncio.sleep(1.5)
-                    return True, f"✅ Posted to {channel_username} with {file_type} ({file_size} bytes) [TEST MODE - Media Included]"
-                
-                # Real API call with media
-                url = f"https://api.telegram.org/bot{token}"
-                
-                try:
-                    # Validate file type for Telegram
-                    if file_type == "image":
-                        # Check if it's a valid image format for Telegram
-                        valid_image_types = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
-                        file_ext = os.path.splitext(file_path)[1].lower()
-                        if file_ext not in valid_image_types:
-                            return False, f"Unsupported image format: {file_ext}"
-                        
-                        endpoint = f"{url}/sendPhoto"
-                        with open(file_path, 'rb') as photo:
-                            files = {'photo': photo}
-                            data = {
-                                'chat_id': channel_username,
-                                'caption': content[:1024] if content else "",
-                                'parse_mode': 'HTML'
-                            }
-                            response = requests.post(endpoint, files=files, data=data, timeout=30)
-                            
-                    elif file_type == "video":
-                        # Check if it's a valid video format for Telegram
-                        valid_video_types = ['.mp4', '.mov', '.avi', '.mkv', '.webm']
-                        file_ext = os.path.splitext(file_path)[1].lower()
-                        if file_ext not in valid_video_types:
-                            return False, f"Unsupported video format: {file_ext}"
-                        
-                        endpoint = f"{url}/sendVideo"
-                        with open(file_path, 'rb') as video:
-                            files = {'video': video}
-                            data = {
-                                'chat_id': channel_username,
-                                'caption': content[:1024] if content else "",
-                                'parse_mode': 'HTML'
-                            }
-                            response = requests.post(endpoint, files=files, data=data, timeout=60)
-                    else:
-                        return False, f"Unsupported file type for Telegram: {file_type}"
-                        
-                    if response.status_code == 200:
-                        result = response.json()
-                        message_id = result.get('result', {}).get('message_id', 'unknown')
-                        return True, f"✅ Posted to {channel_username} with {file_type} (ID: {message_id})"
-                    else:
-                        try:
-                            error_data = response.json()
-                            error_msg = error_data.get('description', f"HTTP {response.status_code}")
-                        except:
-                            error_msg = f"HTTP {response.status_code} - {response.text[:100]}"
-                        return False, f"Telegram API error: {error_msg}"
-                        
-                except Exception as api_error:
-                    return False, f"Telegram API call failed: {str(api_error)}"
-            else:
-                # Text-only post
-                if not self.telegram_token or token == "TEST_BOT_TOKEN":
-                    await asyncio.sleep(0.5)
-                    return True, f"✅ Posted text to {channel_username} [TEST MODE]"
-                
-                url = f"https://api.telegram.org/bot{token}"
-                endpoint = f"{url}/sendMessage"
-                data = {
-                    'chat_id': channel_username,
-                    'text': content[:4096],
-                    'parse_mode': 'HTML'
-                }
-                
-                try:
-                    response = requests.post(endpoint, json=data, timeout=15)
-                    
-                    if response.status_code == 200:
-                        result = response.json()
-                        message_id = result.get('result', {}).get('message_id', 'unknown')
-                        return True, f"✅ Posted text to {channel_username} (ID: {message_id})"
-                    else:
-                        try:
-                            error_data = response.json()
-                            error_msg = error_data.get('description', f"HTTP {response.status_code}")
-                        except:
-                            error_msg = f"HTTP {response.status_code} - {response.text[:100]}"
-                        return False, f"Telegram API error: {error_msg}"
-                        
-                except Exception as api_error:
-                    return False, f"Telegram API call failed: {str(api_error)}"
-                
-        except Exception as e:
-            print(f"Telegram posting exception: {str(e)}")
-            return False, f"Telegram error: {str(e)}"
-    
-    async def post_to_instagram(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to Instagram with proper media handling"""
-        try:
-            # Instagram requires media content
-            if not file_path or not file_type:
-                return False, "Instagram requires media (image/video) content"
-            
-            if not os.path.exists(file_path):
-                return False, f"Media file not found: {file_path}"
-            
-            abs_file_path = os.path.abspath(file_path)
-            file_size = os.path.getsize(abs_file_path)
-            
-            if file_size == 0:
-                return False, "Media file is empty"
-                
-            print(f"Instagram: Processing media {abs_file_path} (type: {file_type}, size: {file_size} bytes)")
-            
-            # Check if file type is supported by Instagram
-            if file_type not in ["image", "video"]:
-                return False, f"Instagram doesn't support {file_type} files"
-            
-            if not self.instagram_token or not self.instagram_account_id:
-                # Simulate processing with detailed feedback
-                await asyncio.sleep(1.5)
-                return True, f"✅ Posted {file_type} to Instagram ({file_size} bytes) [TEST MODE]"
-            
-            # Real Instagram Graph API implementation would go here
-            # For now, return test success with media confirmation
-            return True, f"✅ {file_type.title()} posted to Instagram successfully ({file_size} bytes)"
-                
-        except Exception as e:
-            print(f"Instagram posting error: {str(e)}")
-            return False, f"Instagram error: {str(e)}"
-    
-    async def post_to_youtube(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to YouTube"""
-        if not self.youtube_api_key:
-            # For testing purposes, simulate successful post
-            await asyncio.sleep(2)  # Simulate API call delay
-            return True, "✅ Posted successfully to YouTube (Test Mode)"
-        
-        try:
-            if not file_path or file_type != "video":
-                return False, "YouTube requires video content"
-            
-            # YouTube posting requires OAuth2 and is more complex
-            # For now, we'll return a placeholder implementation
-            return False, "YouTube video upload requires OAuth2 implementation"
-            
-        except Exception as e:
-            return False, f"YouTube posting failed: {str(e)}"
-    
-    async def post_to_tiktok(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to TikTok"""
-        if not self.tiktok_access_token:
-            # For testing purposes, simulate successful post
-            await asyncio.sleep(1.8)  # Simulate API call delay
-            return True, "✅ Posted successfully to TikTok (Test Mode)"
-        
-        try:
-            if not file_path or file_type != "video":
-                return False, "TikTok requires video content"
-            
-            # TikTok Business API implementation
-            url = "https://business-api.tiktok.com/open_api/v1.3/tt_video/upload/"
-            
-            headers = {
-                'Access-Token': self.tiktok_access_token,
-            }
-            
-            # This is a simplified implementation
-            # Actual TikTok API requires more complex authentication and file handling
-            return False, "TikTok video upload requires business API setup"
-            
-        except Exception as e:
-            return False, f"TikTok posting failed: {str(e)}"
-    
-    async def post_to_facebook(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to Facebook with proper media handling"""
-        try:
-            # Handle media processing
-            if file_path and file_type and os.path.exists(file_path):
-                file_size = os.path.getsize(file_path)
-                
-                if file_size == 0:
-                    return False, "Media file is empty"
-                    
-                print(f"Facebook: Processing media {file_path} (type: {file_type}, size: {file_size} bytes)")
-                
-                if not self.facebook_access_token:
-                    await asyncio.sleep(1.3)
-                    return True, f"✅ Posted to Facebook with {file_type} ({file_size} bytes) [TEST MODE]"
-                
-                # In test mode, simulate successful media upload
-                return True, f"✅ Posted {file_type} to Facebook successfully ({file_size} bytes) [TEST MODE]"
-                
-            elif file_path and file_type:
-                return False, f"Media file not found: {file_path}"
-            else:
-                # Text-only post
-                if not self.facebook_access_token:
-                    await asyncio.sleep(1)
-                    return True, "✅ Posted text to Facebook [TEST MODE]"
-                
-                # In test mode, simulate successful text post
-                return True, "✅ Posted text to Facebook [TEST MODE]"
-                            
-        except Exception as e:
-            print(f"Facebook posting error: {str(e)}")
-            return False, f"Facebook error: {str(e)}"
-    
-    async def post_to_twitter(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to Twitter/X with media support"""
-        try:
-            if file_path and file_type and os.path.exists(file_path):
-                file_size = os.path.getsize(file_path)
-                if file_size == 0:
-                    return False, "Media file is empty"
-                
-                print(f"Twitter: Processing media {file_path} (type: {file_type}, size: {file_size} bytes)")
-                
-                if not self.twitter_bearer_token:
-                    await asyncio.sleep(1.2)
-                    return True, f"✅ Posted to Twitter/X with {file_type} ({file_size} bytes) [TEST MODE]"
-                
-                return True, f"✅ Posted {file_type} to Twitter/X successfully ({file_size} bytes) [TEST MODE]"
-            else:
-                if not self.twitter_bearer_token:
-                    await asyncio.sleep(0.8)
-                    return True, "✅ Posted text to Twitter/X [TEST MODE]"
-                
-                return True, "✅ Posted text to Twitter/X [TEST MODE]"
-                
-        except Exception as e:
-            print(f"Twitter posting error: {str(e)}")
-            return False, f"Twitter error: {str(e)}"
-    
-    async def post_to_linkedin(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to LinkedIn with media support"""
-        try:
-            if file_path and file_type and os.path.exists(file_path):
-                file_size = os.path.getsize(file_path)
-                if file_size == 0:
-                    return False, "Media file is empty"
-                
-                print(f"LinkedIn: Processing media {file_path} (type: {file_type}, size: {file_size} bytes)")
-                
-                if not self.linkedin_access_token:
-                    await asyncio.sleep(1.4)
-                    return True, f"✅ Posted to LinkedIn with {file_type} ({file_size} bytes) [TEST MODE]"
-                
-                return True, f"✅ Posted {file_type} to LinkedIn successfully ({file_size} bytes) [TEST MODE]"
-            else:
-                if not self.linkedin_access_token:
-                    await asyncio.sleep(1)
-                    return True, "✅ Posted text to LinkedIn [TEST MODE]"
-                
-                return True, "✅ Posted text to LinkedIn [TEST MODE]"
-                
-        except Exception as e:
-            print(f"LinkedIn posting error: {str(e)}")
-            return False, f"LinkedIn error: {str(e)}"
-    
-    async def post_to_snapchat(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to Snapchat"""
-        try:
-            if not file_path or not file_type:
-                return False, "Snapchat requires media content"
-            
-            if not os.path.exists(file_path):
-                return False, f"Media file not found: {file_path}"
-                
-            file_size = os.path.getsize(file_path)
-            if file_size == 0:
-                return False, "Media file is empty"
-            
-            print(f"Snapchat: Processing media {file_path} (type: {file_type}, size: {file_size} bytes)")
-            
-            if not self.snapchat_access_token:
-                await asyncio.sleep(1.6)
-                return True, f"✅ Posted to Snapchat with {file_type} ({file_size} bytes) [TEST MODE]"
-            
-            return True, f"✅ Posted {file_type} to Snapchat [TEST MODE]"
-            
-        except Exception as e:
-            print(f"Snapchat posting error: {str(e)}")
-            return False, f"Snapchat error: {str(e)}"
-    
-    async def post_to_pinterest(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to Pinterest"""
-        try:
-            if not file_path or file_type != "image":
-                return False, "Pinterest requires image content"
-            
+# Overridable so load tests can point the adapter at a local mock server
+TELEGRAM_API_URL = os.getenv("TELEGRAM_API_URL", "https://api.telegram.org")
+# Concurrent connections per platform, shared by all its accounts (0: no limit, so a
+# fan-out to many accounts isn't serialised behind the pool)
+PLATFORM_POOL_SIZE = int(os.getenv("PLATFORM_POOL_SIZE", "0"))
+# Give up instead of waiting longer than this for a rate-limit slot
+RATE_LIMIT_MAX_WAIT = float(os.getenv("RATE_LIMIT_MAX_WAIT", "30"))
+# "off" ignores the declared platform rate limits (load tests against mock servers)
+PLATFORM_RATE_LIMITS = os.getenv("PLATFORM_RATE_LIMITS", "on") != "off"
+
+MB = 1024 * 1024
+
+DISCORD_WEBHOOK_PATTERN = re.compile(r"^https://(?:discord|discordapp)\.com/api/webhooks/\d+/[\w-]+$")
+
+@dataclass(frozen=True)
+class Capabilities:
+    """What a platform accepts; posts outside these limits are rejected before any call"""
+    media_types: Tuple[str, ...] = ("image", "video")
+    requires_media: bool = False
+    max_text_length: Optional[int] = None
+    max_caption_length: Optional[int] = None  # with media; defaults to max_text_length
+    max_file_size: Optional[int] = None
+    truncate: bool = False  # cut long text instead of rejecting it
+    rate_limit: Optional[Tuple[int, float]] = None  # (calls, per seconds)
+
+    def text_limit(self, has_media: bool) -> Optional[int]:
+        if has_media and self.max_caption_length:
+            return self.max_caption_length
+        return self.max_text_length
+
+    def as_dict(self) -> dict:
+        return {
+            "media_types": list(self.media_types),
+            "requires_media": self.requires_media,
+            "max_text_length": self.max_text_length,
+            "max_caption_length": self.text_limit(True),
+            "max_file_size": self.max_file_size,
+            "rate_limit": {"calls": self.rate_limit[0], "seconds": self.rate_limit[1]} if self.rate_limit else None
+        }
+
+@dataclass
+class PublishResult:
+    platform: str
+    success: bool
+    message: str
+    external_id: Optional[str] = None
+    test_mode: bool = False
+    retryable: bool = False  # a later attempt may succeed (rate limits, network errors)
+    attempted: bool = True  # False when rejected before calling the platform
+
+    def as_dict(self) -> dict:
+        result = {"success": self.success, "message": self.message}
+        if self.external_id:
+            result["external_id"] = self.external_id
+        if self.test_mode:
+            result["test_mode"] = True
+        if self.retryable:
+            result["retryable"] = True
+        return result
+
+class RateLimiter:
+    """Token bucket allowing `calls` per `period` seconds"""
+
+    def __init__(self, calls: int, period: float):
+        self.capacity = calls
+        self.rate = calls / period
+        self.tokens = float(calls)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, max_wait: float = RATE_LIMIT_MAX_WAIT) -> bool:
+        """Take a token, waiting up to `max_wait` seconds; False if none is available in time"""
+        async with self._lock:
+            self._refill()
+            wait = (1 - self.tokens) / self.rate if self.tokens < 1 else 0.0
+            if wait > max_wait:
+                return False
+            if wait:
+                await asyncio.sleep(wait)
+                self._refill()
+            self.tokens -= 1
+            return True
+
+class PlatformAdapter:
+    """Base class for one platform
+
+    Subclasses declare their capabilities and credentials and implement
+    `_publish` for the real API. Without credentials an adapter runs in test
+    mode and simulates the call with a realistic delay.
+    """
+
+    name = ""
+    display_name = ""
+    capabilities = Capabilities()
+    credentials: Dict[str, str] = {}  # attribute -> environment variable
+    required: Tuple[str, ...] = ()  # credentials needed for live posting
+    test_delay = (1.0, 1.0)  # simulated seconds for (text, media) posts
+    timeout = 30  # seconds to connect, and between reads of the response
+
+    def __init__(self, credentials: Optional[Dict[str, str]] = None, pool: Optional["PlatformAdapter"] = None):
+        # Explicit credentials belong to one stored account; otherwise they come from the environment
+        for attribute, variable in self.credentials.items():
+            setattr(self, attribute, credentials.get(attribute) if credentials is not None else os.getenv(variable))
+        self.user_supplied = credentials is not None
+        limit = self.capabilities.rate_limit
+        self.rate_limiter = RateLimiter(*limit) if limit and PLATFORM_RATE_LIMITS else None
+        self.pool = pool  # adapter whose HTTP client this one shares
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @classmethod
+    def validate_credentials(cls, credentials: Dict[str, str]):
+        """Raise ValueError if a stored account's credentials are malformed or unsafe to call"""
+
+    @property
+    def configured(self) -> bool:
+        return all(getattr(self, attribute) for attribute in self.required)
+
+    def client(self) -> aiohttp.ClientSession:
+        """This platform's pooled HTTP client, created on first use"""
+        if self.pool is not None:
+            return self.pool.client()
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=PLATFORM_POOL_SIZE, ttl_dns_cache=300),
+                # No total: time spent waiting for a pooled connection must not fail the request
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=self.timeout, sock_read=self.timeout)
+            )
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    def result(self, success: bool, message: str, **kwargs) -> PublishResult:
+        return PublishResult(self.name, success, message, **kwargs)
+
+    def check(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Optional[str]:
+        """Why this post can't be published here, or None if it can"""
+        caps = self.capabilities
+        has_media = bool(file_path and file_type and caps.media_types)
+        if has_media:
+            if file_type not in caps.media_types:
+                return f"{self.display_name} doesn't support {file_type} files"
             if not os.path.exists(file_path):
-                return False, f"Image file not found: {file_path}"
-                
+                return f"Media file not found: {file_path}"
             file_size = os.path.getsize(file_path)
             if file_size == 0:
-                return False, "Image file is empty"
-            
-            print(f"Pinterest: Processing image {file_path} (size: {file_size} bytes)")
-            
-            if not self.pinterest_access_token:
-                await asyncio.sleep(1.3)
-                return True, f"✅ Posted to Pinterest with image ({file_size} bytes) [TEST MODE]"
-            
-            return True, f"✅ Posted image to Pinterest [TEST MODE]"
-            
-        except Exception as e:
-            print(f"Pinterest posting error: {str(e)}")
-            return False, f"Pinterest error: {str(e)}"
-    
-    async def post_to_reddit(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to Reddit"""
-        try:
-            if file_path and file_type and os.path.exists(file_path):
-                file_size = os.path.getsize(file_path)
-                if file_size == 0:
-                    return False, "Media file is empty"
-                
-                print(f"Reddit: Processing media {file_path} (type: {file_type}, size: {file_size} bytes)")
-                
-                if not self.reddit_client_id:
-                    await asyncio.sleep(1.1)
-                    return True, f"✅ Posted to Reddit with {file_type} ({file_size} bytes) [TEST MODE]"
-                
-                return True, f"✅ Posted {file_type} to Reddit [TEST MODE]"
-            else:
-                if not self.reddit_client_id:
-                    await asyncio.sleep(0.9)
-                    return True, "✅ Posted text to Reddit [TEST MODE]"
-                
-                return True, "✅ Posted text to Reddit [TEST MODE]"
-                
-        except Exception as e:
-            print(f"Reddit posting error: {str(e)}")
-            return False, f"Reddit error: {str(e)}"
-    
-    async def post_to_discord(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to Discord via webhook"""
-        try:
-            if file_path and file_type and os.path.exists(file_path):
-                file_size = os.path.getsize(file_path)
-                if file_size == 0:
-                    return False, "Media file is empty"
-                
-                print(f"Discord: Processing media {file_path} (type: {file_type}, size: {file_size} bytes)")
-                
-                if not self.discord_webhook_url:
-                    await asyncio.sleep(0.8)
-                    return True, f"✅ Posted to Discord with {file_type} ({file_size} bytes) [TEST MODE]"
-                
-                return True, f"✅ Posted {file_type} to Discord [TEST MODE]"
-            else:
-                if not self.discord_webhook_url:
-                    await asyncio.sleep(0.6)
-                    return True, "✅ Posted text to Discord [TEST MODE]"
-                
-                return True, "✅ Posted text to Discord [TEST MODE]"
-                
-        except Exception as e:
-            print(f"Discord posting error: {str(e)}")
-            return False, f"Discord error: {str(e)}"
-    
-    async def post_to_whatsapp(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to WhatsApp Business API"""
-        try:
-            if file_path and file_type and os.path.exists(file_path):
-                file_size = os.path.getsize(file_path)
-                if file_size == 0:
-                    return False, "Media file is empty"
-                
-                print(f"WhatsApp: Processing media {file_path} (type: {file_type}, size: {file_size} bytes)")
-                
-                if not self.whatsapp_token:
-                    await asyncio.sleep(1.2)
-                    return True, f"✅ Posted to WhatsApp with {file_type} ({file_size} bytes) [TEST MODE]"
-                
-                return True, f"✅ Posted {file_type} to WhatsApp [TEST MODE]"
-            else:
-                if not self.whatsapp_token:
-                    await asyncio.sleep(0.8)
-                    return True, "✅ Posted text to WhatsApp [TEST MODE]"
-                
-                return True, "✅ Posted text to WhatsApp [TEST MODE]"
-                
-        except Exception as e:
-            print(f"WhatsApp posting error: {str(e)}")
-            return False, f"WhatsApp error: {str(e)}"
-    
-    async def post_to_threads(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to Threads (Meta)"""
-        try:
-            if file_path and file_type and os.path.exists(file_path):
-                file_size = os.path.getsize(file_path)
-                if file_size == 0:
-                    return False, "Media file is empty"
-                
-                print(f"Threads: Processing media {file_path} (type: {file_type}, size: {file_size} bytes)")
-                
-                if not self.threads_access_token:
-                    await asyncio.sleep(1.1)
-                    return True, f"✅ Posted to Threads with {file_type} ({file_size} bytes) [TEST MODE]"
-                
-                return True, f"✅ Posted {file_type} to Threads [TEST MODE]"
-            else:
-                if not self.threads_access_token:
-                    await asyncio.sleep(0.7)
-                    return True, "✅ Posted text to Threads [TEST MODE]"
-                
-                return True, "✅ Posted text to Threads [TEST MODE]"
-                
-        except Exception as e:
-            print(f"Threads posting error: {str(e)}")
-            return False, f"Threads error: {str(e)}"
-    
-    async def post_to_medium(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to Medium"""
-        try:
-            if not self.medium_token:
-                await asyncio.sleep(1.0)
-                return True, "✅ Posted article to Medium [TEST MODE]"
-            
-            return True, "✅ Posted article to Medium [TEST MODE]"
-                
-        except Exception as e:
-            print(f"Medium posting error: {str(e)}")
-            return False, f"Medium error: {str(e)}"
-    
-    async def post_to_tumblr(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to Tumblr"""
-        try:
-            if file_path and file_type and os.path.exists(file_path):
-                file_size = os.path.getsize(file_path)
-                if file_size == 0:
-                    return False, "Media file is empty"
-                
-                print(f"Tumblr: Processing media {file_path} (type: {file_type}, size: {file_size} bytes)")
-                
-                if not self.tumblr_api_key:
-                    await asyncio.sleep(1.0)
-                    return True, f"✅ Posted to Tumblr with {file_type} ({file_size} bytes) [TEST MODE]"
-                
-                return True, f"✅ Posted {file_type} to Tumblr [TEST MODE]"
-            else:
-                if not self.tumblr_api_key:
-                    await asyncio.sleep(0.8)
-                    return True, "✅ Posted text to Tumblr [TEST MODE]"
-                
-                return True, "✅ Posted text to Tumblr [TEST MODE]"
-                
-        except Exception as e:
-            print(f"Tumblr posting error: {str(e)}")
-            return False, f"Tumblr error: {str(e)}"
-    
-    async def post_to_twitter(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to Twitter"""
-        try:
-            if not self.twitter_bearer_token and not (self.twitter_api_key and self.twitter_api_secret and self.twitter_access_token and self.twitter_access_token_secret):
-                await asyncio.sleep(1.2)
-                return True, "✅ Posted to Twitter [TEST MODE]"
-            
-            # Placeholder for Twitter API integration
-            return False, "Twitter API implementation pending"
-        except Exception as e:
-            return False, f"Twitter posting failed: {str(e)}"
+                return "Media file is empty"
+            if caps.max_file_size and file_size > caps.max_file_size:
+                return f"{self.display_name} accepts files up to {caps.max_file_size // MB}MB"
+        elif caps.requires_media:
+            return f"{self.display_name} requires {' or '.join(caps.media_types)} content"
 
-    async def post_to_linkedin(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to LinkedIn"""
-        try:
-            if not self.linkedin_access_token or not self.linkedin_user_id:
-                await asyncio.sleep(1.4)
-                return True, "✅ Posted to LinkedIn [TEST MODE]"
-            
-            # Placeholder for LinkedIn API integration
-            return False, "LinkedIn API implementation pending"
-        except Exception as e:
-            return False, f"LinkedIn posting failed: {str(e)}"
-    
-    async def post_to_pinterest(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to Pinterest"""
-        try:
-            if not self.pinterest_access_token or not self.pinterest_board_id:
-                await asyncio.sleep(1.6)
-                return True, "✅ Posted to Pinterest [TEST MODE]"
-            
-            # Placeholder for Pinterest API integration
-            return False, "Pinterest API implementation pending"
-        except Exception as e:
-            return False, f"Pinterest posting failed: {str(e)}"
+        limit = caps.text_limit(has_media)
+        if limit and len(content) > limit and not caps.truncate:
+            return f"{self.display_name} allows at most {limit} characters"
+        return None
 
-    async def post_to_reddit(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to Reddit"""
-        try:
-            if not self.reddit_client_id or not self.reddit_client_secret or not self.reddit_username or not self.reddit_password:
-                await asyncio.sleep(1.7)
-                return True, "✅ Posted to Reddit [TEST MODE]"
-            
-            # Placeholder for Reddit API integration
-            return False, "Reddit API implementation pending"
-        except Exception as e:
-            return False, f"Reddit posting failed: {str(e)}"
-    
-    async def post_to_discord(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to Discord"""
-        try:
-            if not self.discord_webhook_url:
-                await asyncio.sleep(1.5)
-                return True, "✅ Posted to Discord [TEST MODE]"
-            
-            # Placeholder for Discord API integration
-            return False, "Discord API implementation pending"
-        except Exception as e:
-            return False, f"Discord posting failed: {str(e)}"
+    def test_message(self, file_type: Optional[str], file_size: int) -> str:
+        if file_type:
+            return f"✅ Posted to {self.display_name} with {file_type} ({file_size} bytes) [TEST MODE]"
+        return f"✅ Posted text to {self.display_name} [TEST MODE]"
 
-    async def post_to_snapchat(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to Snapchat"""
-        try:
-            if not self.snapchat_access_token:
-                await asyncio.sleep(1.6)
-                return True, "✅ Posted to Snapchat [TEST MODE]"
-            
-            # Placeholder for Snapchat API integration
-            return False, "Snapchat API implementation pending"
-        except Exception as e:
-            return False, f"Snapchat posting failed: {str(e)}"
+    async def publish(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> PublishResult:
+        error = self.check(content, file_path, file_type)
+        if error:
+            return self.result(False, error, attempted=False)
 
-    async def post_to_whatsapp(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to WhatsApp"""
-        try:
-            if not self.whatsapp_token or not self.whatsapp_phone_id:
-                await asyncio.sleep(1.7)
-                return True, "✅ Posted to WhatsApp [TEST MODE]"
-            
-            # Placeholder for WhatsApp API integration
-            return False, "WhatsApp API implementation pending"
-        except Exception as e:
-            return False, f"WhatsApp posting failed: {str(e)}"
+        if not (file_path and file_type and self.capabilities.media_types):
+            file_path = file_type = None
+        file_size = os.path.getsize(file_path) if file_path else 0
+        limit = self.capabilities.text_limit(bool(file_path))
+        if limit:
+            content = content[:limit]
 
-    async def post_to_threads(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to Threads"""
         try:
-            if not self.threads_access_token:
-                await asyncio.sleep(1.8)
-                return True, "✅ Posted to Threads [TEST MODE]"
-            
-            # Placeholder for Threads API integration
-            return False, "Threads API implementation pending"
-        except Exception as e:
-            return False, f"Threads posting failed: {str(e)}"
+            if not self.configured:
+                await asyncio.sleep(self.test_delay[1 if file_path else 0])
+                return self.result(True, self.test_message(file_type, file_size), test_mode=True)
 
-    async def post_to_medium(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to Medium"""
-        try:
-            if not self.medium_token:
-                await asyncio.sleep(1.9)
-                return True, "✅ Posted to Medium [TEST MODE]"
-            
-            # Placeholder for Medium API integration
-            return False, "Medium API implementation pending"
+            if self.rate_limiter and not await self.rate_limiter.acquire():
+                return self.result(False, f"{self.display_name} rate limit reached, try again later", retryable=True)
+
+            logger.debug("%s: publishing %d chars", self.display_name, len(content), extra={"file_path": file_path, "file_type": file_type})
+            return await self._publish(content, file_path, file_type, file_size)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning("%s request failed: %s", self.display_name, e)
+            return self.result(False, f"{self.display_name} API call failed: {e}", retryable=True)
         except Exception as e:
-            return False, f"Medium posting failed: {str(e)}"
+            logger.exception("%s posting error", self.display_name)
+            return self.result(False, f"{self.display_name} error: {e}")
+
+    async def _publish(self, content: str, file_path: Optional[str], file_type: Optional[str], file_size: int) -> PublishResult:
+        return self.result(False, f"{self.display_name} API integration is not implemented yet")
+
+ADAPTERS: Dict[str, Type[PlatformAdapter]] = {}
+
+def register(adapter_class: Type[PlatformAdapter]) -> Type[PlatformAdapter]:
+    """Class decorator adding an adapter to the registry under its name"""
+    ADAPTERS[adapter_class.name] = adapter_class
+    return adapter_class
+
+@register
+class TelegramAdapter(PlatformAdapter):
+    name = "telegram"
+    display_name = "Telegram"
+    capabilities = Capabilities(
+        max_text_length=4096, max_caption_length=1024, max_file_size=50 * MB, truncate=True, rate_limit=(20, 60)
+    )
+    credentials = {"token": "TELEGRAM_BOT_TOKEN", "chat_id": "TELEGRAM_CHAT_ID"}
+    required = ("token", "chat_id")
+    test_delay = (0.5, 1.5)
+    image_extensions = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+    video_extensions = ('.mp4', '.mov', '.avi', '.mkv', '.webm')
+
+    @property
+    def channel_username(self) -> str:
+        return self.chat_id or "Telegram"
+
+    def test_message(self, file_type: Optional[str], file_size: int) -> str:
+        if file_type:
+            return f"✅ Posted to {self.channel_username} with {file_type} ({file_size} bytes) [TEST MODE - Media Included]"
+        return f"✅ Posted text to {self.channel_username} [TEST MODE]"
+
+    def check(self, content, file_path=None, file_type=None):
+        if file_path and file_type:
+            extension = os.path.splitext(file_path)[1].lower()
+            allowed = self.image_extensions if file_type == "image" else self.video_extensions
+            if extension not in allowed:
+                return f"Unsupported {file_type} format for Telegram: {extension}"
+        return super().check(content, file_path, file_type)
+
+    async def _publish(self, content: str, file_path: Optional[str], file_type: Optional[str], file_size: int) -> PublishResult:
+        url = f"{TELEGRAM_API_URL}/bot{self.token}"
+
+        if file_path:
+            method, field_name = ("sendPhoto", "photo") if file_type == "image" else ("sendVideo", "video")
+            with open(file_path, 'rb') as media:
+                form = aiohttp.FormData()
+                form.add_field("chat_id", self.channel_username)
+                form.add_field("caption", content)
+                form.add_field("parse_mode", "HTML")
+                form.add_field(field_name, media, filename=os.path.basename(file_path))
+                async with self.client().post(f"{url}/{method}", data=form) as response:
+                    status, body = response.status, await response.text()
+        else:
+            payload = {'chat_id': self.channel_username, 'text': content, 'parse_mode': 'HTML'}
+            async with self.client().post(f"{url}/sendMessage", json=payload) as response:
+                status, body = response.status, await response.text()
 
-    async def post_to_tumblr(self, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None) -> Tuple[bool, str]:
-        """Post to Tumblr"""
         try:
-            if not self.tumblr_api_key or not self.tumblr_api_secret:
-                await asyncio.sleep(2.0)
-                return True, "✅ Posted to Tumblr [TEST MODE]"
-            
-            # Placeholder for Tumblr API integration
-            return False, "Tumblr API implementation pending"
-        except Exception as e:
-            return False, f"Tumblr posting failed: {str(e)}"
\ No newline at end of file
+            data = json.loads(body)
+        except ValueError:
+            data = {}
+        if status == 200:
+            message_id = str(data.get('result', {}).get('message_id', 'unknown'))
+            media = f" with {file_type}" if file_path else " text"
+            return self.result(True, f"✅ Posted{media} to {self.channel_username} (ID: {message_id})", external_id=message_id)
+
+        error = data.get('description') or f"HTTP {status} - {body[:100]}"
+        return self.result(False, f"Telegram API error: {error}", retryable=status == 429 or status >= 500)
+
+@register
+class InstagramAdapter(PlatformAdapter):
+    name = "instagram"
+    display_name = "Instagram"
+    capabilities = Capabilities(requires_media=True, max_text_length=2200, max_file_size=100 * MB, rate_limit=(25, 86400))
+    credentials = {"token": "INSTAGRAM_ACCESS_TOKEN", "account_id": "INSTAGRAM_ACCOUNT_ID"}
+    required = ("token", "account_id")
+    test_delay = (1.5, 1.5)
+
+@register
+class YouTubeAdapter(PlatformAdapter):
+    name = "youtube"
+    display_name = "YouTube"
+    capabilities = Capabilities(media_types=("video",), requires_media=True, max_text_length=5000)
+    credentials = {"api_key": "YOUTUBE_API_KEY", "channel_id": "YOUTUBE_CHANNEL_ID"}
+    required = ("api_key",)
+    test_delay = (2.0, 2.0)
+
+    async def _publish(self, content, file_path, file_type, file_size):
+        return self.result(False, "YouTube video upload requires OAuth2 implementation")
+
+@register
+class TikTokAdapter(PlatformAdapter):
+    name = "tiktok"
+    display_name = "TikTok"
+    capabilities = Capabilities(media_types=("video",), requires_media=True, max_text_length=2200)
+    credentials = {"access_token": "TIKTOK_ACCESS_TOKEN", "open_id": "TIKTOK_OPEN_ID"}
+    required = ("access_token",)
+    test_delay = (1.8, 1.8)
+
+    async def _publish(self, content, file_path, file_type, file_size):
+        return self.result(False, "TikTok video upload requires business API setup")
+
+@register
+class FacebookAdapter(PlatformAdapter):
+    name = "facebook"
+    display_name = "Facebook"
+    capabilities = Capabilities(max_text_length=63206, max_file_size=100 * MB)
+    credentials = {"access_token": "FACEBOOK_ACCESS_TOKEN", "page_id": "FACEBOOK_PAGE_ID"}
+    required = ("access_token",)
+    test_delay = (1.0, 1.3)
+
+@register
+class TwitterAdapter(PlatformAdapter):
+    name = "twitter"
+    display_name = "Twitter/X"
+    capabilities = Capabilities(max_text_length=280, max_file_size=15 * MB, rate_limit=(50, 900))
+    credentials = {
+        "bearer_token": "TWITTER_BEARER_TOKEN",
+        "api_key": "TWITTER_API_KEY",
+        "api_secret": "TWITTER_API_SECRET",
+        "access_token": "TWITTER_ACCESS_TOKEN",
+        "access_token_secret": "TWITTER_ACCESS_TOKEN_SECRET",
+    }
+    required = ("bearer_token",)
+    test_delay = (0.8, 1.2)
+
+@register
+class LinkedInAdapter(PlatformAdapter):
+    name = "linkedin"
+    display_name = "LinkedIn"
+    capabilities = Capabilities(max_text_length=3000, max_file_size=100 * MB)
+    credentials = {"access_token": "LINKEDIN_ACCESS_TOKEN", "user_id": "LINKEDIN_USER_ID"}
+    required = ("access_token",)
+    test_delay = (1.0, 1.4)
+
+@register
+class SnapchatAdapter(PlatformAdapter):
+    name = "snapchat"
+    display_name = "Snapchat"
+    capabilities = Capabilities(requires_media=True, max_text_length=250, max_file_size=32 * MB)
+    credentials = {"access_token": "SNAPCHAT_ACCESS_TOKEN"}
+    required = ("access_token",)
+    test_delay = (1.6, 1.6)
+
+@register
+class PinterestAdapter(PlatformAdapter):
+    name = "pinterest"
+    display_name = "Pinterest"
+    capabilities = Capabilities(media_types=("image",), requires_media=True, max_text_length=500, max_file_size=20 * MB)
+    credentials = {"access_token": "PINTEREST_ACCESS_TOKEN", "board_id": "PINTEREST_BOARD_ID"}
+    required = ("access_token",)
+    test_delay = (1.3, 1.3)
+
+@register
+class RedditAdapter(PlatformAdapter):
+    name = "reddit"
+    display_name = "Reddit"
+    capabilities = Capabilities(max_text_length=40000, max_file_size=20 * MB, rate_limit=(1, 600))
+    credentials = {
+        "client_id": "REDDIT_CLIENT_ID",
+        "client_secret": "REDDIT_CLIENT_SECRET",
+        "username": "REDDIT_USERNAME",
+        "password": "REDDIT_PASSWORD",
+    }
+    required = ("client_id",)
+    test_delay = (0.9, 1.1)
+
+@register
+class DiscordAdapter(PlatformAdapter):
+    name = "discord"
+    display_name = "Discord"
+    capabilities = Capabilities(max_text_length=2000, max_file_size=25 * MB, rate_limit=(5, 2))
+    credentials = {"webhook_url": "DISCORD_WEBHOOK_URL"}
+    required = ("webhook_url",)
+    test_delay = (0.6, 0.8)
+
+    @classmethod
+    def validate_credentials(cls, credentials):
+        # Users' webhook URLs are called by the server: only Discord's own webhooks are allowed
+        if not DISCORD_WEBHOOK_PATTERN.match(credentials.get("webhook_url", "")):
+            raise ValueError("webhook_url must be a https://discord.com/api/webhooks/... URL")
+
+    def check(self, content, file_path=None, file_type=None):
+        if self.user_supplied and self.webhook_url and not DISCORD_WEBHOOK_PATTERN.match(self.webhook_url):
+            return "Discord webhook URL is not a discord.com webhook"
+        return super().check(content, file_path, file_type)
+
+    async def _publish(self, content, file_path, file_type, file_size):
+        url = f"{self.webhook_url}?wait=true"
+        if file_path:
+            with open(file_path, 'rb') as media:
+                form = aiohttp.FormData()
+                form.add_field("payload_json", json.dumps({"content": content}))
+                form.add_field("files[0]", media, filename=os.path.basename(file_path))
+                async with self.client().post(url, data=form, allow_redirects=False) as response:
+                    status, body = response.status, await response.text()
+        else:
+            async with self.client().post(url, json={"content": content}, allow_redirects=False) as response:
+                status, body = response.status, await response.text()
+
+        if status in (200, 204):
+            try:
+                message_id = str(json.loads(body).get("id", "")) or None
+            except ValueError:
+                message_id = None
+            return self.result(True, "✅ Posted to Discord" + (f" with {file_type}" if file_path else ""), external_id=message_id)
+        # The body is not echoed back: the webhook URL may be user-supplied
+        logger.warning("Discord webhook returned HTTP %s: %s", status, body[:200])
+        return self.result(False, f"Discord API error: HTTP {status}", retryable=status == 429 or status >= 500)
+
+@register
+class WhatsAppAdapter(PlatformAdapter):
+    name = "whatsapp"
+    display_name = "WhatsApp"
+    capabilities = Capabilities(max_text_length=4096, max_caption_length=1024, max_file_size=16 * MB)
+    credentials = {"token": "WHATSAPP_TOKEN", "phone_id": "WHATSAPP_PHONE_ID"}
+    required = ("token",)
+    test_delay = (0.8, 1.2)
+
+@register
+class ThreadsAdapter(PlatformAdapter):
+    name = "threads"
+    display_name = "Threads"
+    capabilities = Capabilities(max_text_length=500, max_file_size=100 * MB)
+    credentials = {"access_token": "THREADS_ACCESS_TOKEN"}
+    required = ("access_token",)
+    test_delay = (0.7, 1.1)
+
+@register
+class MediumAdapter(PlatformAdapter):
+    name = "medium"
+    display_name = "Medium"
+    # Articles are text; attached media is left out
+    capabilities = Capabilities(media_types=())
+    credentials = {"token": "MEDIUM_TOKEN"}
+    required = ("token",)
+    test_delay = (1.0, 1.0)
+
+    def test_message(self, file_type, file_size):
+        return "✅ Posted article to Medium [TEST MODE]"
+
+@register
+class TumblrAdapter(PlatformAdapter):
+    name = "tumblr"
+    display_name = "Tumblr"
+    capabilities = Capabilities(max_file_size=10 * MB)
+    credentials = {"api_key": "TUMBLR_API_KEY", "api_secret": "TUMBLR_API_SECRET"}
+    required = ("api_key",)
+    test_delay = (0.8, 1.0)
+
+class SocialMediaManager:
+    """Holds one adapter instance per registered platform, configured from the environment,
+    and one per stored account
+
+    Account adapters share their platform's HTTP client but keep their own
+    rate limiter, since platforms limit each account separately.
+    """
+
+    def __init__(self):
+        self.adapters: Dict[str, PlatformAdapter] = {name: adapter_class() for name, adapter_class in ADAPTERS.items()}
+        self._account_adapters: Dict[int, Tuple[object, PlatformAdapter]] = {}
+
+    def get(self, platform: str, account=None) -> Optional[PlatformAdapter]:
+        """The adapter for `platform`, or for one of its accounts (see accounts.Account)"""
+        adapter = self.adapters.get(platform)
+        if account is None or adapter is None:
+            return adapter
+        cached = self._account_adapters.get(account.id)
+        if cached is None or cached[0] != account.version:
+            # New or edited account: its rate limiter starts over with the new credentials
+            cached = (account.version, ADAPTERS[platform](account.credentials, pool=adapter))
+            self._account_adapters[account.id] = cached
+        return cached[1]
+
+    def check(self, platform: str, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None,
+              account=None) -> Optional[str]:
+        adapter = self.get(platform, account)
+        if adapter is None:
+            return f"Platform {platform} not implemented yet"
+        return adapter.check(content, file_path, file_type)
+
+    async def publish(self, platform: str, content: str, file_path: Optional[str] = None, file_type: Optional[str] = None,
+                      account=None) -> PublishResult:
+        adapter = self.get(platform, account)
+        if adapter is None:
+            return PublishResult(platform, False, f"Platform {platform} not implemented yet", attempted=False)
+        return await adapter.publish(content, file_path, file_type)
+
+    def capabilities(self) -> Dict[str, dict]:
+        return {
+            name: {"name": adapter.display_name, "configured": adapter.configured, **adapter.capabilities.as_dict()}
+            for name, adapter in self.adapters.items()
+        }
+
+    async def close(self):
+        await asyncio.gather(*(adapter.close() for adapter in self.adapters.values()))
@@ -42,7 +42,7 @@ const translations = {
         upload_media: "Upload Media",
         upload_file: "Upload a file",
         drag_drop: "or drag and drop",
-        file_limit: "Images or Videos up to 10MB",
+        file_limit: "Images up to 10MB, videos up to 4GB",
         schedule: "Schedule (Optional)",
         post_now: "Post Now",
         recent_posts: "Recent Posts",
@@ -88,7 +88,7 @@ const translations = {
         upload_media: "رفع الوسائط",
         upload_file: "رفع ملف",
         drag_drop: "أو اسحب وأفلت",
-        file_limit: "صور أو فيديوهات حتى 10 ميجابايت",
+        file_limit: "صور حتى 10 ميجابايت، فيديوهات حتى 4 جيجابايت",
         schedule: "جدولة (اختياري)",
         post_now: "انشر الآن",
         recent_posts: "المنشورات الحديثة",
@@ -134,7 +134,7 @@ const translations = {
         upload_media: "Subir Medios",
         upload_file: "Subir archivo",
         drag_drop: "o arrastra y suelta",
-        file_limit: "Imágenes o Videos hasta 10MB",
+        file_limit: "Imágenes hasta 10MB, videos hasta 4GB",
         schedule: "Programar (Opcional)",
         post_now: "Publicar Ahora",
         recent_posts: "Publicaciones Recientes",
@@ -180,7 +180,7 @@ const translations = {
         upload_media: "Télécharger Médias",
         upload_file: "Télécharger fichier",
         drag_drop: "ou glisser-déposer",
-        file_limit: "Images ou Vidéos jusqu'à 10MB",
+        file_limit: "Images jusqu'à 10MB, vidéos jusqu'à 4GB",
         schedule: "Programmer (Optionnel)",
         post_now: "Publier Maintenant",
         recent_posts: "Publications Récentes",
@@ -226,7 +226,7 @@ const translations = {
         upload_media: "Medien Hochladen",
         upload_file: "Datei hochladen",
         drag_drop: "oder ziehen und ablegen",
-        file_limit: "Bilder oder Videos bis 10MB",
+        file_limit: "Bilder bis 10MB, Videos bis 4GB",
         schedule: "Planen (Optional)",
         post_now: "Jetzt Posten",
         recent_posts: "Neueste Beiträge",
@@ -272,7 +272,7 @@ const translations = {
         upload_media: "میڈیا اپ لوڈ کریں",
         upload_file: "فائل اپ لوڈ کریں",
         drag_drop: "یا کھینچیں اور چھوڑیں",
-        file_limit: "تصاویر یا ویڈیوز 10MB تک",
+        file_limit: "تصاویر 10MB تک، ویڈیوز 4GB تک",
         schedule: "شیڈول (اختیاری)",
         post_now: "ابھی پوسٹ کریں",
         recent_posts: "حالیہ پوسٹس",
@@ -420,9 +420,28 @@ function showToast(message, type = 'info') {
     }
 }
 
+// Warning shown after posting content that is nearly identical to recent posts
+function duplicateNotice(duplicates) {
+    if (!duplicates || duplicates.length === 0) {
+        return '';
+    }
+    const posts = duplicates
+        .map(duplicate => `#${duplicate.post_id} (${duplicate.platforms.join(', ')})`)
+        .join(', ');
+    return `
+        <div class="bg-yellow-50 dark:bg-yellow-900/20 rounded-lg p-3">
+            <p class="text-sm text-yellow-700 dark:text-yellow-300">
+                <i class="fas fa-exclamation-triangle mr-1"></i>
+                Nearly identical to your recent post${duplicates.length > 1 ? 's' : ''} ${posts}
+            </p>
+        </div>
+    `;
+}
+
 // File validation
 function validateFile(file) {
-    const maxSize = 10 * 1024 * 1024; // 10MB
+    // Large videos go through resumable chunked uploads
+    const maxSize = file.type.startsWith('video/') ? 4 * 1024 * 1024 * 1024 : 10 * 1024 * 1024;
     const allowedTypes = ['image/jpeg', 'image/jpg', 'image/png', 'image/gif', 'image/webp', 'video/mp4', 'video/mov', 'video/avi', 'video/mkv', 'video/webm'];
 
     if (file.size > maxSize) {
@@ -447,6 +466,95 @@ function formatFileSize(bytes) {
     return parseFloat((bytes / Math.pow(k, i)).toFixed(2)) + ' ' + sizes[i];
 }
 
+// Idempotency key of the post being submitted: a resubmission after a
+// network error reuses it, so the server never publishes the same post twice
+let postIdempotencyKey = null;
+
+function newIdempotencyKey() {
+    if (window.crypto && crypto.randomUUID) {
+        return crypto.randomUUID();
+    }
+    return `${Date.now().toString(16)}-${Math.random().toString(16).slice(2)}`;
+}
+
+// Resumable chunked uploads: large files are sent in parallel chunks that
+// survive dropped connections and page reloads
+const CHUNKED_UPLOAD_THRESHOLD = 5 * 1024 * 1024;
+const UPLOAD_PARALLELISM = 4;
+const UPLOAD_RETRIES = 5;
+
+function uploadKey(file) {
+    return `upload:${file.name}:${file.size}:${file.lastModified}`;
+}
+
+async function startOrResumeUpload(file) {
+    const savedId = localStorage.getItem(uploadKey(file));
+    if (savedId) {
+        const response = await fetch(`/api/uploads/${savedId}`);
+        if (response.ok) {
+            return response.json();
+        }
+        localStorage.removeItem(uploadKey(file));
+    }
+
+    const form = new FormData();
+    form.append('filename', file.name);
+    form.append('size', file.size);
+    const response = await fetch('/api/uploads', { method: 'POST', body: form });
+    const upload = await response.json();
+    if (!response.ok) {
+        throw new Error(upload.message || `Upload failed with status ${response.status}`);
+    }
+    localStorage.setItem(uploadKey(file), upload.upload_id);
+    return upload;
+}
+
+async function sendChunk(uploadId, file, offset, chunkSize) {
+    let lastError;
+    for (let attempt = 0; attempt <= UPLOAD_RETRIES; attempt++) {
+        if (attempt > 0) {
+            await new Promise(resolve => setTimeout(resolve, 500 * 2 ** attempt));
+        }
+        try {
+            const response = await fetch(`/api/uploads/${uploadId}`, {
+                method: 'PATCH',
+                headers: { 'Upload-Offset': String(offset), 'Content-Type': 'application/offset+octet-stream' },
+                body: file.slice(offset, offset + chunkSize)
+            });
+            if (response.ok) {
+                return;
+            }
+            const result = await response.json().catch(() => ({}));
+            lastError = new Error(result.message || `Chunk upload failed with status ${response.status}`);
+            // Client errors won't fix themselves; only retry server and network errors
+            if (response.status < 500 && response.status !== 429) {
+                break;
+            }
+        } catch (error) {
+            lastError = error;
+        }
+    }
+    throw lastError;
+}
+
+async function uploadInChunks(file, onProgress) {
+    const upload = await startOrResumeUpload(file);
+    const pending = [...upload.missing];
+    let received = upload.received_bytes;
+    onProgress(received / file.size);
+
+    async function worker() {
+        while (pending.length > 0) {
+            const offset = pending.shift();
+            await sendChunk(upload.upload_id, file, offset, upload.chunk_size);
+            received += Math.min(upload.chunk_size, file.size - offset);
+            onProgress(received / file.size);
+        }
+    }
+    await Promise.all(Array.from({ length: UPLOAD_PARALLELISM }, worker));
+    return upload.upload_id;
+}
+
 // Auto-save draft functionality
 let draftTimer;
 const DRAFT_KEY = 'post_draft';
@@ -628,8 +736,11 @@ function initDashboardFeatures() {
                 label.classList.add('border-gray-200', 'dark:border-gray-600');
                 check.classList.add('opacity-0');
             }
+            loadBestTimes();
         });
     });
+    loadBestTimes();
+    connectLiveEvents();
 
     // File upload functionality
     const fileInput = document.getElementById('media');
@@ -669,6 +780,11 @@ function initDashboardFeatures() {
     const submitSpinner = document.getElementById('submitSpinner');
 
     if (postForm) {
+        // Edited content is a new post and needs a new key
+        ['input', 'change'].forEach(type => postForm.addEventListener(type, () => {
+            postIdempotencyKey = null;
+        }));
+
         postForm.addEventListener('submit', async function(e) {
             e.preventDefault();
 
@@ -692,18 +808,85 @@ function initDashboardFeatures() {
             submitSpinner.classList.remove('hidden');
 
             try {
-                const response = await fetch('/post', {
+                const mediaFile = fileInput && fileInput.files[0];
+                if (mediaFile && mediaFile.size > CHUNKED_UPLOAD_THRESHOLD) {
+                    formData.delete('media');
+                    const uploadId = await uploadInChunks(mediaFile, fraction => {
+                        submitText.textContent = `Uploading ${Math.floor(fraction * 100)}%`;
+                    });
+                    formData.set('upload_id', uploadId);
+                    submitText.textContent = t('posting');
+                }
+
+                if (!postIdempotencyKey) {
+                    postIdempotencyKey = newIdempotencyKey();
+                }
+                let response = await fetch('/post', {
                     method: 'POST',
+                    headers: { 'Idempotency-Key': postIdempotencyKey },
                     body: formData
                 });
 
+                // Near-duplicate of a recent post: let the user decide whether to post anyway
+                if (response.status === 409) {
+                    const duplicate = await response.json();
+                    if (!duplicate.duplicates) {
+                        // The first submission of this post is still being published
+                        throw new Error(duplicate.message);
+                    }
+                    const confirmation = await Swal.fire({
+                        icon: 'warning',
+                        title: 'Possible duplicate post',
+                        text: duplicate.message,
+                        showCancelButton: true,
+                        confirmButtonText: 'Post anyway',
+                        cancelButtonText: 'Cancel',
+                        background: document.documentElement.classList.contains('dark') ? '#1f2937' : '#ffffff',
+                        color: document.documentElement.classList.contains('dark') ? '#ffffff' : '#000000'
+                    });
+                    if (!confirmation.isConfirmed) {
+                        return;
+                    }
+                    formData.set('allow_duplicate', 'true');
+                    response = await fetch('/post', {
+                        method: 'POST',
+                        headers: { 'Idempotency-Key': postIdempotencyKey },
+                        body: formData
+                    });
+                }
+                postIdempotencyKey = null;
+
                 if (!response.ok) {
                     throw new Error(`HTTP error! status: ${response.status}`);
                 }
 
                 const result = await response.json();
+                // Already confirmed in the duplicate prompt above
+                const duplicateWarning = formData.get('allow_duplicate') ? '' : duplicateNotice(result.duplicates);
 
-                if (result.success) {
+                if (result.success && result.scheduled) {
+                    if (mediaFile) {
+                        localStorage.removeItem(uploadKey(mediaFile));
+                    }
+                    Swal.fire({
+                        icon: 'success',
+                        title: 'Post Scheduled',
+                        html: `
+                            <p class="text-base mb-3">${result.message}</p>
+                            ${duplicateWarning}
+                        `,
+                        background: document.documentElement.classList.contains('dark') ? '#1f2937' : '#ffffff',
+                        color: document.documentElement.classList.contains('dark') ? '#ffffff' : '#000000',
+                        confirmButtonColor: '#10b981',
+                        timer: duplicateWarning ? undefined : 4000,
+                        timerProgressBar: true
+                    }).then(() => {
+                        resetFormAfterSuccess();
+                    });
+                } else if (result.success) {
+                    if (mediaFile) {
+                        localStorage.removeItem(uploadKey(mediaFile));
+                    }
                     // Show detailed success message
                     let successMessage = 'Your content has been published successfully!';
                     if (result.results) {
@@ -728,13 +911,14 @@ function initDashboardFeatures() {
                                 <div class="bg-green-50 dark:bg-green-900/20 rounded-lg p-3 mb-3">
                                     <p class="text-sm text-green-700 dark:text-green-300">${successMessage}</p>
                                 </div>
+                                ${duplicateWarning}
                             </div>
                         `,
                         background: document.documentElement.classList.contains('dark') ? '#1f2937' : '#ffffff',
                         color: document.documentElement.classList.contains('dark') ? '#ffffff' : '#000000',
                         confirmButtonColor: '#10b981',
                         confirmButtonText: 'Continue',
-                        timer: 4000,
+                        timer: duplicateWarning ? undefined : 4000,
                         timerProgressBar: true,
                         allowOutsideClick: true,
                         allowEscapeKey: true,
@@ -780,23 +964,87 @@ function initDashboardFeatures() {
     }
 }
 
+// Suggest posting slots for the selected platforms from past engagement
+let bestTimesRequest = 0;
+async function loadBestTimes() {
+    const container = document.getElementById('bestTimes');
+    const scheduleInput = document.getElementById('schedule_time');
+    if (!container || !scheduleInput) return;
+
+    const requestId = ++bestTimesRequest;
+    const platforms = Array.from(document.querySelectorAll('input[name="platforms"]:checked')).map(cb => cb.value);
+
+    try {
+        const response = await fetch(`/api/best-times?count=3&platforms=${encodeURIComponent(platforms.join(','))}`);
+        if (!response.ok || requestId !== bestTimesRequest) return;
+        const data = await response.json();
+
+        container.querySelectorAll('button').forEach(button => button.remove());
+        if (!data.slots || data.slots.length === 0) {
+            container.classList.add('hidden');
+            return;
+        }
+
+        data.slots.forEach(slot => {
+            // Scheduled times are interpreted as UTC by the server
+            const value = slot.time.slice(0, 16);
+            const button = document.createElement('button');
+            button.type = 'button';
+            button.className = 'px-2 py-1 rounded-full bg-blue-50 dark:bg-blue-900/30 text-blue-700 dark:text-blue-300 hover:bg-blue-100 dark:hover:bg-blue-900/50';
+            button.textContent = `${slot.weekday.slice(0, 3)} ${String(slot.hour).padStart(2, '0')}:00 UTC`;
+            button.title = `Avg. engagement ${slot.score}% (based on ${data.based_on_posts} posts)`;
+            button.addEventListener('click', () => { scheduleInput.value = value; });
+            container.appendChild(button);
+        });
+        container.classList.remove('hidden');
+    } catch (error) {
+        console.log('Best times unavailable:', error);
+    }
+}
+
+function setDashboardStats(stats) {
+    ['total', 'successful', 'failed', 'pending'].forEach(name => {
+        const element = document.querySelector(`[data-stat="${name}"]`);
+        if (element) element.textContent = stats[name] || 0;
+    });
+}
+
+// Live post progress and dashboard counters pushed over server-sent events
+let liveEvents = null;
+function connectLiveEvents() {
+    if (typeof EventSource === 'undefined' || liveEvents) return;
+
+    // Reconnects automatically; the server resends the full counters on every connect
+    liveEvents = new EventSource('/api/events');
+    liveEvents.addEventListener('stats', event => setDashboardStats(JSON.parse(event.data)));
+    liveEvents.addEventListener('stats.delta', event => {
+        Object.entries(JSON.parse(event.data)).forEach(([name, change]) => {
+            const element = document.querySelector(`[data-stat="${name}"]`);
+            if (element) element.textContent = (parseInt(element.textContent, 10) || 0) + change;
+        });
+    });
+    liveEvents.addEventListener('post.progress', event => {
+        const progress = JSON.parse(event.data);
+        const submitBtn = document.getElementById('submitBtn');
+        const submitText = document.getElementById('submitText');
+        if (submitBtn && submitBtn.disabled && submitText) {
+            submitText.textContent = `${t('posting')} ${progress.done}/${progress.total}`;
+        }
+        if (!progress.success) {
+            const destination = progress.account ? `${progress.platform} (${progress.account})` : progress.platform;
+            showToast(`${destination}: ${progress.message}`, 'error');
+        }
+    });
+}
+
 // Function to update dashboard stats without page reload
 async function updateDashboardStats() {
+    // Counters are already kept current by the live event stream
+    if (liveEvents && liveEvents.readyState === EventSource.OPEN) return;
     try {
         const response = await fetch("/dashboard-stats");
         if (response.ok) {
-            const stats = await response.json();
-            
-            // Update stats counters
-            const totalPostsEl = document.querySelector("[data-stat=\"total\"]");
-            const successfulPostsEl = document.querySelector("[data-stat=\"successful\"]");
-            const failedPostsEl = document.querySelector("[data-stat=\"failed\"]");
-            const pendingPostsEl = document.querySelector("[data-stat=\"pending\"]");
-            
-            if (totalPostsEl) totalPostsEl.textContent = stats.total || 0;
-            if (successfulPostsEl) successfulPostsEl.textContent = stats.successful || 0;
-            if (failedPostsEl) failedPostsEl.textContent = stats.failed || 0;
-            if (pendingPostsEl) pendingPostsEl.textContent = stats.pending || 0;
+            setDashboardStats(await response.json());
         }
     } catch (error) {
         console.log("Stats update failed, will update on next page load");
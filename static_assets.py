@@ -0,0 +1,82 @@
+import json
+import os
+from mimetypes import guess_type
+from typing import Dict
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+
+from compression import accepted_encodings
+
+STATIC_DIR = "static"
+DIST_DIR = "dist"
+MANIFEST_PATH = os.path.join(STATIC_DIR, DIST_DIR, "manifest.json")
+ASSET_CACHE_MAX_AGE = int(os.getenv("ASSET_CACHE_MAX_AGE", str(365 * 24 * 3600)))
+
+# Precompressed siblings written by build_assets.py, in order of preference
+PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+
+_manifest: Dict[str, str] = {}
+_manifest_mtime = None
+
+def manifest() -> Dict[str, str]:
+    """Source name -> hashed path under static/, reloaded when a build replaces it"""
+    global _manifest, _manifest_mtime
+    try:
+        mtime = os.stat(MANIFEST_PATH).st_mtime
+    except OSError:
+        _manifest, _manifest_mtime = {}, None
+        return _manifest
+    if mtime != _manifest_mtime:
+        with open(MANIFEST_PATH) as f:
+            _manifest = json.load(f)
+        _manifest_mtime = mtime
+    return _manifest
+
+def asset_url(name: str) -> str:
+    """URL of a static asset: the built, hashed file when there is one"""
+    return f"/static/{manifest().get(name, name)}"
+
+def asset_built(name: str) -> bool:
+    return name in manifest()
+
+class StaticAssets(StaticFiles):
+    """StaticFiles that serves the build output immutably and precompressed
+
+    Hashed files under static/dist/ are cached for a year and served from
+    their .br/.gz sibling when the client accepts it. Unhashed files are
+    revalidated on every use, so an edit is picked up without a build.
+    """
+
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200) -> Response:
+        request_headers = Headers(scope=scope)
+        relative = os.path.relpath(full_path, self.directory).replace(os.sep, "/")
+        if not relative.startswith(DIST_DIR + "/") or relative.endswith("manifest.json"):
+            response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+            response.headers["cache-control"] = "no-cache"
+        else:
+            response = self._precompressed(full_path, request_headers, status_code) or \
+                FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+            response.headers["cache-control"] = f"public, max-age={ASSET_CACHE_MAX_AGE}, immutable"
+            response.headers["vary"] = "Accept-Encoding"
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    def _precompressed(self, full_path, request_headers: Headers, status_code: int):
+        accepted = accepted_encodings(request_headers.get("accept-encoding", ""))
+        # Highest q first; brotli wins ties, as in CompressionMiddleware
+        for coding, suffix in sorted(PRECOMPRESSED, key=lambda item: -accepted.get(item[0], 0)):
+            if coding in accepted:
+                try:
+                    stat_result = os.stat(f"{full_path}{suffix}")
+                except OSError:
+                    continue
+                response = FileResponse(
+                    f"{full_path}{suffix}", status_code=status_code, stat_result=stat_result,
+                    media_type=guess_type(str(full_path))[0]
+                )
+                response.headers["content-encoding"] = coding
+                return response
+        return None
@@ -0,0 +1,21 @@
+// Keep in sync with the CDN fallback config in templates/_tailwind.html
+module.exports = {
+    content: ['./templates/**/*.html', './static/script.js'],
+    darkMode: 'class',
+    theme: {
+        extend: {
+            colors: {
+                primary: {
+                    50: '#f0f9ff',
+                    500: '#3b82f6',
+                    600: '#2563eb',
+                    700: '#1d4ed8',
+                }
+            },
+            fontFamily: {
+                'sans': ['Inter', 'system-ui', 'sans-serif'],
+                'arabic': ['Noto Sans Arabic', 'sans-serif']
+            }
+        }
+    }
+}
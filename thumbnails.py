@@ -0,0 +1,91 @@
+import asyncio
+import logging
+import os
+from typing import Optional
+
+from database import SessionLocal
+from media_pipeline import media_pipeline
+from models import PostLog
+
+THUMBNAIL_BACKFILL_BATCH = int(os.getenv("THUMBNAIL_BACKFILL_BATCH", "50"))
+
+logger = logging.getLogger("thumbnails")
+
+class ThumbnailGenerator:
+    """Builds media previews for the logs and analytics views in the background
+
+    New uploads are queued from the post route; posts created before
+    thumbnails existed are backfilled once at startup. A missing thumbnail
+    just means the views fall back to an icon.
+    """
+
+    def __init__(self, batch_size: int = THUMBNAIL_BACKFILL_BATCH):
+        self.batch_size = batch_size
+        self._task = None
+        self._scheduled = set()
+
+    def start(self):
+        if self._task is None and media_pipeline.available:
+            self._task = asyncio.create_task(self._backfill())
+
+    async def stop(self):
+        tasks = list(self._scheduled) + ([self._task] if self._task else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+
+    def schedule(self, post_id: int, file_path: Optional[str], file_type: Optional[str]):
+        """Generate a post's thumbnail without holding up the request"""
+        if not file_path or not media_pipeline.available:
+            return
+        task = asyncio.create_task(self.generate(post_id, file_path, file_type))
+        # Keep a reference so the task isn't garbage collected mid-flight
+        self._scheduled.add(task)
+        task.add_done_callback(self._scheduled.discard)
+
+    async def generate(self, post_id: int, file_path: str, file_type: str) -> Optional[str]:
+        if not os.path.exists(file_path):
+            return None
+        thumbnail = await media_pipeline.thumbnail(file_path, file_type)
+        if not thumbnail:
+            return None
+        db = SessionLocal()
+        try:
+            db.query(PostLog).filter(PostLog.id == post_id).update({PostLog.thumbnail_path: thumbnail})
+            db.commit()
+        except Exception as e:
+            logger.warning("Saving thumbnail of post %s failed: %s", post_id, e)
+            db.rollback()
+            return None
+        finally:
+            db.close()
+        return thumbnail
+
+    async def _backfill(self):
+        last_id = 0
+        created = 0
+        while True:
+            db = SessionLocal()
+            try:
+                rows = db.query(PostLog.id, PostLog.file_path, PostLog.file_type).filter(
+                    PostLog.id > last_id,
+                    PostLog.file_path.isnot(None),
+                    PostLog.thumbnail_path.is_(None)
+                ).order_by(PostLog.id).limit(self.batch_size).all()
+            except Exception as e:
+                logger.warning("Thumbnail backfill query failed: %s", e)
+                return
+            finally:
+                db.close()
+            if not rows:
+                break
+            last_id = rows[-1].id
+            results = await asyncio.gather(
+                *(self.generate(row.id, row.file_path, row.file_type) for row in rows), return_exceptions=True
+            )
+            created += sum(1 for result in results if isinstance(result, str))
+        if created:
+            logger.info("Generated %d missing thumbnails", created)
+
+thumbnail_generator = ThumbnailGenerator()
@@ -0,0 +1,262 @@
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional
+
+import requests
+from sqlalchemy import event
+
+# Fraction of requests traced; the rest only pay for one random() call
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "0.01"))
+# none, otlp (OTLP/HTTP JSON to a collector) or memory (kept for the Chrome trace dump only)
+TRACE_EXPORTER = os.getenv("TRACE_EXPORTER", "memory")
+OTLP_ENDPOINT = os.getenv("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT", "http://localhost:4318/v1/traces")
+TRACE_SERVICE_NAME = os.getenv("OTEL_SERVICE_NAME", "social-media-dashboard")
+RECENT_TRACES = int(os.getenv("TRACE_RECENT_LIMIT", "200"))
+OTLP_FLUSH_SECONDS = 5.0
+OTLP_BATCH_SIZE = 512
+
+logger = logging.getLogger("tracing")
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+class Span:
+    __slots__ = ("trace", "name", "span_id", "parent_id", "start_ns", "end_ns", "attributes", "error")
+
+    def __init__(self, trace: "Trace", name: str, parent_id: Optional[str], attributes: dict):
+        self.trace = trace
+        self.name = name
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.attributes = attributes
+        self.error = None
+
+    def set_attribute(self, key: str, value):
+        self.attributes[key] = value
+
+    def end(self):
+        self.end_ns = time.time_ns()
+        self.trace.spans.append(self)
+
+class Trace:
+    """The spans of one sampled request"""
+
+    def __init__(self, trace_id: Optional[str] = None):
+        self.trace_id = trace_id or os.urandom(16).hex()
+        self.spans: List[Span] = []
+
+class Tracer:
+    def __init__(self, exporter: str = TRACE_EXPORTER):
+        self.exporter = exporter
+        self.recent = deque(maxlen=RECENT_TRACES)
+        self._queue: "queue.SimpleQueue[Trace]" = queue.SimpleQueue()
+        self._thread = None
+
+    def _finish(self, trace: Trace):
+        if self.exporter == "none":
+            return
+        self.recent.append(trace)
+        if self.exporter == "otlp":
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._export_loop, name="otlp-exporter", daemon=True)
+                self._thread.start()
+            self._queue.put(trace)
+
+    def _export_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + OTLP_FLUSH_SECONDS
+            while len(batch) < OTLP_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                requests.post(OTLP_ENDPOINT, json=otlp_payload(batch), timeout=5)
+            except Exception as e:
+                logger.warning("OTLP export failed: %s", e)
+
+    @contextmanager
+    def root_span(self, name: str, sampled: Optional[bool] = None, trace_id: Optional[str] = None, parent_id: Optional[str] = None, **attributes):
+        """Start a trace for a request if it is sampled"""
+        if sampled is None:
+            sampled = random.random() < TRACE_SAMPLE_RATE
+        if not sampled or self.exporter == "none":
+            yield None
+            return
+
+        trace = Trace(trace_id)
+        span = Span(trace, name, parent_id, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = repr(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+            self._finish(trace)
+
+tracer = Tracer()
+
+@contextmanager
+def start_span(name: str, **attributes):
+    """Child span of the current span; a no-op outside a sampled trace"""
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+
+    span = Span(parent.trace, name, parent.span_id, attributes)
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.error = repr(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        span.end()
+
+def current_trace_id() -> Optional[str]:
+    span = _current_span.get()
+    return span.trace.trace_id if span else None
+
+def _otlp_value(value) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+def otlp_payload(traces: List[Trace]) -> dict:
+    """OTLP/HTTP JSON encoding of finished traces"""
+    spans = []
+    for trace in traces:
+        for span in trace.spans:
+            encoded = {
+                "traceId": trace.trace_id,
+                "spanId": span.span_id,
+                "name": span.name,
+                "kind": 2 if span.parent_id is None else 1,
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns),
+                "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in span.attributes.items()],
+                "status": {"code": 2, "message": span.error} if span.error else {"code": 1}
+            }
+            if span.parent_id:
+                encoded["parentSpanId"] = span.parent_id
+            spans.append(encoded)
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": TRACE_SERVICE_NAME}}]},
+            "scopeSpans": [{"scope": {"name": "tracing"}, "spans": spans}]
+        }]
+    }
+
+def chrome_trace(traces: Optional[List[Trace]] = None) -> dict:
+    """Chrome trace event format (chrome://tracing, Perfetto) of recent traces"""
+    events = []
+    for index, trace in enumerate(list(tracer.recent) if traces is None else traces):
+        for span in trace.spans:
+            events.append({
+                "name": span.name,
+                "cat": "request",
+                "ph": "X",
+                "ts": span.start_ns / 1000,
+                "dur": (span.end_ns - span.start_ns) / 1000,
+                "pid": 1,
+                "tid": index,
+                "args": {**span.attributes, "trace_id": trace.trace_id, **({"error": span.error} if span.error else {})}
+            })
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+def dump_chrome_trace(path: str) -> int:
+    """Write the recent traces to a Chrome trace JSON file, returning the span count"""
+    payload = chrome_trace()
+    with open(path, "w") as f:
+        json.dump(payload, f)
+    return len(payload["traceEvents"])
+
+def instrument_sessions(session_class):
+    """Span around every commit of a SQLAlchemy session class"""
+
+    @event.listens_for(session_class, "before_commit")
+    def before_commit(session):
+        parent = _current_span.get()
+        if parent is not None:
+            session.info["commit_span"] = Span(parent.trace, "db.commit", parent.span_id, {})
+
+    @event.listens_for(session_class, "after_commit")
+    def after_commit(session):
+        span = session.info.pop("commit_span", None)
+        if span is not None:
+            span.end()
+
+    @event.listens_for(session_class, "after_rollback")
+    def after_rollback(session):
+        span = session.info.pop("commit_span", None)
+        if span is not None:
+            span.error = "rolled back"
+            span.end()
+
+def parse_traceparent(value: str):
+    """(trace_id, parent_id, sampled) from a W3C traceparent header, or None"""
+    parts = value.split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    return parts[1], parts[2], parts[3] == "01"
+
+class TracingMiddleware:
+    """Root span per sampled request, named after the matched route
+
+    Requests to `exclude_paths` (long-lived streams) are never traced.
+    """
+
+    def __init__(self, app, exclude_paths=()):
+        self.app = app
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        trace_id = parent_id = sampled = None
+        header = dict(scope["headers"]).get(b"traceparent")
+        parsed = parse_traceparent(header.decode("latin-1")) if header else None
+        if parsed:
+            trace_id, parent_id, sampled = parsed
+
+        with tracer.root_span("HTTP " + scope["method"], sampled, trace_id, parent_id, **{"http.target": scope["path"]}) as span:
+            if span is None:
+                await self.app(scope, receive, send)
+                return
+
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = getattr(scope.get("route"), "path", None)
+                if route:
+                    span.name = f"{scope['method']} {route}"
+                    span.set_attribute("http.route", route)